@@ -2,13 +2,14 @@ import os
 import cv2
 import time
 import threading
-from collections import deque
 
 import numpy as np
 from flask import Flask, render_template, Response, jsonify, request
 from cvzone.HandTrackingModule import HandDetector
 from tensorflow.keras.models import load_model
 
+from src.services.vote_counter import SlidingVoteCounter
+
 # ---------------- APP ----------------
 app = Flask(__name__)
 
@@ -35,7 +36,7 @@ sentence = ""
 current_letter = ""
 recommendations = []
 
-vote_queue = deque(maxlen=VOTE_QUEUE)
+vote_queue = SlidingVoteCounter(VOTE_QUEUE)
 
 last_added = ""
 last_added_time = 0
@@ -160,7 +161,7 @@ def generate_frames():
                 vote_queue.append(pred_letter)
 
             if vote_queue:
-                current_letter = max(set(vote_queue), key=vote_queue.count)
+                current_letter = vote_queue.leader
 
                 if current_letter != stable_letter:
                     stable_letter = current_letter
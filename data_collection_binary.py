@@ -1,10 +1,10 @@
 import cv2
-from cvzone.HandTrackingModule import HandDetector
 from cvzone.ClassificationModule import Classifier
 import numpy as np
 import os, os.path
 from keras.models import load_model
 import traceback
+from src.services.landmark_extractor import LandmarkExtractor
 
 
 
@@ -12,8 +12,7 @@ import traceback
 
 capture = cv2.VideoCapture(0)
 
-hd = HandDetector(maxHands=1)
-hd2 = HandDetector(maxHands=1)
+extractor = LandmarkExtractor(max_hands=1)
 # #training data
 # count = len(os.listdir("D://sign2text_dataset_2.0/Binary_imgs//A"))
 
@@ -37,13 +36,12 @@ while True:
     try:
         _, frame = capture.read()
         frame = cv2.flip(frame, 1)
-        hands= hd.findHands(frame, draw=False, flipType=True)
+        # One detector call per frame, shared by the binary/gray crops and the skeleton drawing
+        extracted = extractor.extract(frame, offset)
         img_final=img_final1=img_final2=0
 
-        if hands:
-            hand = hands[0]
-            x, y, w, h = hand['bbox']
-            image = frame[y - offset:y + h + offset, x - offset:x + w + offset]
+        if extracted:
+            image = extracted['crop']
             #image1 = imgg[y - offset:y + h + offset, x - offset:x + w + offset]
 
 
@@ -80,61 +78,49 @@ while True:
 
 
 
-        hands = hd.findHands(frame, draw=False, flipType=True)
-
-        if hands:
-            # #print(" --------- lmlist=",hands[1])
-            hand = hands[0]
-            x, y, w, h = hand['bbox']
-            image = frame[y - offset:y + h + offset, x - offset:x + w + offset]
+        if extracted:
+            x, y, w, h = extracted['bbox']
             white = cv2.imread("C:\\Users\\devansh raval\\PycharmProjects\\pythonProject\\white.jpg")
             # img_final=img_final1=img_final2=0
-            handz = hd2.findHands(image, draw=False, flipType=True)
-            if handz:
-                hand = handz[0]
-                pts = hand['lmList']
-                # x1,y1,w1,h1=hand['bbox']
-
-                os = ((400 - w) // 2) - 15
-                os1 = ((400 - h) // 2) - 15
-                for t in range(0, 4, 1):
-                    cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
-                             (0, 255, 0), 3)
-                for t in range(5, 8, 1):
-                    cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
-                             (0, 255, 0), 3)
-                for t in range(9, 12, 1):
-                    cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
-                             (0, 255, 0), 3)
-                for t in range(13, 16, 1):
-                    cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
-                             (0, 255, 0), 3)
-                for t in range(17, 20, 1):
-                    cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
-                             (0, 255, 0), 3)
-                cv2.line(white, (pts[5][0] + os, pts[5][1] + os1), (pts[9][0] + os, pts[9][1] + os1), (0, 255, 0),
-                         3)
-                cv2.line(white, (pts[9][0] + os, pts[9][1] + os1), (pts[13][0] + os, pts[13][1] + os1), (0, 255, 0),
-                         3)
-                cv2.line(white, (pts[13][0] + os, pts[13][1] + os1), (pts[17][0] + os, pts[17][1] + os1),
+            pts = extracted['lmList']
+            # x1,y1,w1,h1=hand['bbox']
+
+            os = ((400 - w) // 2) - 15
+            os1 = ((400 - h) // 2) - 15
+            for t in range(0, 4, 1):
+                cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
+                         (0, 255, 0), 3)
+            for t in range(5, 8, 1):
+                cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
+                         (0, 255, 0), 3)
+            for t in range(9, 12, 1):
+                cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
+                         (0, 255, 0), 3)
+            for t in range(13, 16, 1):
+                cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
+                         (0, 255, 0), 3)
+            for t in range(17, 20, 1):
+                cv2.line(white, (pts[t][0] + os, pts[t][1] + os1), (pts[t + 1][0] + os, pts[t + 1][1] + os1),
                          (0, 255, 0), 3)
-                cv2.line(white, (pts[0][0] + os, pts[0][1] + os1), (pts[5][0] + os, pts[5][1] + os1), (0, 255, 0),
-                         3)
-                cv2.line(white, (pts[0][0] + os, pts[0][1] + os1), (pts[17][0] + os, pts[17][1] + os1), (0, 255, 0),
-                         3)
-
-                for i in range(21):
-                    cv2.circle(white, (pts[i][0] + os, pts[i][1] + os1), 2, (0, 0, 255), 1)
-
-                cv2.imshow("skeleton", white)
-                # cv2.imshow("5", skeleton5)
-            hands = hd.findHands(white, draw=False, flipType=True)
-            if hands:
-                hand = hands[0]
-                x, y, w, h = hand['bbox']
-                cv2.rectangle(white, (x - offset, y - offset), (x + w, y + h), (3, 255, 25), 3)
-
-            image1 = frame[y - offset:y + h + offset, x - offset:x + w + offset]
+            cv2.line(white, (pts[5][0] + os, pts[5][1] + os1), (pts[9][0] + os, pts[9][1] + os1), (0, 255, 0),
+                     3)
+            cv2.line(white, (pts[9][0] + os, pts[9][1] + os1), (pts[13][0] + os, pts[13][1] + os1), (0, 255, 0),
+                     3)
+            cv2.line(white, (pts[13][0] + os, pts[13][1] + os1), (pts[17][0] + os, pts[17][1] + os1),
+                     (0, 255, 0), 3)
+            cv2.line(white, (pts[0][0] + os, pts[0][1] + os1), (pts[5][0] + os, pts[5][1] + os1), (0, 255, 0),
+                     3)
+            cv2.line(white, (pts[0][0] + os, pts[0][1] + os1), (pts[17][0] + os, pts[17][1] + os1), (0, 255, 0),
+                     3)
+
+            for i in range(21):
+                cv2.circle(white, (pts[i][0] + os, pts[i][1] + os1), 2, (0, 0, 255), 1)
+
+            cv2.imshow("skeleton", white)
+            # cv2.imshow("5", skeleton5)
+            # The gray-with-drawing crop uses the frame's hand box; detecting again on the
+            # skeleton canvas only produced a box in canvas coordinates
+            image1 = extracted['crop']
 
             roi1 = image1   #rdb image with drawing
 
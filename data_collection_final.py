@@ -1,14 +1,13 @@
 import cv2
-from cvzone.HandTrackingModule import HandDetector
 import numpy as np
 import os as oss
 import traceback
+from src.services.landmark_extractor import LandmarkExtractor
 
 
 
 capture = cv2.VideoCapture(0)
-hd = HandDetector(maxHands=1)
-hd2 = HandDetector(maxHands=1)
+extractor = LandmarkExtractor(max_hands=1)
 
 count = len(oss.listdir("D:\\sign2text_dataset_3.0\\AtoZ_3.0\\A\\"))
 c_dir = 'A'
@@ -26,45 +25,40 @@ while True:
     try:
         _, frame = capture.read()
         frame = cv2.flip(frame, 1)
-        hands= hd.findHands(frame, draw=False, flipType=True)
+        # One detector call per frame: landmarks are shifted into the crop instead of detected again on it
+        extracted = extractor.extract(frame, offset)
         white = cv2.imread("C:\\Users\\devansh raval\\PycharmProjects\\pythonProject\\white.jpg")
 
-        if hands:
-            hand = hands[0]
-            x, y, w, h = hand['bbox']
-            image =np.array( frame[y - offset:y + h + offset, x - offset:x + w + offset])
-
-            handz,imz = hd2.findHands(image, draw=True, flipType=True)
-            if handz:
-                hand = handz[0]
-                pts = hand['lmList']
-                # x1,y1,w1,h1=hand['bbox']
-                os=((400-w)//2)-15
-                os1=((400-h)//2)-15
-                for t in range(0,4,1):
-                    cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
-                for t in range(5,8,1):
-                    cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
-                for t in range(9,12,1):
-                    cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
-                for t in range(13,16,1):
-                    cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
-                for t in range(17,20,1):
-                    cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
-                cv2.line(white, (pts[5][0]+os, pts[5][1]+os1), (pts[9][0]+os, pts[9][1]+os1), (0, 255, 0), 3)
-                cv2.line(white, (pts[9][0]+os, pts[9][1]+os1), (pts[13][0]+os, pts[13][1]+os1), (0, 255, 0), 3)
-                cv2.line(white, (pts[13][0]+os, pts[13][1]+os1), (pts[17][0]+os, pts[17][1]+os1), (0, 255, 0), 3)
-                cv2.line(white, (pts[0][0]+os, pts[0][1]+os1), (pts[5][0]+os, pts[5][1]+os1), (0, 255, 0), 3)
-                cv2.line(white, (pts[0][0]+os, pts[0][1]+os1), (pts[17][0]+os, pts[17][1]+os1), (0, 255, 0), 3)
-
-                skeleton0=np.array(white)
-                zz=np.array(white)
-                for i in range(21):
-                    cv2.circle(white,(pts[i][0]+os,pts[i][1]+os1),2,(0 , 0 , 255),1)
-
-                skeleton1=np.array(white)
-
-                cv2.imshow("1",skeleton1)
+        if extracted:
+            x, y, w, h = extracted['bbox']
+            pts = extracted['lmList']
+            # x1,y1,w1,h1=hand['bbox']
+            os=((400-w)//2)-15
+            os1=((400-h)//2)-15
+            for t in range(0,4,1):
+                cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
+            for t in range(5,8,1):
+                cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
+            for t in range(9,12,1):
+                cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
+            for t in range(13,16,1):
+                cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
+            for t in range(17,20,1):
+                cv2.line(white,(pts[t][0]+os,pts[t][1]+os1),(pts[t+1][0]+os,pts[t+1][1]+os1),(0,255,0),3)
+            cv2.line(white, (pts[5][0]+os, pts[5][1]+os1), (pts[9][0]+os, pts[9][1]+os1), (0, 255, 0), 3)
+            cv2.line(white, (pts[9][0]+os, pts[9][1]+os1), (pts[13][0]+os, pts[13][1]+os1), (0, 255, 0), 3)
+            cv2.line(white, (pts[13][0]+os, pts[13][1]+os1), (pts[17][0]+os, pts[17][1]+os1), (0, 255, 0), 3)
+            cv2.line(white, (pts[0][0]+os, pts[0][1]+os1), (pts[5][0]+os, pts[5][1]+os1), (0, 255, 0), 3)
+            cv2.line(white, (pts[0][0]+os, pts[0][1]+os1), (pts[17][0]+os, pts[17][1]+os1), (0, 255, 0), 3)
+
+            skeleton0=np.array(white)
+            zz=np.array(white)
+            for i in range(21):
+                cv2.circle(white,(pts[i][0]+os,pts[i][1]+os1),2,(0 , 0 , 255),1)
+
+            skeleton1=np.array(white)
+
+            cv2.imshow("1",skeleton1)
 
         frame = cv2.putText(frame, "dir=" + str(c_dir) + "  count=" + str(count), (50,50),
                             cv2.FONT_HERSHEY_SIMPLEX,
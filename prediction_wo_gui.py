@@ -2,13 +2,14 @@ import os
 import math
 import time
 import traceback
-from collections import deque
 
 import cv2
 import numpy as np
 from cvzone.HandTrackingModule import HandDetector
 from tensorflow.keras.models import load_model
 
+from src.services.vote_counter import SlidingVoteCounter
+
 # ---------------- CONFIG ----------------
 # UPDATE THIS PATH TO YOUR MODEL
 MODEL_PATH = r"E:\\primary\\Desktop\\Sign-Language-To-Text-and-Speech-Conversion-master\\sign_language_AZ_CNN.h5"
@@ -39,7 +40,7 @@ cap = cv2.VideoCapture(CAMERA_ID)
 hd = HandDetector(maxHands=1, detectionCon=0.7)
 
 # State Variables
-vote_queue = deque(maxlen=VOTE_QUEUE)
+vote_queue = SlidingVoteCounter(VOTE_QUEUE)
 sentence = ""
 last_added = None
 last_added_time = 0
@@ -148,7 +149,7 @@ while True:
                 print("Prediction Error:", e)
 
         if vote_queue:
-            display_char = max(set(vote_queue), key=vote_queue.count)
+            display_char = vote_queue.leader
             
             # Sentence Logic
             now = time.time()
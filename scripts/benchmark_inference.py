@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for SignLanguageModel inference modes.
+
+Measures per-frame latency of the Keras predict() path against the direct
+call and traced tf.function paths on the same model and input.
+
+Usage:
+    python scripts/benchmark_inference.py --model sign_language_AZ_CNN.h5 --runs 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.sign_model import SignLanguageModel, INFERENCE_MODES
+
+def benchmark_mode(model_path, mode, runs, batch_size):
+    """Time single-frame predictions for one inference mode."""
+    model = SignLanguageModel(model_path, inference_mode=mode, warmup=True)
+    shape = (batch_size,) + tuple(model.input_shape[1:])
+    batch = np.random.rand(*shape).astype(np.float32)
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        model.predict_batch(batch)
+        timings.append(time.perf_counter() - started)
+
+    timings = np.array(timings) * 1000
+    return {
+        "mode": mode,
+        "mean_ms": timings.mean(),
+        "p50_ms": np.percentile(timings, 50),
+        "p95_ms": np.percentile(timings, 95),
+        "fps": 1000.0 / timings.mean() * batch_size
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sign model inference modes")
+    parser.add_argument("--model", default="sign_language_AZ_CNN.h5", help="Path to the .h5 model")
+    parser.add_argument("--runs", type=int, default=300, help="Timed iterations per mode")
+    parser.add_argument("--batch-size", type=int, default=1, help="Frames per forward pass")
+    parser.add_argument("--modes", nargs="+", default=list(INFERENCE_MODES),
+                        choices=INFERENCE_MODES, help="Modes to compare")
+    args = parser.parse_args()
+
+    results = [benchmark_mode(args.model, mode, args.runs, args.batch_size) for mode in args.modes]
+    baseline = next((r for r in results if r["mode"] == "predict"), results[0])
+
+    print(f"\n{'mode':<10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'frames/s':>10} {'speedup':>8}")
+    for r in results:
+        speedup = baseline["mean_ms"] / r["mean_ms"]
+        print(f"{r['mode']:<10} {r['mean_ms']:>9.3f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} "
+              f"{r['fps']:>10.1f} {speedup:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Frames per second of double vs single hand detection in the desktop scripts.
+
+Reads frames from a recorded video (or a camera index) and runs, on the
+same frames:
+
+- double: the original final_pred.py / data_collection path, detecting
+  on the mirrored frame, cropping around the box with the script offset
+  and detecting again on the crop for crop-relative landmarks.
+- single: LandmarkExtractor, one detection per frame with the landmarks
+  shifted into crop coordinates.
+
+Reports detector calls per frame, frames per second and the mean distance
+in pixels between the crop landmarks of both paths on frames where both
+found a hand.
+
+Usage:
+    python scripts/benchmark_landmark_extraction.py signing.mp4 --frames 300 --offset 29
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.landmark_extractor import LandmarkExtractor
+
+def read_frames(source, count):
+    """Read up to count mirrored frames from a video file or camera index."""
+    capture = cv2.VideoCapture(int(source) if source.isdigit() else source)
+    frames = []
+    while len(frames) < count:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(cv2.flip(frame, 1))
+    capture.release()
+    return frames
+
+def run_double(frames, offset):
+    """Detect on the frame, then again on the crop around the hand."""
+    frame_extractor = LandmarkExtractor(max_hands=1)
+    crop_extractor = LandmarkExtractor(max_hands=1)
+    results = []
+    started = time.perf_counter()
+    for frame in frames:
+        landmarks = None
+        hands = frame_extractor.detect(frame)
+        if hands:
+            x, y, w, h = hands[0]['bbox']
+            crop = frame[max(0, y - offset):y + h + offset, max(0, x - offset):x + w + offset]
+            if crop.size:
+                crop_hands = crop_extractor.detect(crop)
+                if crop_hands:
+                    landmarks = crop_hands[0]['lmList']
+        results.append(landmarks)
+    elapsed = time.perf_counter() - started
+    return elapsed, frame_extractor.detector_calls + crop_extractor.detector_calls, results
+
+def run_single(frames, offset):
+    """One detection per frame, landmarks mapped into the crop."""
+    extractor = LandmarkExtractor(max_hands=1)
+    results = []
+    started = time.perf_counter()
+    for frame in frames:
+        extracted = extractor.extract(frame, offset)
+        results.append(extracted['lmList'] if extracted else None)
+    elapsed = time.perf_counter() - started
+    return elapsed, extractor.detector_calls, results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass landmark extraction")
+    parser.add_argument("source", help="Video file or camera index")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--offset", type=int, default=29, help="Crop padding used by the script (final_pred.py: 29)")
+    args = parser.parse_args()
+    
+    frames = read_frames(args.source, args.frames)
+    if not frames:
+        print(f"No frames read from {args.source}")
+        return
+    
+    double_time, double_calls, double_landmarks = run_double(frames, args.offset)
+    single_time, single_calls, single_landmarks = run_single(frames, args.offset)
+    
+    # Both paths in crop coordinates; the second detection differs only by detector noise
+    distances = []
+    for a, b in zip(double_landmarks, single_landmarks):
+        if a is not None and b is not None:
+            distances.append(np.linalg.norm(np.asarray(a)[:, :2] - np.asarray(b)[:, :2], axis=1).mean())
+    
+    print(f"\nFrames: {len(frames)}  hands found: double {sum(l is not None for l in double_landmarks)}, "
+          f"single {sum(l is not None for l in single_landmarks)}")
+    print(f"{'path':<10}{'calls/frame':>12}{'fps':>10}")
+    print(f"{'double':<10}{double_calls / len(frames):>12.2f}{len(frames) / double_time:>10.1f}")
+    print(f"{'single':<10}{single_calls / len(frames):>12.2f}{len(frames) / single_time:>10.1f}")
+    if distances:
+        print(f"Mean landmark distance between paths: {np.mean(distances):.2f} px")
+
+if __name__ == "__main__":
+    main()
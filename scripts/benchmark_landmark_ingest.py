@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Server cost per signer of landmark batches vs JPEG frames.
+
+Runs a signer's frames through the server side of both ingestion paths on
+one thread and reports bytes sent per frame, server milliseconds per
+frame and how many signers at --fps one core can keep up with:
+
+- landmarks: /landmarks batches of --batch records, decoded, rendered
+  to the model input and predicted with the prediction scheduler, then
+  voted by a session.
+- frames: /ws/frames JPEGs, decoded, run through hand detection and the
+  same recognition. Needs --video (the client's camera frames) and
+  cvzone; without them only the landmark path is measured.
+
+Landmarks come from --landmarks (an npz with a "landmarks" array of
+recorded hands, played back in order) or from a synthetic signer that
+holds a pose for about a second and then moves to the next.
+
+Usage:
+    python scripts/benchmark_landmark_ingest.py --model sign_language_AZ_CNN.h5 \\
+        --landmarks landmarks_test.npz --video signing.mp4
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import CANVAS_SIZE, MODEL_INPUT_SIZE, PREDICT_EVERY
+from src.models.sign_model import SignLanguageModel
+from src.services.frame_recognizer import FrameRecognizer
+from src.services.landmark_ingest import LandmarkStream, encode_landmark_batch
+from src.services.letter_stabilizer import LetterStabilizer
+from src.services.prediction_scheduler import PredictionScheduler
+from src.services.session_store import RecognitionSession
+from src.services.skeleton_renderer import SkeletonRenderer
+
+def synthetic_landmarks(count, seed=0):
+    """A hand holding a pose for ~30 frames with tremor, then moving to a new pose."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    pose = rng.uniform(-60, 60, (21, 2))
+    center = np.array([320.0, 240.0])
+    for i in range(count):
+        if i % 30 == 0:
+            target = rng.uniform(-60, 60, (21, 2))
+        if i % 30 < 8:
+            # Transition to the next pose
+            pose += (target - pose) * 0.4
+        points = center + pose + rng.normal(0, 0.6, (21, 2))
+        frames.append(np.column_stack([points, np.zeros(21)]).astype(int))
+    return frames
+
+def recorded_landmarks(path, count):
+    """Recorded hands played back in order, repeated up to count frames."""
+    with np.load(path) as data:
+        hands = [np.asarray(landmarks)[:, :3].astype(int) for landmarks in data["landmarks"]]
+    return [hands[i % len(hands)] for i in range(count)]
+
+def new_session():
+    """A session voting with the default letter stabilizer."""
+    return RecognitionSession("benchmark", LetterStabilizer())
+
+def new_recognizer(model, hand_detector=None):
+    """Per-stream recognition with the fixed PREDICT_EVERY cadence of the live pipeline."""
+    return FrameRecognizer(
+        hand_detector,
+        model,
+        PredictionScheduler(PREDICT_EVERY, adaptive=False, cpu_budget=1.0),
+        canvas_size=CANVAS_SIZE,
+        model_input_size=MODEL_INPUT_SIZE,
+        hand_encoder=SkeletonRenderer(CANVAS_SIZE, MODEL_INPUT_SIZE).render
+    )
+
+def run_landmarks(model, landmarks, batch_size):
+    """Server time and message bytes for the landmark path."""
+    messages = []
+    for start in range(0, len(landmarks), batch_size):
+        records = [(int((start + i) * 33.3), points) for i, points in enumerate(landmarks[start:start + batch_size])]
+        messages.append(encode_landmark_batch(records))
+    
+    stream = LandmarkStream(new_recognizer(model), max_records=batch_size)
+    session = new_session()
+    started = time.perf_counter()
+    for message in messages:
+        for event in stream.process(message):
+            session.observe(event)
+    elapsed = time.perf_counter() - started
+    return elapsed, sum(len(message) for message in messages)
+
+def run_frames(model, video, count, quality):
+    """Server time and message bytes for the JPEG frame path."""
+    from src.services.hand_detector import HandDetectionService
+    
+    capture = cv2.VideoCapture(video)
+    messages = []
+    while len(messages) < count:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        ok, buffer = cv2.imencode('.jpg', cv2.flip(frame, 1), [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        messages.append(buffer.tobytes())
+    capture.release()
+    
+    recognizer = new_recognizer(model, HandDetectionService(max_hands=1))
+    session = new_session()
+    started = time.perf_counter()
+    for seq, message in enumerate(messages):
+        frame = cv2.imdecode(np.frombuffer(message, dtype=np.uint8), cv2.IMREAD_COLOR)
+        _, event = recognizer.recognize(frame, seq)
+        session.observe(event)
+    elapsed = time.perf_counter() - started
+    return elapsed, sum(len(message) for message in messages), len(messages)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark landmark batches against JPEG frames")
+    parser.add_argument("--model", default="sign_language_AZ_CNN.h5")
+    parser.add_argument("--landmarks", help="npz with recorded landmarks (default: synthetic signer)")
+    parser.add_argument("--video", help="Video of a signer for the frame path")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--batch", type=int, default=4, help="Records per landmark batch")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--jpeg-quality", type=int, default=70)
+    args = parser.parse_args()
+    
+    model = SignLanguageModel(args.model)
+    if args.landmarks:
+        landmarks = recorded_landmarks(args.landmarks, args.frames)
+    else:
+        landmarks = synthetic_landmarks(args.frames)
+    
+    elapsed, sent = run_landmarks(model, landmarks, args.batch)
+    rows = [("landmarks", sent / len(landmarks), elapsed / len(landmarks))]
+    
+    if args.video:
+        try:
+            elapsed, sent, count = run_frames(model, args.video, args.frames, args.jpeg_quality)
+            rows.append(("frames", sent / count, elapsed / count))
+        except ImportError as e:
+            print(f"Frame path skipped: {e}")
+    
+    print(f"\n{len(landmarks)} frames, {args.batch} landmark records per batch, {args.fps:g} fps per signer")
+    print(f"{'path':<16}{'bytes/frame':>12}{'server ms/frame':>17}{'signers/core':>14}")
+    for name, size, seconds in rows:
+        print(f"{name:<16}{size:>12.0f}{seconds * 1000:>17.3f}{1.0 / (seconds * args.fps):>14.1f}")
+
+if __name__ == "__main__":
+    main()
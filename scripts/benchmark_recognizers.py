@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Compare the CNN and landmark recognizers on recorded hands.
+
+For every labelled hand in a landmark dataset, runs the CNN path (skeleton
+canvas, resize, CNN) and the landmark path (invariant features, MLP) one
+hand at a time, as the live pipeline does, and reports hands per second
+and top-1 accuracy for each. Hand detection is excluded since both paths
+share it.
+
+Usage:
+    python scripts/benchmark_recognizers.py landmarks_test.npz \\
+        --cnn-model sign_language_AZ_CNN.h5 --landmark-model landmark_mlp.npz
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import CANVAS_SIZE, MODEL_INPUT_SIZE
+
+def to_hand_info(landmarks):
+    """Build a cvzone-style hand dict from an array of landmarks."""
+    points = np.asarray(landmarks)[:, :2].astype(int)
+    x, y = points.min(axis=0)
+    w, h = points.max(axis=0) - points.min(axis=0)
+    return {
+        "bbox": (int(x), int(y), int(w), int(h)),
+        "lmList": [[int(px), int(py), 0] for px, py in points]
+    }
+
+def cnn_encoder(fast_render):
+    """Build the hand -> CNN input function used by the live pipeline."""
+    if fast_render:
+        from src.services.skeleton_renderer import SkeletonRenderer
+        return SkeletonRenderer(CANVAS_SIZE, MODEL_INPUT_SIZE).render
+    
+    from src.services.hand_detector import HandDetectionService
+    
+    # The drawing code does not need the mediapipe detector itself
+    detector = HandDetectionService.__new__(HandDetectionService)
+    
+    def encode(hand):
+        canvas = detector.extract_hand_roi(None, hand, CANVAS_SIZE)
+        processed = cv2.resize(canvas, MODEL_INPUT_SIZE).astype("float32") / 255.0
+        return processed.reshape(1, MODEL_INPUT_SIZE[1], MODEL_INPUT_SIZE[0], 3)
+    
+    return encode
+
+def run(name, encode, model, hands, labels):
+    """Predict every hand one at a time and return throughput and accuracy."""
+    for hand in hands[:10]:
+        model.predict(encode(hand))
+    
+    correct = 0
+    started = time.perf_counter()
+    for hand, label in zip(hands, labels):
+        letter, _ = model.predict(encode(hand))
+        correct += letter == label
+    elapsed = time.perf_counter() - started
+    
+    return {
+        "recognizer": name,
+        "hands_per_sec": len(hands) / elapsed,
+        "ms_per_hand": elapsed / len(hands) * 1000,
+        "accuracy": correct / len(hands)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CNN vs landmark recognizers")
+    parser.add_argument("data", help=".npz with landmarks (N, 21, 2|3) and labels (N,)")
+    parser.add_argument("--cnn-model", help="CNN model (.h5/.tflite/.onnx)")
+    parser.add_argument("--landmark-model", help="Landmark MLP weights (.npz)")
+    parser.add_argument("--fast-render", action="store_true", help="Use the fast skeleton renderer for the CNN")
+    parser.add_argument("--inference-mode", default="function")
+    args = parser.parse_args()
+    
+    with np.load(args.data) as data:
+        hands = [to_hand_info(lm) for lm in data["landmarks"]]
+        labels = [str(label) for label in data["labels"]]
+    
+    results = []
+    if args.cnn_model:
+        from src.models.sign_model import SignLanguageModel
+        
+        model = SignLanguageModel(args.cnn_model, inference_mode=args.inference_mode)
+        name = "cnn (fast render)" if args.fast_render else "cnn"
+        results.append(run(name, cnn_encoder(args.fast_render), model, hands, labels))
+    
+    if args.landmark_model:
+        from src.models.landmark_classifier import LandmarkClassifier
+        
+        model = LandmarkClassifier(args.landmark_model)
+        results.append(run("landmark", model.encode, model, hands, labels))
+    
+    if not results:
+        parser.error("Give --cnn-model and/or --landmark-model")
+    
+    print(f"\nHands: {len(hands)}")
+    print(f"{'recognizer':<20}{'hands/s':>10}{'ms/hand':>10}{'accuracy':>10}")
+    for r in results:
+        print(f"{r['recognizer']:<20}{r['hands_per_sec']:>10.0f}{r['ms_per_hand']:>10.3f}{r['accuracy'] * 100:>9.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Per-keystroke latency of WordRecommender at different lexicon sizes.
+
+Builds synthetic lexicons with Zipf-distributed frequencies, then types
+sample words one letter at a time and times each get_recommendations
+call, comparing the prefix index against the original linear
+startswith scan.
+
+Usage:
+    python scripts/benchmark_recommender.py --sizes 1000 100000 1000000
+"""
+
+import argparse
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.word_dictionary import WordRecommender
+
+def synthetic_lexicon(size, seed=0):
+    """Random upper-case words of 2-12 letters with Zipf-like frequencies."""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(string.ascii_uppercase))
+    # Skew letter choice so prefixes share long ranges, like real text
+    letter_p = 1.0 / np.arange(1, 27)
+    letter_p /= letter_p.sum()
+    
+    words = set()
+    while len(words) < size:
+        length = rng.integers(2, 13)
+        words.add("".join(rng.choice(letters, size=length, p=letter_p)))
+    words = sorted(words)
+    rng.shuffle(words)
+    
+    weights = 1.0 / rng.permutation(np.arange(1, size + 1))
+    return words, weights
+
+def linear_scan(words, limit):
+    """The original recommender: startswith over the whole list."""
+    def recommend(current_word):
+        return [w for w in words if w.startswith(current_word) and w != current_word][:limit]
+    return recommend
+
+def time_keystrokes(recommend, queries, repeat):
+    """Mean and p99 latency of typing every query one letter at a time."""
+    timings = []
+    for _ in range(repeat):
+        for word in queries:
+            for end in range(1, len(word) + 1):
+                started = time.perf_counter()
+                recommend(word[:end])
+                timings.append(time.perf_counter() - started)
+    timings = np.array(timings) * 1e6
+    return timings.mean(), np.percentile(timings, 99)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark word recommendation latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--queries", type=int, default=50, help="Words typed per lexicon")
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--linear-max", type=int, default=100000,
+                        help="Skip the linear scan above this size")
+    args = parser.parse_args()
+    
+    print(f"{'entries':>10}{'build s':>10}{'index us':>12}{'index p99':>12}{'linear us':>12}{'linear p99':>12}")
+    for size in args.sizes:
+        words, weights = synthetic_lexicon(size)
+        queries = words[:args.queries]
+        
+        started = time.perf_counter()
+        recommender = WordRecommender(words, limit=args.limit, weights=weights)
+        build = time.perf_counter() - started
+        
+        index_mean, index_p99 = time_keystrokes(recommender.get_recommendations, queries, repeat=3)
+        
+        if size <= args.linear_max:
+            linear_mean, linear_p99 = time_keystrokes(linear_scan(words, args.limit), queries, repeat=1)
+            linear = f"{linear_mean:>12.1f}{linear_p99:>12.1f}"
+        else:
+            linear = f"{'-':>12}{'-':>12}"
+        
+        print(f"{size:>10}{build:>10.2f}{index_mean:>12.1f}{index_p99:>12.1f}{linear}")
+
+if __name__ == "__main__":
+    main()
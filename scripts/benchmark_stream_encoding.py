@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Server cost of the MJPEG stream per published frame.
+
+Publishes --frames camera frames (from --video or synthetic noise with a
+moving square) to --clients viewers and reports encode milliseconds per
+frame, JPEG copies per encode and bytes per frame sent:
+
+- single: the previous pipeline, encoding every frame once at full size
+  and STREAM_JPEG_QUALITY whether anyone watched or not, and
+  concatenating the multipart chunk (two copies of the JPEG). Every
+  viewer gets the full-size chunk.
+- tiers: the frame broadcaster, encoding once per STREAM_TIERS tier that
+  has viewers and sharing the chunk. Viewers are spread over the tiers.
+- idle: both paths with no viewers.
+
+Usage:
+    python scripts/benchmark_stream_encoding.py --clients 10 --video signing.mp4
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import STREAM_JPEG_QUALITY, STREAM_TIERS
+from src.services.frame_broadcaster import FrameBroadcaster, parse_stream_tiers
+
+def load_frames(video, count):
+    """Frames of a video, or synthetic 640x480 frames with a moving square."""
+    if video:
+        capture = cv2.VideoCapture(video)
+        frames = []
+        while len(frames) < count:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            frames.append(frame)
+        capture.release()
+        return frames
+    
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        frame = background.copy()
+        x = 40 + (i * 7) % 500
+        cv2.rectangle(frame, (x, 150), (x + 100, 300), (0, 255, 0), -1)
+        frames.append(frame)
+    return frames
+
+def run_single(frames, quality, clients):
+    """Encode every frame and build the chunk the way the pipeline used to."""
+    sent = 0
+    encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+    started = time.perf_counter()
+    for frame in frames:
+        ret, buffer = cv2.imencode('.jpg', frame, encode_params)
+        chunk = (b'--frame\r\n'
+                 b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
+        sent += len(chunk) * clients
+    return time.perf_counter() - started, sent
+
+def run_broadcaster(frames, tiers, clients):
+    """Publish through a broadcaster with clients spread over the tiers."""
+    broadcaster = FrameBroadcaster(tiers)
+    received = [0] * clients
+    
+    def viewer(index):
+        for chunk in broadcaster.subscribe(tiers[index % len(tiers)]):
+            received[index] += len(chunk)
+    
+    threads = [threading.Thread(target=viewer, args=(i,), daemon=True) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    # Wait until every viewer is registered before measuring
+    while broadcaster.stats["subscribers"] < clients:
+        time.sleep(0.01)
+    
+    started = time.perf_counter()
+    for frame in frames:
+        broadcaster.publish(frame)
+        # Give viewers a chance to pick up the chunk like a paced camera would
+        time.sleep(0)
+    elapsed = time.perf_counter() - started
+    
+    broadcaster.close()
+    for thread in threads:
+        thread.join(timeout=2)
+    encoded = sum(tier["frames_encoded"] for tier in broadcaster.stats["tiers"].values())
+    return elapsed, sum(received), encoded
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MJPEG stream encoding")
+    parser.add_argument("--video", help="Video to stream (default: synthetic frames)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--tiers", default=STREAM_TIERS, help="name:width:quality,...")
+    args = parser.parse_args()
+    
+    frames = load_frames(args.video, args.frames)
+    tiers = parse_stream_tiers(args.tiers, STREAM_JPEG_QUALITY)
+    
+    rows = []
+    elapsed, sent = run_single(frames, STREAM_JPEG_QUALITY, args.clients)
+    rows.append(("single", elapsed, len(frames), 2, sent))
+    
+    elapsed, sent, encoded = run_broadcaster(frames, tiers, args.clients)
+    rows.append(("tiers", elapsed, encoded, 1, sent))
+    
+    elapsed, sent = run_single(frames, STREAM_JPEG_QUALITY, 0)
+    rows.append(("single idle", elapsed, len(frames), 2, sent))
+    elapsed, sent, encoded = run_broadcaster(frames, tiers, 0)
+    rows.append(("tiers idle", elapsed, encoded, 1, sent))
+    
+    print(f"\n{len(frames)} frames, {args.clients} clients, tiers: "
+          + ", ".join(f"{tier.name} {f'{tier.width}px' if tier.width else 'source'} q{tier.quality}" for tier in tiers))
+    print(f"{'path':<12}{'server ms/frame':>17}{'encodes/frame':>15}{'copies/encode':>15}{'KB sent/frame':>15}")
+    for name, seconds, encodes, copies, sent in rows:
+        print(f"{name:<12}{seconds / len(frames) * 1000:>17.3f}{encodes / len(frames):>15.2f}"
+              f"{copies:>15}{sent / len(frames) / 1024:>15.1f}")
+
+if __name__ == "__main__":
+    main()
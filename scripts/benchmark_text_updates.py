@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Request rate and update latency of /get_text polling vs /events push.
+
+Serves the real Flask app on a local port with sessions, recommendations
+and the push channel set up (no camera or model), connects --clients
+browser-like clients and runs two phases per transport:
+
+- idle: nothing changes for --idle seconds.
+- active: every session's sentence changes --changes-per-second times a
+  second for --active seconds.
+
+poll clients fetch /get_text every 500 ms like the old page; push
+clients hold one /events connection. Reports HTTP requests per second
+and body bytes per second for each phase, and the delay from a text
+change to the client seeing it.
+
+Usage:
+    python scripts/benchmark_text_updates.py --clients 20 --idle 10 --active 20
+"""
+
+import argparse
+import http.cookiejar
+import json
+import logging
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+from werkzeug.serving import make_server
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.app as web
+from src.models.word_dictionary import WordRecommender
+from src.services.session_store import SessionStore
+from src.services.text_events import TextEventStream
+
+POLL_INTERVAL = 0.5
+
+class Client(threading.Thread):
+    def __init__(self, base_url, mode, change_times, stop):
+        """Initialize a client with its own session cookie."""
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.mode = mode
+        self.change_times = change_times
+        self.stop = stop
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        self.version = -1
+        self.latencies = []
+        self.body_bytes = 0
+        
+        # Create the session before the measurement starts
+        self.opener.open(f"{self.base_url}/get_text").read()
+    
+    def _seen(self, version):
+        """Record the delay of a newly seen version."""
+        if version > self.version:
+            changed_at = self.change_times.get(version)
+            if changed_at is not None:
+                self.latencies.append(time.time() - changed_at)
+            self.version = version
+    
+    def run(self):
+        """Poll or stream until stopped."""
+        if self.mode == "poll":
+            while not self.stop.is_set():
+                body = self.opener.open(f"{self.base_url}/get_text").read()
+                self.body_bytes += len(body)
+                self._seen(json.loads(body)["version"])
+                self.stop.wait(POLL_INTERVAL)
+            return
+        
+        with self.opener.open(f"{self.base_url}/events", timeout=5) as stream:
+            while not self.stop.is_set():
+                line = stream.readline()
+                if not line:
+                    break
+                self.body_bytes += len(line)
+                if line.startswith(b"data:"):
+                    self._seen(json.loads(line[5:])["version"])
+
+def run_phase(base_url, mode, clients, idle, active, rate):
+    """Measure one transport; returns per-phase request and byte rates and latencies."""
+    web.session_store = SessionStore(web.create_session, max_sessions=clients + 10)
+    web.text_events = TextEventStream(heartbeat_interval=1.0)
+    
+    change_times = {}
+    stop = threading.Event()
+    workers = [Client(base_url, mode, change_times, stop) for _ in range(clients)]
+    sessions = web.session_store.sessions()
+    
+    def counters():
+        stats = web.text_events.stats
+        return stats["polls_served"] + stats["connections_opened"], sum(w.body_bytes for w in workers)
+    
+    for worker in workers:
+        worker.start()
+    time.sleep(POLL_INTERVAL * 2)
+    
+    results = {}
+    requests_start, bytes_start = counters()
+    time.sleep(idle)
+    requests_end, bytes_end = counters()
+    results["idle"] = ((requests_end - requests_start) / idle, (bytes_end - bytes_start) / idle)
+    
+    # Every session changes in lockstep, so version v was published at change_times[v]
+    version = sessions[0].version
+    requests_start, bytes_start = counters()
+    started = time.time()
+    while time.time() - started < active:
+        version += 1
+        change_times[version] = time.time()
+        for recognition_session in sessions:
+            recognition_session.append_suggestion(f"WORD{version}")
+        time.sleep(1.0 / rate)
+    time.sleep(POLL_INTERVAL * 2)
+    requests_end, bytes_end = counters()
+    elapsed = time.time() - started
+    results["active"] = ((requests_end - requests_start) / elapsed, (bytes_end - bytes_start) / elapsed)
+    
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=3)
+    latencies = np.array([latency for worker in workers for latency in worker.latencies]) * 1000
+    return results, latencies, version
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text polling against server push")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--idle", type=float, default=10.0, help="Seconds without text changes")
+    parser.add_argument("--active", type=float, default=20.0, help="Seconds with text changes")
+    parser.add_argument("--changes-per-second", type=float, default=2.0)
+    args = parser.parse_args()
+    
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    web.word_recommender = WordRecommender(limit=5)
+    server = make_server("127.0.0.1", 0, web.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    
+    print(f"{args.clients} clients, {args.changes_per_second:g} changes/s while active\n")
+    print(f"{'mode':<6}{'idle req/s':>12}{'idle KB/s':>11}{'active req/s':>14}{'active KB/s':>13}"
+          f"{'mean ms':>10}{'p95 ms':>9}{'seen':>7}")
+    for mode in ("poll", "push"):
+        results, latencies, changes = run_phase(
+            base_url, mode, args.clients, args.idle, args.active, args.changes_per_second
+        )
+        seen = len(latencies) / max(1, changes * args.clients)
+        print(f"{mode:<6}{results['idle'][0]:>12.1f}{results['idle'][1] / 1024:>11.2f}"
+              f"{results['active'][0]:>14.1f}{results['active'][1] / 1024:>13.2f}"
+              f"{latencies.mean():>10.1f}{np.percentile(latencies, 95):>9.1f}{seen:>7.0%}")
+    
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
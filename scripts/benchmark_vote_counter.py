@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Per-frame cost of the letter vote at different window sizes.
+
+Feeds the same stream of noisy letter predictions to the original
+deque + max(set(q), key=q.count) vote and to SlidingVoteCounter, checks
+that both leaders hold the same number of votes, and reports the time
+per frame (append plus leader lookup).
+
+Usage:
+    python scripts/benchmark_vote_counter.py --windows 6 60 600 --frames 20000
+"""
+
+import argparse
+import string
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.vote_counter import SlidingVoteCounter
+
+def letter_stream(frames, seed=0):
+    """Letters held for a while each, with 30% of frames misread."""
+    rng = np.random.default_rng(seed)
+    letters = list(string.ascii_uppercase)
+    stream = []
+    while len(stream) < frames:
+        letter = letters[rng.integers(len(letters))]
+        for _ in range(rng.integers(10, 40)):
+            stream.append(letter if rng.random() > 0.3 else letters[rng.integers(len(letters))])
+    return stream[:frames]
+
+def run_deque(stream, window):
+    """Original vote: rebuild the set and count every letter each frame."""
+    queue = deque(maxlen=window)
+    leaders = []
+    started = time.perf_counter()
+    for letter in stream:
+        queue.append(letter)
+        leaders.append(max(set(queue), key=queue.count))
+    elapsed = time.perf_counter() - started
+    return elapsed, leaders
+
+def run_counter(stream, window):
+    """Incremental tally."""
+    counter = SlidingVoteCounter(window)
+    leaders = []
+    started = time.perf_counter()
+    for letter in stream:
+        counter.append(letter)
+        leaders.append(counter.leader)
+    elapsed = time.perf_counter() - started
+    return elapsed, leaders
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the letter vote")
+    parser.add_argument("--windows", type=int, nargs="+", default=[6, 60, 600])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+    
+    stream = letter_stream(args.frames)
+    
+    print(f"{'window':>8}{'deque us':>12}{'counter us':>12}{'speedup':>10}  leaders agree")
+    for window in args.windows:
+        deque_time, deque_leaders = run_deque(stream, window)
+        counter_time, counter_leaders = run_counter(stream, window)
+        
+        # Ties may pick different letters; compare the winning vote counts instead
+        agree = True
+        queue = deque(maxlen=window)
+        for letter, a, b in zip(stream, deque_leaders, counter_leaders):
+            queue.append(letter)
+            agree &= queue.count(a) == queue.count(b)
+        
+        print(f"{window:>8}{deque_time / len(stream) * 1e6:>12.2f}{counter_time / len(stream) * 1e6:>12.2f}"
+              f"{deque_time / counter_time:>9.1f}x  {'yes' if agree else 'NO'}")
+
+if __name__ == "__main__":
+    main()
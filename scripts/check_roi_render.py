@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Parity and speed check for the fast skeleton ROI renderer.
+
+Renders the same hand landmarks through the original path
+(HandDetectionService.extract_hand_roi at canvas size, then
+VideoProcessor-style resize and normalize) and through SkeletonRenderer,
+and reports pixel error, render time and, when a model is given, top-1
+agreement of the predictions. Exits non-zero when agreement falls below
+--min-agreement. tests/test_skeleton_renderer.py runs the same
+comparison in CI with a small model trained on the original renders.
+
+Landmarks come from a .npy array of shape (N, 21, 2|3) in frame pixel
+coordinates, or are synthesized around a template hand.
+
+Usage:
+    python scripts/check_roi_render.py --model sign_language_AZ_CNN.h5 --samples 500
+    python scripts/check_roi_render.py --landmarks recorded_hands.npy --model sign_language_AZ_CNN.h5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import CANVAS_SIZE, MODEL_INPUT_SIZE
+from src.services.hand_detector import HandDetectionService
+from src.services.skeleton_renderer import SkeletonRenderer
+
+# Open right hand, wrist at the origin, roughly 200px tall
+TEMPLATE_HAND = np.array([
+    [0, 0], [-30, -20], [-50, -45], [-65, -70], [-80, -90],
+    [-20, -80], [-25, -120], [-28, -145], [-30, -165],
+    [0, -85], [0, -130], [0, -158], [0, -180],
+    [18, -80], [22, -120], [25, -145], [27, -165],
+    [35, -70], [42, -100], [46, -120], [50, -138]
+], dtype=np.float64)
+
+def synthesize_landmarks(count, seed=0):
+    """Generate rotated, scaled and jittered copies of the template hand."""
+    rng = np.random.default_rng(seed)
+    hands = []
+    for _ in range(count):
+        angle = rng.uniform(-0.6, 0.6)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        jittered = TEMPLATE_HAND + rng.normal(0, 8, TEMPLATE_HAND.shape)
+        hands.append(jittered @ rotation.T * rng.uniform(0.7, 1.4) + [320, 300])
+    return np.array(hands)
+
+def to_hand_info(landmarks):
+    """Build a cvzone-style hand dict from an array of landmarks."""
+    points = np.asarray(landmarks)[:, :2].astype(int)
+    x, y = points.min(axis=0)
+    w, h = points.max(axis=0) - points.min(axis=0)
+    return {
+        "bbox": (int(x), int(y), int(w), int(h)),
+        "lmList": [[int(px), int(py), 0] for px, py in points]
+    }
+
+def render_reference(detector, hand, canvas_size, input_size):
+    """Render through the original full-size canvas path."""
+    canvas = detector.extract_hand_roi(None, hand, canvas_size)
+    processed = cv2.resize(canvas, input_size)
+    return (processed.astype("float32") / 255.0).reshape(1, input_size[1], input_size[0], 3)
+
+def time_per_call(fn, hands):
+    """Average wall time of fn over all hands in microseconds."""
+    started = time.perf_counter()
+    for hand in hands:
+        fn(hand)
+    return (time.perf_counter() - started) / len(hands) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the fast ROI renderer with the original path")
+    parser.add_argument("--landmarks", help=".npy array of shape (N, 21, 2|3)")
+    parser.add_argument("--samples", type=int, default=500, help="Synthesized hands when --landmarks is not given")
+    parser.add_argument("--model", help="Model to compare predictions with")
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    args = parser.parse_args()
+    
+    landmarks = np.load(args.landmarks) if args.landmarks else synthesize_landmarks(args.samples)
+    hands = [to_hand_info(lm) for lm in landmarks]
+    
+    # The original drawing code does not need the mediapipe detector itself
+    detector = HandDetectionService.__new__(HandDetectionService)
+    renderer = SkeletonRenderer(CANVAS_SIZE, MODEL_INPUT_SIZE)
+    
+    reference = np.concatenate([render_reference(detector, h, CANVAS_SIZE, MODEL_INPUT_SIZE) for h in hands])
+    fast = np.concatenate([renderer.render(h).copy() for h in hands])
+    
+    print(f"Hands: {len(hands)}")
+    print(f"Pixel MAE: {np.abs(reference - fast).mean():.4f}  max: {np.abs(reference - fast).max():.4f}")
+    print(f"Original path: {time_per_call(lambda h: render_reference(detector, h, CANVAS_SIZE, MODEL_INPUT_SIZE), hands):8.1f} us/hand")
+    print(f"Fast renderer: {time_per_call(renderer.render, hands):8.1f} us/hand")
+    
+    if args.model:
+        from src.models.sign_model import SignLanguageModel
+        
+        model = SignLanguageModel(args.model, warmup=False)
+        ref_probs = model.predict_batch(reference)
+        fast_probs = model.predict_batch(fast)
+        agreement = float((ref_probs.argmax(axis=1) == fast_probs.argmax(axis=1)).mean())
+        
+        print(f"Top-1 agreement: {agreement * 100:.2f}%  "
+              f"max probability diff: {np.abs(ref_probs - fast_probs).max():.4f}")
+        
+        if agreement < args.min_agreement:
+            print(f"FAILED: agreement below {args.min_agreement * 100:.1f}%")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
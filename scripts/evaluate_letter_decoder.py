@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compare the voting stabilizer with the beam letter decoder on simulated signing.
+
+Spells held-out words letter by letter with synthetic per-frame CNN
+probability vectors. Letters are mostly confused within their
+cnn8grps group (A/E/M/N/S/T, B/D/F/I/U/V/W/K/R, ...), as with the
+real model. Reports frames needed per letter and the character error
+rate of the final words for:
+
+- vote: the majority letter must stay unchanged for --stable-frames
+  predictions, like HAND_STABLE_TIME
+- beam: BeamLetterDecoder commits once its posterior reaches the
+  threshold, and falls back to the vote rule otherwise
+
+Timing rules are replaced by frame counts so runs are reproducible.
+
+Usage:
+    python scripts/evaluate_letter_decoder.py held_out.txt --ngram-model ngram_model --noise 1.0
+"""
+
+import argparse
+import string
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.letter_rules import CNN8_GROUPS
+from src.models.ngram_model import NGramModel, tokenize
+from src.services.letter_decoder import BeamLetterDecoder, LexiconLetterPrior
+
+LABELS = list(string.ascii_uppercase)
+
+def frame_probabilities(letter, rng, noise, group_margin=0.8, margin=3.0):
+    """Softmax of noisy logits favouring the letter, then its group mates."""
+    logits = np.zeros(len(LABELS))
+    group = next(g for g in CNN8_GROUPS if letter in g)
+    for mate in group:
+        logits[LABELS.index(mate)] = margin - group_margin
+    logits[LABELS.index(letter)] = margin
+    logits += rng.normal(0, noise, len(LABELS)) * np.where(logits > 0, 1.0, 0.3)
+    probabilities = np.exp(logits - logits.max())
+    return probabilities / probabilities.sum()
+
+def edit_distance(a, b):
+    """Levenshtein distance."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+def spell_vote(word, rng, args):
+    """Vote rule: commit when the majority letter is unchanged for stable_frames predictions."""
+    output, frames = "", 0
+    for letter in word:
+        votes, stable, last = [], 0, None
+        while True:
+            frames += 1
+            votes = (votes + [LABELS[int(np.argmax(frame_probabilities(letter, rng, args.noise)))]])[-6:]
+            majority = Counter(votes).most_common(1)[0][0]
+            stable = stable + 1 if majority == last else 1
+            last = majority
+            if stable >= args.stable_frames:
+                output += majority
+                break
+    return output, frames
+
+def spell_beam(word, context, decoder, rng, args):
+    """Beam decoder: commit on a confident posterior, else after stable_frames like the vote rule."""
+    decoder.sync_text(context, "")
+    frames = 0
+    for letter in word:
+        stable, last = 0, None
+        while True:
+            frames += 1
+            probabilities = frame_probabilities(letter, rng, args.noise)
+            decoder.add_prediction(LABELS[int(np.argmax(probabilities))], probabilities)
+            current = decoder.get_current_letter()
+            stable = stable + 1 if current == last else 1
+            last = current
+            
+            confident = decoder.frames >= decoder.min_frames and \
+                decoder.letter_posterior()[LABELS.index(current)] >= decoder.commit_threshold
+            if confident or stable >= args.stable_frames:
+                decoder.add_letter(current)
+                break
+    return decoder.decoded_word(), frames
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the vote and beam letter decoders")
+    parser.add_argument("corpus", help="Held-out text, one sentence per line")
+    parser.add_argument("--ngram-model", help="N-gram model directory for the context prior")
+    parser.add_argument("--noise", type=float, default=1.0, help="Logit noise; higher means more confusions")
+    parser.add_argument("--stable-frames", type=int, default=10, help="Predictions the vote rule waits for")
+    parser.add_argument("--threshold", type=float, default=0.95)
+    parser.add_argument("--min-frames", type=int, default=3)
+    parser.add_argument("--max-sentences", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    sentences = []
+    with open(args.corpus, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            words = tokenize(line)
+            if words:
+                sentences.append(words)
+            if len(sentences) >= args.max_sentences:
+                break
+    
+    ngram_model = NGramModel(args.ngram_model) if args.ngram_model else None
+    prior = LexiconLetterPrior(LABELS, ngram_model=ngram_model)
+    decoder = BeamLetterDecoder(LABELS, prior=prior, commit_threshold=args.threshold,
+                                min_frames=args.min_frames, letter_cooldown=0.0)
+    
+    results = {}
+    for name in ("vote", "beam"):
+        rng = np.random.default_rng(args.seed)
+        letters = frames = errors = 0
+        for sentence in sentences:
+            for position, word in enumerate(sentence):
+                if name == "vote":
+                    output, used = spell_vote(word, rng, args)
+                else:
+                    output, used = spell_beam(word, sentence[:position], decoder, rng, args)
+                letters += len(word)
+                frames += used
+                errors += edit_distance(output, word)
+        results[name] = (frames / letters, errors / letters)
+    
+    print(f"\nLetters: {letters}  noise: {args.noise}  prior: {'n-gram' if ngram_model else 'lexicon'}")
+    print(f"{'decoder':<10}{'frames/letter':>15}{'CER':>10}")
+    for name, (frames_per_letter, cer) in results.items():
+        print(f"{name:<10}{frames_per_letter:>15.2f}{cer * 100:>9.2f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Compare timer-based letter commits with Viterbi hold/transition segmentation.
+
+Simulates a signer spelling held-out words: each letter is held for a
+few predictions with group-confused model probabilities, letters are
+separated by short blurry transitions, and the hand leaves the frame
+between words. Double letters (HELLO, BOOK) are signed twice with a
+transition in between.
+
+- timer: LetterStabilizer on a simulated clock. The signer keeps holding
+  each letter until it is committed (HAND_STABLE_TIME), as the UI
+  requires.
+- viterbi: ViterbiLetterSegmenter. The signer holds each letter for a
+  natural --hold-min..--hold-max predictions and moves on.
+
+Reports characters per minute at --rate predictions per second, the
+character error rate, and the share of words with a double letter that
+were spelled exactly.
+
+Usage:
+    python scripts/evaluate_segmentation.py held_out.txt --rate 7.5 --noise 0.5
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.services.letter_stabilizer as letter_stabilizer
+from src.models.ngram_model import tokenize
+from src.services.letter_segmenter import ViterbiLetterSegmenter
+from src.services.letter_stabilizer import LetterStabilizer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from evaluate_letter_decoder import LABELS, edit_distance, frame_probabilities
+
+class SimulatedClock:
+    """Stands in for the time module so timers follow simulated predictions."""
+    def __init__(self):
+        self.now = 0.0
+    
+    def time(self):
+        return self.now
+
+def transition_probabilities(previous, following, rng, noise, blur=0.3):
+    """Frame while the hand moves between letters: motion blur flattens the output."""
+    mix = frame_probabilities(previous, rng, noise) + frame_probabilities(following, rng, noise)
+    flattened = mix ** blur
+    return flattened / flattened.sum()
+
+def feed(stabilizer, session_text, probabilities, clock, rate):
+    """Deliver one prediction the way RecognitionSession.observe does."""
+    clock.now += 1.0 / rate
+    stabilizer.update_last_hand_time()
+    stabilizer.add_prediction(LABELS[int(np.argmax(probabilities))], probabilities, float(probabilities.max()))
+    letter = stabilizer.get_current_letter()
+    if letter and stabilizer.should_add_letter(letter):
+        stabilizer.add_letter(letter)
+        session_text.append(letter)
+        return True
+    return False
+
+def spell(stabilizer, word, rng, args, clock, hold_until_commit):
+    """Sign one word and return the committed letters."""
+    text = []
+    previous = None
+    for letter in word:
+        if previous is not None:
+            for _ in range(rng.integers(1, 4)):
+                feed(stabilizer, text, transition_probabilities(previous, letter, rng, args.noise), clock, args.rate)
+        
+        if hold_until_commit:
+            committed_before = len(text)
+            for _ in range(int(args.rate * 10)):
+                feed(stabilizer, text, frame_probabilities(letter, rng, args.noise), clock, args.rate)
+                if len(text) > committed_before:
+                    break
+        else:
+            for _ in range(rng.integers(args.hold_min, args.hold_max + 1)):
+                feed(stabilizer, text, frame_probabilities(letter, rng, args.noise), clock, args.rate)
+        previous = letter
+    
+    # Hand leaves the frame between words
+    clock.now += 1.0
+    for letter in stabilizer.hand_lost():
+        stabilizer.add_letter(letter)
+        text.append(letter)
+    stabilizer.reset_state()
+    return "".join(text)
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate timer and Viterbi letter commits")
+    parser.add_argument("corpus", help="Held-out text, one sentence per line")
+    parser.add_argument("--rate", type=float, default=7.5, help="Predictions per second")
+    parser.add_argument("--noise", type=float, default=0.5)
+    parser.add_argument("--hold-min", type=int, default=3)
+    parser.add_argument("--hold-max", type=int, default=6)
+    parser.add_argument("--max-lag", type=int, default=6)
+    parser.add_argument("--min-hold", type=int, default=2)
+    parser.add_argument("--max-words", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    words = []
+    with open(args.corpus, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            words.extend(tokenize(line))
+            if len(words) >= args.max_words:
+                break
+    words = words[:args.max_words]
+    
+    clock = SimulatedClock()
+    letter_stabilizer.time = clock
+    
+    runs = [
+        ("timer", LetterStabilizer(), True),
+        ("viterbi", ViterbiLetterSegmenter(LABELS, max_lag=args.max_lag, min_hold=args.min_hold), False)
+    ]
+    
+    letters = sum(len(word) for word in words)
+    double_words = sum(any(a == b for a, b in zip(word, word[1:])) for word in words)
+    print(f"\nWords: {len(words)}  letters: {letters}  with double letters: {double_words}  noise: {args.noise}")
+    print(f"{'segmentation':<14}{'chars/min':>10}{'CER':>9}{'doubles':>10}")
+    for name, stabilizer, hold_until_commit in runs:
+        rng = np.random.default_rng(args.seed)
+        clock.now = 0.0
+        errors = 0
+        doubles_kept = 0
+        for word in words:
+            spelled = spell(stabilizer, word, rng, args, clock, hold_until_commit)
+            errors += edit_distance(spelled, word)
+            doubles_kept += spelled == word and any(a == b for a, b in zip(word, word[1:]))
+        print(f"{name:<14}{letters / clock.now * 60:>10.1f}{errors / letters * 100:>8.2f}%"
+              f"{doubles_kept / max(1, double_words) * 100:>9.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Measure how many letters users sign per word with word recommendations.
+
+Replays held-out sentences one letter at a time through WordRecommender,
+as RecognitionSession does, and counts a word as done as soon as it shows
+up among the recommendations (one extra sign to select it). Compares the
+prefix-only recommender with the context-aware one backed by an n-gram
+model, and reports per-keystroke latency.
+
+Usage:
+    python scripts/evaluate_word_prediction.py held_out.txt --ngram-model ngram_model --limit 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.ngram_model import NGramModel, tokenize
+from src.models.word_dictionary import WordRecommender
+
+def signs_for_word(recommender, context, word):
+    """Signs needed to enter word: letters until it is recommended, plus one to select it."""
+    timings = []
+    for typed in range(len(word)):
+        started = time.perf_counter()
+        recommendations = recommender.get_recommendations(word[:typed], context)
+        timings.append(time.perf_counter() - started)
+        if word in recommendations:
+            return typed + 1, timings
+    return len(word), timings
+
+def evaluate(recommender, sentences):
+    """Replay every sentence and total the signs needed."""
+    letters = signs = words = 0
+    timings = []
+    for sentence in sentences:
+        for position, word in enumerate(sentence):
+            needed, word_timings = signs_for_word(recommender, sentence[:position], word)
+            signs += needed
+            letters += len(word)
+            words += 1
+            timings.extend(word_timings)
+    
+    return {
+        "words": words,
+        "signs_per_word": signs / words,
+        "savings": 1 - signs / letters,
+        "mean_us": np.mean(timings) * 1e6,
+        "p99_us": np.percentile(timings, 99) * 1e6
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate letters signed per word with recommendations")
+    parser.add_argument("corpus", help="Held-out text, one sentence per line")
+    parser.add_argument("--ngram-model", help="Model directory from python -m src.models.ngram_model build")
+    parser.add_argument("--lexicon", help="Lexicon for the prefix recommender (default: built-in words)")
+    parser.add_argument("--limit", type=int, default=5, help="Recommendations shown to the user")
+    parser.add_argument("--max-sentences", type=int, default=2000)
+    args = parser.parse_args()
+    
+    sentences = []
+    with open(args.corpus, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            words = tokenize(line)
+            if words:
+                sentences.append(words)
+            if len(sentences) >= args.max_sentences:
+                break
+    
+    # The original behaviour: only the word being spelled, no context
+    class PrefixOnly(WordRecommender):
+        def get_recommendations(self, current_word, context=None):
+            return super().get_recommendations(current_word)
+    
+    runs = [("prefix only", PrefixOnly(limit=args.limit, lexicon_path=args.lexicon))]
+    if args.ngram_model:
+        ngram_model = NGramModel(args.ngram_model)
+        runs.append(("n-gram context", WordRecommender(limit=args.limit, lexicon_path=args.lexicon,
+                                                       ngram_model=ngram_model)))
+    
+    print(f"\nSentences: {len(sentences)}  recommendations shown: {args.limit}")
+    print(f"{'recommender':<18}{'signs/word':>12}{'saved':>8}{'mean us':>10}{'p99 us':>10}")
+    for name, recommender in runs:
+        r = evaluate(recommender, sentences)
+        print(f"{name:<18}{r['signs_per_word']:>12.2f}{r['savings'] * 100:>7.1f}%"
+              f"{r['mean_us']:>10.1f}{r['p99_us']:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,41 @@
 import os
 import cv2
+import json
 import time
+import uuid
+import weakref
 import threading
 from dotenv import load_dotenv
 
-from flask import Flask, render_template, Response, jsonify, request
+from flask import Flask, render_template, Response, jsonify, request, session
 
 from src.config.settings import *
-from src.models.sign_model import SignLanguageModel
 from src.models.word_dictionary import WordRecommender
-from src.services.hand_detector import HandDetectionService
+from src.models.ngram_model import NGramModel
+from src.models.batch_inference import BatchInferenceEngine
+from src.services.hand_tracker import HandTracker
 from src.services.video_processor import VideoProcessor
+from src.services.frame_broadcaster import FrameBroadcaster, parse_stream_tiers
+from src.services.recognition_pipeline import RecognitionPipeline
+from src.services.frame_recognizer import FrameRecognizer, summarize_event
+from src.services.client_stream import ClientFrameStream
+from src.services.landmark_ingest import LandmarkStream
+from src.services.recognition_setup import build_sign_model, build_hand_encoder, build_hand_detector, build_scheduler
+from src.services.worker_pool import RecognitionWorkerPool
+from src.services.letter_stabilizer import LetterStabilizer
+from src.services.letter_decoder import BeamLetterDecoder, LexiconLetterPrior
+from src.services.letter_segmenter import ViterbiLetterSegmenter
+from src.services.session_store import RecognitionSession, SessionStore
+from src.services.text_events import TextEventStream
+from src.services.hand_overlay import HandOverlayFeed
 from src.utils.logger import setup_logger
 
+try:
+    # Optional: client frame ingestion over WebSocket
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
+
 # Load environment variables
 load_dotenv()
 
@@ -21,174 +44,366 @@ logger = setup_logger(__name__, LOG_LEVEL, LOG_FORMAT)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.secret_key = SECRET_KEY
+app.config['SOCK_SERVER_OPTIONS'] = {'max_message_size': CLIENT_FRAME_MAX_BYTES}
+sock = Sock(app) if Sock is not None else None
 
-# Global state
-sentence = ""
-current_letter = ""
-recommendations = []
+# Global services
 video_processor = None
 hand_detector = None
 sign_model = None
+predictor = None
+inference_engine = None
 word_recommender = None
-processing_thread = None
-stop_processing = False
+letter_prior = None
+frame_broadcaster = None
+hand_overlay = None
+recognition_pipeline = None
+worker_pool = None
+session_store = None
+text_events = None
+client_streams = {}
+client_streams_lock = threading.Lock()
+# Landmark streams of sessions posting batches over HTTP; dropped with their session
+landmark_streams = weakref.WeakKeyDictionary()
 
 def initialize_services():
     """Initialize all services."""
-    global video_processor, hand_detector, sign_model, word_recommender
+    global video_processor, hand_detector, sign_model, predictor, inference_engine
+    global word_recommender, letter_prior
+    global frame_broadcaster, hand_overlay, recognition_pipeline, worker_pool, session_store, text_events
     
     try:
         logger.info("Initializing services...")
         
-        # Initialize model
-        sign_model = SignLanguageModel(MODEL_PATH)
+        # Initialize model; also needed here for the class labels when workers recognize
+        sign_model = build_sign_model()
         
-        # Initialize hand detector
-        hand_detector = HandDetectionService(
-            max_hands=MAX_HANDS,
-            detection_confidence=HAND_DETECTION_CONFIDENCE
-        )
+        # Share forward passes across streams when batching is enabled
+        predictor = sign_model
+        if INFERENCE_BATCHING:
+            inference_engine = BatchInferenceEngine(
+                sign_model,
+                max_batch_size=INFERENCE_MAX_BATCH_SIZE,
+                max_wait_ms=INFERENCE_MAX_WAIT_MS
+            )
+            inference_engine.start()
+            predictor = inference_engine
+        
+        if RECOGNITION_WORKERS > 0:
+            # Detection and prediction run in worker processes with their own models
+            worker_pool = RecognitionWorkerPool(
+                num_workers=RECOGNITION_WORKERS,
+                max_frame_shape=(CAMERA_HEIGHT, CAMERA_WIDTH, 3),
+                slots_per_worker=WORKER_SLOTS
+            )
+            worker_pool.start()
+        elif CAMERA_ENABLED:
+            hand_detector = build_hand_detector()
         
         # Initialize video processor
-        video_processor = VideoProcessor(
-            camera_index=CAMERA_INDEX,
-            canvas_size=CANVAS_SIZE,
-            predict_every=PREDICT_EVERY,
-            vote_queue_size=VOTE_QUEUE_SIZE,
-            letter_cooldown=LETTER_COOLDOWN,
-            hand_stable_time=HAND_STABLE_TIME,
-            no_hand_space_time=NO_HAND_SPACE_TIME
-        )
+        if CAMERA_ENABLED:
+            video_processor = VideoProcessor(
+                camera_index=CAMERA_INDEX,
+                canvas_size=CANVAS_SIZE,
+                predict_every=PREDICT_EVERY,
+                threaded_capture=CAPTURE_THREADED,
+                frame_buffer_size=FRAME_BUFFER_SIZE,
+                frame_timeout=FRAME_TIMEOUT
+            )
         
         # Initialize word recommender
-        word_recommender = WordRecommender(limit=WORD_RECOMMENDATIONS_LIMIT)
+        ngram_model = NGramModel(NGRAM_MODEL_PATH) if NGRAM_MODEL_PATH else None
+        word_recommender = WordRecommender(
+            limit=WORD_RECOMMENDATIONS_LIMIT,
+            lexicon_path=WORD_LEXICON_PATH or None,
+            ngram_model=ngram_model
+        )
         
-        logger.info("All services initialized successfully")
+        # Language prior shared by the per-session beam decoders
+        if LETTER_DECODER == "beam":
+            letter_prior = LexiconLetterPrior(
+                sign_model.class_labels,
+                words=word_recommender.index.entries,
+                weights=word_recommender.index.weights,
+                ngram_model=ngram_model
+            )
+        
+        # Per-client text state
+        session_store = SessionStore(
+            create_session,
+            max_sessions=SESSION_MAX_COUNT,
+            idle_ttl=SESSION_IDLE_TTL
+        )
+        text_events = TextEventStream(heartbeat_interval=EVENTS_HEARTBEAT_INTERVAL)
+        
+        # Start one shared recognition loop for the camera
+        if CAMERA_ENABLED:
+            if STREAM_MODE != "none":
+                frame_broadcaster = FrameBroadcaster(parse_stream_tiers(STREAM_TIERS, STREAM_JPEG_QUALITY))
+            recognition_pipeline = RecognitionPipeline(
+                video_processor,
+                hand_detector,
+                predictor,
+                frame_broadcaster,
+                canvas_size=CANVAS_SIZE,
+                model_input_size=MODEL_INPUT_SIZE,
+                hand_encoder=build_hand_encoder(sign_model),
+                scheduler=build_scheduler(),
+                worker_pool=worker_pool
+            )
+            recognition_pipeline.add_listener(handle_recognition_event)
+            if STREAM_MODE != "overlay":
+                # The page draws the hand from landmarks pushed next to the video
+                hand_overlay = HandOverlayFeed(heartbeat_interval=EVENTS_HEARTBEAT_INTERVAL)
+                recognition_pipeline.add_listener(hand_overlay.publish)
+            recognition_pipeline.start()
+        else:
+            logger.info("Camera disabled; recognizing frames sent by clients only")
         
+        logger.info("All services initialized successfully")
+    
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
         raise
 
-def update_recommendations():
-    """Update word recommendations based on current sentence."""
-    global sentence, recommendations, word_recommender
+def create_session(session_id):
+    """Create a recognition session with its own letter decision state."""
+    timing = dict(
+        vote_queue_size=VOTE_QUEUE_SIZE,
+        letter_cooldown=LETTER_COOLDOWN,
+        hand_stable_time=HAND_STABLE_TIME,
+        no_hand_space_time=NO_HAND_SPACE_TIME,
+        vote_decay=VOTE_DECAY,
+        confidence_weighted=VOTE_CONFIDENCE_WEIGHTED
+    )
+    if letter_prior is not None:
+        stabilizer = BeamLetterDecoder(
+            sign_model.class_labels,
+            prior=letter_prior,
+            beam_width=DECODER_BEAM_WIDTH,
+            commit_threshold=DECODER_COMMIT_THRESHOLD,
+            min_frames=DECODER_MIN_FRAMES,
+            **timing
+        )
+    elif LETTER_DECODER == "viterbi":
+        stabilizer = ViterbiLetterSegmenter(
+            sign_model.class_labels,
+            max_lag=SEGMENT_MAX_LAG,
+            min_hold=SEGMENT_MIN_HOLD,
+            commit_margin=SEGMENT_COMMIT_MARGIN,
+            gate=SEGMENT_GATE,
+            **timing
+        )
+    else:
+        stabilizer = LetterStabilizer(**timing)
+    return RecognitionSession(session_id, stabilizer, word_recommender)
+
+def get_session():
+    """Get the recognition session of the current client."""
+    session_id = session.get("sid")
+    if session_id is None:
+        session_id = uuid.uuid4().hex
+        session["sid"] = session_id
+    
+    return session_store.get_or_create(session_id)
+
+def handle_recognition_event(event):
+    """Fan a recognition event from the shared pipeline out to all camera sessions."""
+    for recognition_session in session_store.sessions():
+        if recognition_session.frame_source == "camera":
+            recognition_session.observe(event)
+
+def create_client_stream(stream_id, on_result):
+    """Create recognition state for one client connection."""
+    recognizer = None
+    if worker_pool is None:
+        # Client frames are never streamed back, so nothing is drawn into them
+        recognizer = FrameRecognizer(
+            build_hand_detector(draw=False),
+            predictor,
+            build_scheduler(),
+            canvas_size=CANVAS_SIZE,
+            model_input_size=MODEL_INPUT_SIZE,
+            hand_encoder=build_hand_encoder(sign_model)
+        )
+    return ClientFrameStream(stream_id, recognizer, worker_pool, on_result)
+
+def client_frames(ws):
+    """Recognize JPEG frames captured by the client and sent over a WebSocket.
+
+    Each binary message is one frame and each recognized frame is answered
+    with a JSON result. While connected, the client's session follows these
+    frames instead of the server camera.
+    """
+    recognition_session = get_session()
+    stream_id = uuid.uuid4().hex
+    
+    def on_result(event):
+        recognition_session.observe(event)
+        ws.send(json.dumps(summarize_event(event)))
+    
+    stream = create_client_stream(stream_id, on_result)
+    with client_streams_lock:
+        client_streams[stream_id] = stream
+    recognition_session.frame_source = "client"
+    recognition_session.attach_stream()
+    stream.start()
+    logger.info("Client frame stream connected")
     
     try:
-        if word_recommender is None:
-            return
-        
-        words = sentence.split()
-        if not words:
-            recommendations = []
-            return
-        
-        current_word = words[-1]
-        recommendations = word_recommender.get_recommendations(current_word)
-        
-    except Exception as e:
-        logger.error(f"Error updating recommendations: {e}")
+        while True:
+            message = ws.receive()
+            if isinstance(message, bytes):
+                stream.push(message)
+    
+    finally:
+        stream.close()
+        with client_streams_lock:
+            client_streams.pop(stream_id, None)
+        recognition_session.frame_source = "camera"
+        recognition_session.detach_stream()
+        logger.info("Client frame stream disconnected")
 
-def generate_frames():
-    """Generate video frames with sign language detection."""
-    global sentence, current_letter, video_processor, hand_detector, sign_model
+def get_landmark_stream(recognition_session):
+    """Get the landmark recognition state of a session, creating it on first use.
+
+    A session that sends landmarks stops following the server camera.
+    """
+    with client_streams_lock:
+        stream = landmark_streams.get(recognition_session)
+        if stream is None:
+            recognizer = FrameRecognizer(
+                None,
+                predictor,
+                build_scheduler(),
+                canvas_size=CANVAS_SIZE,
+                model_input_size=MODEL_INPUT_SIZE,
+                # No frame to draw on: always render the skeleton at model resolution
+                hand_encoder=build_hand_encoder(sign_model, fast_render=True)
+            )
+            stream = landmark_streams[recognition_session] = LandmarkStream(
+                recognizer, max_records=LANDMARK_MAX_BATCH
+            )
+        recognition_session.frame_source = "client"
+        return stream
+
+def recognize_landmarks(recognition_session, data):
+    """Recognize a landmark batch for a session and get the compact per-record results."""
+    events = get_landmark_stream(recognition_session).process(data)
+    for event in events:
+        recognition_session.observe(event)
+    return [summarize_event(event, include_landmarks=False) for event in events]
+
+def client_landmarks(ws):
+    """Recognize landmark batches sent over a WebSocket.
+
+    Each binary message is one batch and is answered with the JSON results
+    of its records.
+    """
+    recognition_session = get_session()
+    recognition_session.attach_stream()
+    logger.info("Client landmark stream connected")
+    
+    try:
+        while True:
+            message = ws.receive()
+            if not isinstance(message, bytes):
+                continue
+            try:
+                ws.send(json.dumps({"events": recognize_landmarks(recognition_session, message)}))
+            except ValueError as e:
+                ws.send(json.dumps({"error": str(e)}))
     
-    if video_processor is None or hand_detector is None or sign_model is None:
+    finally:
+        recognition_session.frame_source = "camera"
+        recognition_session.detach_stream()
+        logger.info("Client landmark stream disconnected")
+
+if sock is not None:
+    sock.route('/ws/frames')(client_frames)
+    sock.route('/ws/landmarks')(client_landmarks)
+
+def generate_frames(tier=None, max_fps=None):
+    """Stream frames produced by the shared recognition pipeline."""
+    if frame_broadcaster is None or recognition_pipeline is None:
         logger.error("Services not initialized")
         return
     
-    logger.info("Starting frame generation")
+    logger.info(f"Client subscribed to video feed ({tier.name if tier else 'default'} tier)")
     
     try:
-        while not stop_processing:
-            success, frame = video_processor.get_frame()
-            if not success:
-                break
-            
-            # Detect hands
-            hands, frame = hand_detector.detect_hands(frame)
-            
-            if hands:
-                video_processor.update_last_hand_time()
-                hand = hands[0]
-                
-                # Extract and process hand ROI
-                hand_roi = hand_detector.extract_hand_roi(
-                    frame, hand, CANVAS_SIZE
-                )
-                
-                # Make prediction if needed
-                if video_processor.should_predict():
-                    processed_roi = video_processor.process_hand_roi(
-                        hand_roi, sign_model, MODEL_INPUT_SIZE
-                    )
-                    
-                    if processed_roi is not None:
-                        predicted_letter, confidence = sign_model.predict(processed_roi)
-                        if predicted_letter:
-                            video_processor.add_prediction(predicted_letter)
-                
-                # Get current letter from vote queue
-                current_letter = video_processor.get_current_letter()
-                
-                # Check if letter should be added to sentence
-                if current_letter and video_processor.should_add_letter(current_letter):
-                    sentence += current_letter
-                    video_processor.add_letter(current_letter)
-                    update_recommendations()
-            
-            else:
-                # No hand detected - check if space should be added
-                if video_processor.should_add_space():
-                    if sentence and not sentence.endswith(" "):
-                        sentence += " "
-                        update_recommendations()
-            
-            # Encode frame for streaming
-            ret, buffer = cv2.imencode('.jpg', frame)
-            if ret:
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n\r\n' +
-                       buffer.tobytes() + b'\r\n')
-    
-    except Exception as e:
-        logger.error(f"Error in frame generation: {e}")
+        for chunk in frame_broadcaster.subscribe(tier, max_fps):
+            yield chunk
     
     finally:
-        logger.info("Frame generation stopped")
+        logger.info("Client unsubscribed from video feed")
 
 @app.route('/')
 def index():
     """Render main page."""
-    return render_template('index.html')
+    get_session()
+    return render_template('index.html', camera_enabled=CAMERA_ENABLED, client_frames=sock is not None,
+                           stream_mode=STREAM_MODE)
 
 @app.route('/video_feed')
 def video_feed():
-    """Video streaming route."""
-    return Response(generate_frames(),
+    """Video streaming route.
+
+    Optional query parameters: tier (a STREAM_TIERS name), or width and
+    quality caps choosing the largest tier within them, and fps.
+    """
+    if not CAMERA_ENABLED or STREAM_MODE == "none":
+        return jsonify({"error": "Camera video disabled"}), 404
+    
+    tier = None
+    if frame_broadcaster is not None:
+        tier = frame_broadcaster.select_tier(
+            request.args.get('tier'),
+            max_width=request.args.get('width', type=int),
+            max_quality=request.args.get('quality', type=int)
+        )
+    max_fps = request.args.get('fps', type=float)
+    return Response(generate_frames(tier, max_fps if max_fps and max_fps > 0 else None),
                     mimetype='multipart/x-mixed-replace; boundary=frame')
 
+@app.route('/hand_events')
+def hand_events():
+    """Push the camera's hand landmarks and bbox as server-sent events for drawing on the page."""
+    if hand_overlay is None:
+        return jsonify({"error": "Hand overlay is drawn into the video"}), 404
+    
+    response = Response(hand_overlay.stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/get_text')
 def get_text():
     """Get current text state."""
-    return jsonify({
-        "sentence": sentence,
-        "letter": current_letter,
-        "recs": recommendations
-    })
+    return jsonify(text_events.poll(get_session()))
+
+@app.route('/events')
+def events():
+    """Push text state changes to the client as server-sent events."""
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('since')
+    try:
+        last_version = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_version = None
+    
+    response = Response(text_events.stream(get_session(), last_version),
+                        mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 @app.route('/clear', methods=['POST', 'GET'])
 def clear():
     """Clear current text."""
-    global sentence, current_letter, video_processor
-    
     try:
-        sentence = ""
-        current_letter = ""
-        
-        if video_processor:
-            video_processor.reset_state()
-        
-        update_recommendations()
+        get_session().clear()
         return jsonify({"ok": True})
     
     except Exception as e:
@@ -198,21 +413,11 @@ def clear():
 @app.route('/append_suggestion', methods=['POST'])
 def append_suggestion():
     """Append suggested word to sentence."""
-    global sentence
-    
     try:
         data = request.get_json()
         word = data.get('word', '')
         
-        if word:
-            words = sentence.split()
-            if words:
-                words[-1] = word
-                sentence = ' '.join(words)
-            else:
-                sentence = word
-            update_recommendations()
-        
+        sentence = get_session().append_suggestion(word)
         return jsonify({"ok": True, "sentence": sentence})
     
     except Exception as e:
@@ -222,12 +427,8 @@ def append_suggestion():
 @app.route('/delete_last', methods=['POST'])
 def delete_last():
     """Delete last character from sentence."""
-    global sentence
-    
     try:
-        if sentence:
-            sentence = sentence[:-1]
-            update_recommendations()
+        sentence = get_session().delete_last()
         return jsonify({"ok": True, "sentence": sentence})
     
     except Exception as e:
@@ -237,18 +438,24 @@ def delete_last():
 @app.route('/add_space', methods=['POST'])
 def add_space():
     """Add space to sentence."""
-    global sentence
-    
     try:
-        if sentence and not sentence.endswith(" "):
-            sentence += " "
-            update_recommendations()
+        sentence = get_session().add_space()
         return jsonify({"ok": True, "sentence": sentence})
     
     except Exception as e:
         logger.error(f"Error adding space: {e}")
         return jsonify({"ok": False, "error": str(e)}), 500
 
+@app.route('/landmarks', methods=['POST'])
+def post_landmarks():
+    """Recognize a binary landmark batch captured by the client."""
+    try:
+        events = recognize_landmarks(get_session(), request.get_data())
+        return jsonify({"ok": True, "events": events})
+    
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
@@ -257,9 +464,10 @@ def health_check():
             "status": "healthy",
             "services": {
                 "video_processor": video_processor is not None,
-                "hand_detector": hand_detector is not None,
+                "hand_detector": hand_detector is not None or worker_pool is not None,
                 "sign_model": sign_model is not None,
-                "word_recommender": word_recommender is not None
+                "word_recommender": word_recommender is not None,
+                "recognition_pipeline": recognition_pipeline is not None
             }
         }
         return jsonify(status)
@@ -268,12 +476,76 @@ def health_check():
         logger.error(f"Health check failed: {e}")
         return jsonify({"status": "unhealthy", "error": str(e)}), 500
 
+@app.route('/stats')
+def stats():
+    """Runtime counters for capacity planning."""
+    try:
+        stats = {}
+        
+        if video_processor is not None:
+            stats["capture"] = video_processor.capture_stats
+        
+        if recognition_pipeline is not None:
+            stats["pipeline"] = recognition_pipeline.stats
+        
+        if hand_overlay is not None:
+            stats["hand_overlay"] = hand_overlay.stats
+        
+        if isinstance(hand_detector, HandTracker):
+            stats["hand_tracking"] = hand_detector.stats
+        
+        if inference_engine is not None:
+            stats["inference"] = inference_engine.stats
+        
+        if session_store is not None:
+            stats["sessions"] = session_store.stats
+        
+        if text_events is not None:
+            stats["text_events"] = text_events.stats
+        
+        with client_streams_lock:
+            streams = list(client_streams.values())
+        stats["client_streams"] = {
+            "active": len(streams),
+            "streams": [stream.stats for stream in streams]
+        }
+        
+        with client_streams_lock:
+            landmark_stats = [stream.stats for stream in landmark_streams.values()]
+        stats["landmark_streams"] = {
+            "active": len(landmark_stats),
+            **{key: sum(entry[key] for entry in landmark_stats)
+               for key in ("batches_received", "records_received", "hands_received", "bytes_received", "batch_errors")}
+        }
+        
+        return jsonify(stats)
+    
+    except Exception as e:
+        logger.error(f"Failed to collect stats: {e}")
+        return jsonify({"error": str(e)}), 500
+
 def cleanup():
     """Cleanup resources."""
-    global stop_processing, video_processor
+    global video_processor, recognition_pipeline
     
     logger.info("Cleaning up resources...")
-    stop_processing = True
+    
+    if recognition_pipeline:
+        recognition_pipeline.stop()
+    
+    if hand_overlay:
+        hand_overlay.close()
+    
+    with client_streams_lock:
+        streams = list(client_streams.values())
+    for stream in streams:
+        stream.close()
+    
+    if worker_pool:
+        worker_pool.stop()
+    
+    if inference_engine:
+        inference_engine.stop()
     
     if video_processor:
         video_processor.release()
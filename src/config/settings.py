@@ -7,37 +7,107 @@ BASE_DIR = Path(__file__).parent.parent.parent
 # Model Configuration
 MODEL_PATH = os.getenv("MODEL_PATH", str(BASE_DIR / "sign_language_AZ_CNN.h5"))
 MODEL_INPUT_SIZE = (64, 64)
+# cnn renders the skeleton for the CNN; landmark classifies the 21 landmarks directly
+RECOGNIZER = os.getenv("RECOGNIZER", "cnn")
+LANDMARK_MODEL_PATH = os.getenv("LANDMARK_MODEL_PATH", str(BASE_DIR / "landmark_mlp.npz"))
+# auto picks keras/tflite/onnx from the MODEL_PATH extension
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "auto")
+MODEL_NUM_THREADS = int(os.getenv("MODEL_NUM_THREADS", "0")) or None
+INFERENCE_MODE = os.getenv("INFERENCE_MODE", "function")
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "True").lower() == "true"
 
 # Camera Configuration
+# Set to False on camera-less hosts; clients then send their own frames to /ws/frames
+CAMERA_ENABLED = os.getenv("CAMERA_ENABLED", "True").lower() == "true"
 CAMERA_INDEX = int(os.getenv("CAMERA_INDEX", "0"))
 CAMERA_WIDTH = int(os.getenv("CAMERA_WIDTH", "640"))
 CAMERA_HEIGHT = int(os.getenv("CAMERA_HEIGHT", "480"))
+CAPTURE_THREADED = os.getenv("CAPTURE_THREADED", "True").lower() == "true"
+FRAME_BUFFER_SIZE = int(os.getenv("FRAME_BUFFER_SIZE", "2"))
+FRAME_TIMEOUT = float(os.getenv("FRAME_TIMEOUT", "1.0"))
 
 # Hand Detection Configuration
 HAND_DETECTION_CONFIDENCE = float(os.getenv("HAND_DETECTION_CONFIDENCE", "0.7"))
 MAX_HANDS = int(os.getenv("MAX_HANDS", "1"))
+# Track a single hand through crops around its predicted position, re-detecting on the full frame when lost
+HAND_TRACKING = os.getenv("HAND_TRACKING", "False").lower() == "true"
+HAND_TRACKING_MAX_BOX_CHANGE = float(os.getenv("HAND_TRACKING_MAX_BOX_CHANGE", "0.5"))
+HAND_TRACKING_MARGIN = float(os.getenv("HAND_TRACKING_MARGIN", "0.5"))
+HAND_REDETECT_INTERVAL = int(os.getenv("HAND_REDETECT_INTERVAL", "60"))
 
 # Canvas Configuration
 CANVAS_SIZE = int(os.getenv("CANVAS_SIZE", "400"))
+# Draw the skeleton directly at MODEL_INPUT_SIZE instead of drawing and resizing
+FAST_ROI_RENDER = os.getenv("FAST_ROI_RENDER", "False").lower() == "true"
 
 # Prediction Configuration
 PREDICT_EVERY = int(os.getenv("PREDICT_EVERY", "4"))
+# Run the model every frame while the hand moves and reuse the last result while the pose is static
+ADAPTIVE_PREDICTION = os.getenv("ADAPTIVE_PREDICTION", "True").lower() == "true"
+PREDICTION_MOTION_THRESHOLD = float(os.getenv("PREDICTION_MOTION_THRESHOLD", "0.03"))
+PREDICTION_STATIC_THRESHOLD = float(os.getenv("PREDICTION_STATIC_THRESHOLD", "0.015"))
+PREDICTION_MAX_REUSE = int(os.getenv("PREDICTION_MAX_REUSE", "15"))
+PREDICTION_CPU_BUDGET = float(os.getenv("PREDICTION_CPU_BUDGET", "0.5"))
 VOTE_QUEUE_SIZE = int(os.getenv("VOTE_QUEUE_SIZE", "6"))
+# Per-vote weight decay (1.0 = plain window) and weighting votes by model confidence
+VOTE_DECAY = float(os.getenv("VOTE_DECAY", "1.0"))
+VOTE_CONFIDENCE_WEIGHTED = os.getenv("VOTE_CONFIDENCE_WEIGHTED", "False").lower() == "true"
 STABLE_FRAMES = int(os.getenv("STABLE_FRAMES", "5"))
+# Letter decision: "vote" (majority of recent letters), "beam" (probabilities fused with a lexicon prior)
+# or "viterbi" (online hold/transition segmentation)
+LETTER_DECODER = os.getenv("LETTER_DECODER", "vote").lower()
+DECODER_BEAM_WIDTH = int(os.getenv("DECODER_BEAM_WIDTH", "8"))
+DECODER_COMMIT_THRESHOLD = float(os.getenv("DECODER_COMMIT_THRESHOLD", "0.95"))
+DECODER_MIN_FRAMES = int(os.getenv("DECODER_MIN_FRAMES", "3"))
+SEGMENT_MAX_LAG = int(os.getenv("SEGMENT_MAX_LAG", "6"))
+SEGMENT_MIN_HOLD = int(os.getenv("SEGMENT_MIN_HOLD", "2"))
+SEGMENT_COMMIT_MARGIN = float(os.getenv("SEGMENT_COMMIT_MARGIN", "2.0"))
+SEGMENT_GATE = float(os.getenv("SEGMENT_GATE", "0.12"))
+
+# Inference Configuration
+INFERENCE_BATCHING = os.getenv("INFERENCE_BATCHING", "False").lower() == "true"
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "16"))
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "5.0"))
+# Recognition worker processes fed through shared-memory frame slots (0 = recognize in the web process)
+RECOGNITION_WORKERS = int(os.getenv("RECOGNITION_WORKERS", "0"))
+WORKER_SLOTS = int(os.getenv("WORKER_SLOTS", "3"))
 
 # Timing Configuration
 LETTER_COOLDOWN = float(os.getenv("LETTER_COOLDOWN", "1.2"))
 HAND_STABLE_TIME = float(os.getenv("HAND_STABLE_TIME", "2.0"))
 NO_HAND_SPACE_TIME = float(os.getenv("NO_HAND_SPACE_TIME", "4.0"))
 
+# Streaming Configuration
+# Camera video: overlay (hand drawn into the frames), raw (plain video, the page draws the hand) or none (no video, only the hand)
+STREAM_MODE = os.getenv("STREAM_MODE", "overlay").lower()
+STREAM_JPEG_QUALITY = int(os.getenv("STREAM_JPEG_QUALITY", "80"))
+# MJPEG tiers as name:width:quality (width 0 = camera size); empty = one full-size tier at STREAM_JPEG_QUALITY
+STREAM_TIERS = os.getenv("STREAM_TIERS", "full:0:80,medium:480:70,low:320:50")
+# Largest JPEG frame accepted from a client over /ws/frames
+CLIENT_FRAME_MAX_BYTES = int(os.getenv("CLIENT_FRAME_MAX_BYTES", "1048576"))
+# Most landmark records accepted in one /landmarks batch
+LANDMARK_MAX_BATCH = int(os.getenv("LANDMARK_MAX_BATCH", "256"))
+# Seconds between keepalive comments on idle /events connections
+EVENTS_HEARTBEAT_INTERVAL = float(os.getenv("EVENTS_HEARTBEAT_INTERVAL", "15.0"))
+
 # Flask Configuration
 FLASK_HOST = os.getenv("FLASK_HOST", "0.0.0.0")
 FLASK_PORT = int(os.getenv("FLASK_PORT", "5000"))
 FLASK_DEBUG = os.getenv("FLASK_DEBUG", "False").lower() == "true"
 
+# Session Configuration
+# Set SECRET_KEY explicitly when running more than one worker process
+SECRET_KEY = os.getenv("SECRET_KEY") or os.urandom(24).hex()
+SESSION_MAX_COUNT = int(os.getenv("SESSION_MAX_COUNT", "100"))
+SESSION_IDLE_TTL = float(os.getenv("SESSION_IDLE_TTL", "600"))
+
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Word Dictionary Configuration
 WORD_RECOMMENDATIONS_LIMIT = int(os.getenv("WORD_RECOMMENDATIONS_LIMIT", "5"))
+# Optional lexicon file: one word or phrase per line, optional tab-separated frequency
+WORD_LEXICON_PATH = os.getenv("WORD_LEXICON_PATH", "")
+# Optional n-gram model directory for context-aware predictions (python -m src.models.ngram_model build)
+NGRAM_MODEL_PATH = os.getenv("NGRAM_MODEL_PATH", "")
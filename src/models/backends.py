@@ -0,0 +1,276 @@
+import logging
+import threading
+import numpy as np
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_MODES = ("predict", "direct", "function")
+BACKENDS = ("auto", "keras", "tflite", "onnx")
+
+class InferenceBackend:
+    name = "base"
+    
+    def __init__(self, model_path):
+        """Initialize a runtime that maps preprocessed ROI batches to class probabilities."""
+        self.model_path = Path(model_path)
+        self.input_shape = None
+    
+    def load(self):
+        """Load the model artifact."""
+        raise NotImplementedError
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run one forward pass and return a (batch, classes) probability array."""
+        raise NotImplementedError
+    
+    @property
+    def info(self):
+        """Get backend information."""
+        return {
+            "backend": self.name,
+            "input_shape": self.input_shape,
+            "model_path": str(self.model_path)
+        }
+
+class KerasBackend(InferenceBackend):
+    name = "keras"
+    
+    def __init__(self, model_path, inference_mode="function"):
+        """Initialize full TensorFlow/Keras backend for .h5 models."""
+        if inference_mode not in INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode '{inference_mode}', "
+                             f"expected one of {INFERENCE_MODES}")
+        
+        super().__init__(model_path)
+        self.inference_mode = inference_mode
+        self.model = None
+        self._infer = None
+    
+    def load(self):
+        """Load the Keras model and build its forward-pass callable."""
+        from tensorflow.keras.models import load_model
+        
+        self.model = load_model(self.model_path)
+        self.input_shape = self.model.input_shape
+        self._infer = self._build_inference_fn()
+    
+    def _build_inference_fn(self):
+        """Build the forward-pass callable for the configured inference mode."""
+        import tensorflow as tf
+        
+        model = self.model
+        
+        if self.inference_mode == "predict":
+            return lambda batch: model.predict(batch, verbose=0)
+        
+        if self.inference_mode == "direct":
+            return lambda batch: model(batch, training=False).numpy()
+        
+        # Trace once with a fixed signature so every call reuses the same graph
+        signature = tf.TensorSpec(shape=(None,) + tuple(self.input_shape[1:]), dtype=tf.float32)
+        
+        @tf.function(input_signature=[signature])
+        def forward(batch):
+            return model(batch, training=False)
+        
+        return lambda batch: forward(tf.convert_to_tensor(batch, dtype=tf.float32)).numpy()
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run one forward pass over a batch."""
+        return np.asarray(self._infer(batch))
+    
+    @property
+    def info(self):
+        """Get backend information."""
+        info = super().info
+        info["inference_mode"] = self.inference_mode
+        return info
+
+def _load_tflite_interpreter():
+    """Import the lightest available TFLite interpreter."""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    
+    try:
+        import tensorflow as tf
+        return tf.lite.Interpreter
+    except ImportError:
+        raise ImportError(
+            "TFLite backend requires tflite-runtime, ai-edge-litert or tensorflow"
+        )
+
+class TFLiteBackend(InferenceBackend):
+    name = "tflite"
+    
+    def __init__(self, model_path, num_threads=None):
+        """Initialize TFLite backend for float or int8-quantized exports.
+
+        Batches are zero-padded to the next power of two and each of those
+        sizes gets its own interpreter, allocated once on first use, so the
+        varying batch sizes of the micro-batcher never trigger
+        resize_tensor_input() and allocate_tensors() per call.
+        """
+        super().__init__(model_path)
+        self.num_threads = num_threads
+        self.interpreter = None
+        self._interpreter_cls = None
+        self._model_content = None
+        self._input = None
+        self._output = None
+        self._interpreters = {}
+        self._padded = {}
+        self._lock = threading.Lock()
+        
+        # Counters
+        self.batches_padded = 0
+        self.rows_padded = 0
+    
+    def load(self):
+        """Load the .tflite flatbuffer."""
+        self._interpreter_cls = _load_tflite_interpreter()
+        self._model_content = self.model_path.read_bytes()
+        self._interpreters = {}
+        self.interpreter, self._input, self._output = self._interpreter_for(1)
+        self.input_shape = (None,) + tuple(int(d) for d in self._input["shape"][1:])
+    
+    @staticmethod
+    def padded_size(count: int) -> int:
+        """Batch size a batch of count rows is padded to."""
+        return 1 << max(0, count - 1).bit_length()
+    
+    def _interpreter_for(self, batch_size):
+        """Get the interpreter allocated for batch_size, creating it on first use."""
+        entry = self._interpreters.get(batch_size)
+        if entry is None:
+            interpreter = self._interpreter_cls(model_content=self._model_content,
+                                                num_threads=self.num_threads)
+            details = interpreter.get_input_details()[0]
+            if int(details["shape"][0]) != batch_size:
+                interpreter.resize_tensor_input(details["index"],
+                                                [batch_size] + list(details["shape"][1:]))
+            interpreter.allocate_tensors()
+            entry = (interpreter, interpreter.get_input_details()[0],
+                     interpreter.get_output_details()[0])
+            self._interpreters[batch_size] = entry
+            logger.info(f"TFLite interpreter allocated for batch size {batch_size}")
+        return entry
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run one forward pass over a batch."""
+        batch = np.asarray(batch, dtype=np.float32)
+        count = batch.shape[0]
+        size = self.padded_size(count)
+        
+        # Interpreters hold mutable tensor state, so calls are serialized
+        with self._lock:
+            interpreter, input_details, output_details = self._interpreter_for(size)
+            
+            if size != count:
+                padded = self._padded.get(size)
+                if padded is None or padded.shape[1:] != batch.shape[1:]:
+                    padded = self._padded[size] = np.zeros((size,) + batch.shape[1:], dtype=np.float32)
+                padded[:count] = batch
+                batch = padded
+                self.batches_padded += 1
+                self.rows_padded += size - count
+            
+            input_dtype = input_details["dtype"]
+            if input_dtype != np.float32:
+                scale, zero_point = input_details["quantization"]
+                info = np.iinfo(input_dtype)
+                batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max)
+                batch = batch.astype(input_dtype)
+            
+            interpreter.set_tensor(input_details["index"], batch)
+            interpreter.invoke()
+            output = interpreter.get_tensor(output_details["index"])[:count]
+            
+            if output.dtype != np.float32:
+                scale, zero_point = output_details["quantization"]
+                output = (output.astype(np.float32) - zero_point) * scale
+            
+            return output
+    
+    @property
+    def info(self):
+        """Get backend information."""
+        info = super().info
+        if self._input is not None:
+            info["input_dtype"] = np.dtype(self._input["dtype"]).name
+        with self._lock:
+            info["allocated_batch_sizes"] = sorted(self._interpreters)
+            info["batches_padded"] = self.batches_padded
+            info["rows_padded"] = self.rows_padded
+        return info
+
+class ONNXBackend(InferenceBackend):
+    name = "onnx"
+    
+    def __init__(self, model_path, num_threads=None):
+        """Initialize ONNX Runtime backend."""
+        super().__init__(model_path)
+        self.num_threads = num_threads
+        self.session = None
+        self._input_name = None
+    
+    def load(self):
+        """Create the ONNX Runtime session."""
+        import onnxruntime as ort
+        
+        options = ort.SessionOptions()
+        if self.num_threads:
+            options.intra_op_num_threads = self.num_threads
+        
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        model_input = self.session.get_inputs()[0]
+        self._input_name = model_input.name
+        self.input_shape = (None,) + tuple(
+            d if isinstance(d, int) else None for d in model_input.shape[1:]
+        )
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run one forward pass over a batch."""
+        batch = np.asarray(batch, dtype=np.float32)
+        return self.session.run(None, {self._input_name: batch})[0]
+
+def resolve_backend_name(model_path, backend="auto") -> str:
+    """Pick a backend from the artifact extension when backend is 'auto'."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    
+    if backend != "auto":
+        return backend
+    
+    suffix = Path(model_path).suffix.lower()
+    if suffix == ".tflite":
+        return "tflite"
+    if suffix == ".onnx":
+        return "onnx"
+    return "keras"
+
+def create_backend(model_path, backend="auto", inference_mode="function",
+                   num_threads=None) -> InferenceBackend:
+    """Create and load the inference backend for a model artifact."""
+    name = resolve_backend_name(model_path, backend)
+    
+    if name == "keras":
+        instance = KerasBackend(model_path, inference_mode=inference_mode)
+    elif name == "tflite":
+        instance = TFLiteBackend(model_path, num_threads=num_threads)
+    else:
+        instance = ONNXBackend(model_path, num_threads=num_threads)
+    
+    instance.load()
+    return instance
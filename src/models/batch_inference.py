@@ -0,0 +1,202 @@
+import time
+import queue
+import threading
+import logging
+import numpy as np
+from collections import deque
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+class BatchInferenceEngine:
+    def __init__(self, model, max_batch_size=16, max_wait_ms=5.0, result_timeout=1.0,
+                 stats_window=1000):
+        """Initialize micro-batching inference engine around a SignLanguageModel."""
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.result_timeout = result_timeout
+        
+        self._queue = queue.Queue()
+        self._batch = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        
+        # Stats
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=stats_window)
+        self._forward_times = deque(maxlen=stats_window)
+        self._completions = deque(maxlen=stats_window)
+        self.batches_run = 0
+        self.items_processed = 0
+        self.items_failed = 0
+        self.full_batches = 0
+        
+        logger.info(f"Batch inference engine initialized with max_batch_size={max_batch_size}, "
+                    f"max_wait_ms={max_wait_ms}")
+    
+    def start(self):
+        """Start the batching worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="batch-inference", daemon=True
+        )
+        self._thread.start()
+        logger.info("Batch inference engine started")
+    
+    def stop(self):
+        """Stop the worker thread and fail any pending requests."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        
+        while True:
+            try:
+                _, future, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(RuntimeError("Batch inference engine stopped"))
+        logger.info("Batch inference engine stopped")
+    
+    def submit(self, processed_image) -> Future:
+        """Queue a preprocessed ROI and return a future for its class probabilities."""
+        future = Future()
+        self._queue.put((processed_image, future, time.perf_counter()))
+        return future
+    
+    def predict(self, processed_image):
+        """Make prediction on processed hand image through the shared batch."""
+        try:
+            probabilities = self.submit(processed_image).result(timeout=self.result_timeout)
+            return self.model.decode(probabilities)
+        
+        except Exception as e:
+            logger.error(f"Batched prediction failed: {e}")
+            return None, 0.0
+    
+    def predict_proba(self, processed_image):
+        """Get the class probability vector for one ROI through the shared batch, or None on failure."""
+        try:
+            return self.submit(processed_image).result(timeout=self.result_timeout)
+        
+        except Exception as e:
+            logger.error(f"Batched prediction failed: {e}")
+            return None
+    
+    def decode(self, probabilities):
+        """Convert a probability vector into a letter and its confidence."""
+        return self.model.decode(probabilities)
+    
+    @property
+    def class_labels(self):
+        """Letters in output class order."""
+        return self.model.class_labels
+    
+    def _run(self):
+        """Collect requests until the batch is full or the oldest one hits its deadline."""
+        while not self._stop_event.is_set():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            items = [first]
+            deadline = first[2] + self.max_wait
+            while len(items) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        items.append(self._queue.get(timeout=remaining))
+                    else:
+                        # Past the deadline, still take whatever is already queued
+                        items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            self._run_batch(items)
+    
+    def _run_batch(self, items):
+        """Run one forward pass over the collected requests and resolve their futures."""
+        count = len(items)
+        try:
+            # Prefer the model's declared input shape so non-image inputs stack correctly
+            input_shape = getattr(self.model, "input_shape", None)
+            if input_shape is not None and None not in tuple(input_shape[1:]):
+                sample_shape = tuple(input_shape[1:])
+            else:
+                sample = np.asarray(items[0][0], dtype=np.float32)
+                sample_shape = sample.shape[1:] if sample.ndim == 4 else sample.shape
+            
+            # Reuse the stacking buffer while the input shape is unchanged
+            if self._batch is None or self._batch.shape[1:] != sample_shape:
+                self._batch = np.empty((self.max_batch_size,) + sample_shape, dtype=np.float32)
+            
+            for i, (image, _, _) in enumerate(items):
+                self._batch[i] = np.reshape(image, sample_shape)
+            
+            started = time.perf_counter()
+            probabilities = self.model.predict_batch(self._batch[:count])
+            finished = time.perf_counter()
+            
+            for i, (_, future, _) in enumerate(items):
+                future.set_result(probabilities[i])
+            
+            with self._stats_lock:
+                self.batches_run += 1
+                self.items_processed += count
+                if count == self.max_batch_size:
+                    self.full_batches += 1
+                self._forward_times.append(finished - started)
+                for _, _, submitted in items:
+                    self._latencies.append(finished - submitted)
+                    self._completions.append(finished)
+        
+        except Exception as e:
+            logger.error(f"Batch inference failed: {e}")
+            with self._stats_lock:
+                self.items_failed += count
+            for _, future, _ in items:
+                if not future.done():
+                    future.set_exception(e)
+    
+    @staticmethod
+    def _percentile_ms(values, percentile):
+        """Get a percentile of a list of durations in milliseconds."""
+        if not values:
+            return None
+        return round(float(np.percentile(values, percentile)) * 1000, 2)
+    
+    @property
+    def stats(self):
+        """Get throughput and latency statistics."""
+        with self._stats_lock:
+            latencies = list(self._latencies)
+            forward_times = list(self._forward_times)
+            completions = list(self._completions)
+            batches_run = self.batches_run
+            items_processed = self.items_processed
+            
+            stats = {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "queue_depth": self._queue.qsize(),
+                "batches_run": batches_run,
+                "items_processed": items_processed,
+                "items_failed": self.items_failed,
+                "full_batches": self.full_batches
+            }
+        
+        span = completions[-1] - completions[0] if len(completions) > 1 else 0
+        stats.update({
+            "avg_batch_size": round(items_processed / batches_run, 2) if batches_run else 0,
+            "throughput_per_sec": round((len(completions) - 1) / span, 1) if span > 0 else 0,
+            "latency_p50_ms": self._percentile_ms(latencies, 50),
+            "latency_p95_ms": self._percentile_ms(latencies, 95),
+            "latency_p99_ms": self._percentile_ms(latencies, 99),
+            "forward_p50_ms": self._percentile_ms(forward_times, 50)
+        })
+        return stats
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Export the Keras sign model to lightweight runtime formats.
+
+Converts an .h5 model into a TFLite flatbuffer (optionally dynamic-range
+or full-int8 quantized) or an ONNX graph, and checks top-1 agreement of
+the exported artifact against the Keras model on a fixture set of
+skeleton canvases.
+
+Usage:
+    python -m src.models.exporter sign_language_AZ_CNN.h5 --format tflite \\
+        --quantize int8 --calibration data/calibration --verify data/fixtures
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from .backends import create_backend
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+QUANTIZATION_MODES = ("none", "dynamic", "int8")
+
+def preprocess_canvas(canvas, input_size, normalize=True) -> np.ndarray:
+    """Resize a skeleton canvas to the model input and scale it like the live pipeline."""
+    processed = cv2.resize(canvas, input_size).astype(np.float32)
+    if normalize:
+        processed /= 255.0
+    return processed
+
+def load_canvas_dataset(directory, input_size, normalize=True, limit_per_class=None):
+    """Load skeleton canvases from a directory.
+
+    Images may sit in per-letter subdirectories (A/, B/, ...), in which case
+    the directory name is returned as the label, or directly in the
+    directory, in which case labels are None.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Dataset directory not found: {directory}")
+    
+    groups = [d for d in sorted(directory.iterdir()) if d.is_dir()]
+    if not groups:
+        groups = [directory]
+    
+    images, labels = [], []
+    for group in groups:
+        files = [f for f in sorted(group.iterdir()) if f.suffix.lower() in IMAGE_EXTENSIONS]
+        if limit_per_class:
+            files = files[:limit_per_class]
+        
+        for path in files:
+            canvas = cv2.imread(str(path))
+            if canvas is None:
+                logger.warning(f"Skipping unreadable image {path}")
+                continue
+            images.append(preprocess_canvas(canvas, input_size, normalize))
+            labels.append(group.name.upper() if group is not directory else None)
+    
+    if not images:
+        raise ValueError(f"No images found in {directory}")
+    
+    return np.stack(images), labels
+
+def _input_size(model):
+    """Get (width, height) of the model input."""
+    _, height, width, _ = model.input_shape
+    return width, height
+
+def export_tflite(model_path, output_path, quantization="none", calibration_images=None):
+    """Convert a Keras model to TFLite, optionally quantized."""
+    import tensorflow as tf
+    from tensorflow.keras.models import load_model
+    
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization '{quantization}', expected one of {QUANTIZATION_MODES}")
+    
+    model = load_model(model_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    
+    if quantization in ("dynamic", "int8"):
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    
+    if quantization == "int8":
+        if calibration_images is None or len(calibration_images) == 0:
+            raise ValueError("Full int8 quantization needs calibration images")
+        
+        def representative_dataset():
+            for image in calibration_images:
+                yield [image[np.newaxis].astype(np.float32)]
+        
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    
+    output_path = Path(output_path)
+    output_path.write_bytes(converter.convert())
+    logger.info(f"Exported TFLite ({quantization}) model to {output_path} "
+                f"({output_path.stat().st_size / 1024:.1f} KiB)")
+    return output_path
+
+def export_onnx(model_path, output_path, opset=13):
+    """Convert a Keras model to ONNX."""
+    import tensorflow as tf
+    import tf2onnx
+    from tensorflow.keras.models import load_model
+    
+    model = load_model(model_path)
+    signature = [tf.TensorSpec((None,) + tuple(model.input_shape[1:]), tf.float32, name="input")]
+    
+    output_path = Path(output_path)
+    tf2onnx.convert.from_keras(model, input_signature=signature, opset=opset,
+                               output_path=str(output_path))
+    logger.info(f"Exported ONNX model to {output_path} "
+                f"({output_path.stat().st_size / 1024:.1f} KiB)")
+    return output_path
+
+def check_parity(reference, candidate, images, batch_size=32) -> dict:
+    """Compare top-1 predictions of two backends on the same preprocessed images."""
+    reference_top, candidate_top, max_diff = [], [], 0.0
+    
+    for start in range(0, len(images), batch_size):
+        batch = images[start:start + batch_size]
+        ref_probs = np.asarray(reference.predict_batch(batch))
+        cand_probs = np.asarray(candidate.predict_batch(batch))
+        
+        reference_top.append(ref_probs.argmax(axis=1))
+        candidate_top.append(cand_probs.argmax(axis=1))
+        max_diff = max(max_diff, float(np.abs(ref_probs - cand_probs).max()))
+    
+    reference_top = np.concatenate(reference_top)
+    candidate_top = np.concatenate(candidate_top)
+    mismatches = np.flatnonzero(reference_top != candidate_top)
+    
+    return {
+        "samples": int(len(reference_top)),
+        "agreement": float(1.0 - len(mismatches) / max(len(reference_top), 1)),
+        "mismatches": mismatches.tolist(),
+        "max_probability_diff": max_diff
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the sign model to TFLite or ONNX")
+    parser.add_argument("model", help="Path to the Keras .h5 model")
+    parser.add_argument("--format", choices=("tflite", "onnx"), default="tflite")
+    parser.add_argument("--quantize", choices=QUANTIZATION_MODES, default="none",
+                        help="TFLite quantization mode")
+    parser.add_argument("--calibration", help="Directory of skeleton canvases for int8 calibration")
+    parser.add_argument("--calibration-limit", type=int, default=50,
+                        help="Calibration images per class")
+    parser.add_argument("--output", help="Output artifact path")
+    parser.add_argument("--verify", help="Fixture directory for the top-1 parity check")
+    parser.add_argument("--min-agreement", type=float, default=0.98,
+                        help="Fail when parity agreement falls below this fraction")
+    parser.add_argument("--raw-pixels", action="store_true",
+                        help="Feed 0-255 pixels instead of 0-1 (cnn8grps_rad1_model.h5)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    model_path = Path(args.model)
+    reference = create_backend(model_path, backend="keras", inference_mode="function")
+    input_size = _input_size(reference)
+    normalize = not args.raw_pixels
+    
+    if args.format == "tflite":
+        suffix = "" if args.quantize == "none" else f"_{args.quantize}"
+        output = Path(args.output or model_path.with_name(f"{model_path.stem}{suffix}.tflite"))
+        
+        calibration = None
+        if args.quantize == "int8":
+            if not args.calibration:
+                parser.error("--calibration is required for --quantize int8")
+            calibration, _ = load_canvas_dataset(args.calibration, input_size, normalize,
+                                                 args.calibration_limit)
+        export_tflite(model_path, output, args.quantize, calibration)
+    else:
+        output = Path(args.output or model_path.with_suffix(".onnx"))
+        export_onnx(model_path, output)
+    
+    if args.verify:
+        images, _ = load_canvas_dataset(args.verify, input_size, normalize)
+        candidate = create_backend(output)
+        result = check_parity(reference, candidate, images)
+        
+        print(f"Parity on {result['samples']} fixtures: "
+              f"{result['agreement'] * 100:.2f}% top-1 agreement, "
+              f"max probability diff {result['max_probability_diff']:.4f}")
+        
+        if result["agreement"] < args.min_agreement:
+            print(f"FAILED: agreement below {args.min_agreement * 100:.1f}% "
+                  f"(mismatched fixtures: {result['mismatches'][:20]})")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
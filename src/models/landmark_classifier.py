@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Classify signs from hand landmarks without rendering an image.
+
+cvzone already returns the 21 hand landmarks; this recognizer turns them
+into translation- and scale-invariant features (wrist-relative coordinates
+plus every pairwise distance, the quantity final_pred.py compares with
+distance()) and classifies them with a small NumPy MLP.
+
+Training data is an .npz file with `landmarks` of shape (N, 21, 2|3) in
+pixel coordinates and `labels` of shape (N,) holding letters.
+
+Usage:
+    python -m src.models.landmark_classifier train landmarks.npz --output landmark_mlp.npz
+    python -m src.models.landmark_classifier evaluate landmark_mlp.npz landmarks_test.npz
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_LANDMARKS = 21
+
+# Upper triangle of the landmark distance matrix
+_PAIR_ROWS, _PAIR_COLS = np.triu_indices(NUM_LANDMARKS, k=1)
+
+FEATURE_SIZE = (NUM_LANDMARKS - 1) * 2 + len(_PAIR_ROWS)
+
+def landmark_features(landmarks) -> np.ndarray:
+    """Build the invariant feature vector for one hand.
+
+    Coordinates are taken relative to the wrist and divided by the largest
+    wrist-to-landmark distance, so position and hand size drop out.
+    """
+    points = np.asarray(landmarks, dtype=np.float32)[:, :2]
+    points = points - points[0]
+    
+    scale = float(np.sqrt((points ** 2).sum(axis=1)).max()) or 1.0
+    points /= scale
+    
+    deltas = points[_PAIR_ROWS] - points[_PAIR_COLS]
+    distances = np.sqrt((deltas ** 2).sum(axis=1))
+    
+    return np.concatenate([points[1:].ravel(), distances])
+
+def batch_features(landmarks) -> np.ndarray:
+    """Build feature vectors for an (N, 21, 2|3) array of hands."""
+    points = np.asarray(landmarks, dtype=np.float32)[:, :, :2]
+    points = points - points[:, :1]
+    
+    scale = np.sqrt((points ** 2).sum(axis=2)).max(axis=1)
+    scale[scale == 0] = 1.0
+    points /= scale[:, None, None]
+    
+    deltas = points[:, _PAIR_ROWS] - points[:, _PAIR_COLS]
+    distances = np.sqrt((deltas ** 2).sum(axis=2))
+    
+    return np.concatenate([points[:, 1:].reshape(len(points), -1), distances], axis=1)
+
+class LandmarkClassifier:
+    def __init__(self, model_path: str, warmup: bool = True):
+        """Initialize the landmark MLP from an .npz weights file."""
+        self.model_path = Path(model_path)
+        self.weights = []
+        self.biases = []
+        self.mean = None
+        self.std = None
+        self.classes = None
+        self.input_shape = (None, FEATURE_SIZE)
+        self._load_model()
+        
+        if warmup:
+            self.predict_batch(np.zeros((1, FEATURE_SIZE), dtype=np.float32))
+    
+    def _load_model(self):
+        """Load the trained weights."""
+        try:
+            if not self.model_path.exists():
+                raise FileNotFoundError(f"Model file not found: {self.model_path}")
+            
+            with np.load(self.model_path) as data:
+                layers = int(data["layers"])
+                self.weights = [data[f"W{i}"].astype(np.float32) for i in range(layers)]
+                self.biases = [data[f"b{i}"].astype(np.float32) for i in range(layers)]
+                self.mean = data["mean"].astype(np.float32)
+                self.std = data["std"].astype(np.float32)
+                self.classes = [str(c) for c in data["classes"]]
+            
+            logger.info(f"Landmark classifier loaded from {self.model_path} "
+                        f"({len(self.classes)} classes, hidden={[w.shape[1] for w in self.weights[:-1]]})")
+        
+        except Exception as e:
+            logger.error(f"Failed to load landmark classifier: {e}")
+            raise
+    
+    def encode(self, hand_info) -> np.ndarray:
+        """Turn a cvzone hand dict into a (1, FEATURE_SIZE) model input."""
+        return landmark_features(hand_info['lmList'])[np.newaxis]
+    
+    def predict(self, features):
+        """Make prediction on encoded landmark features."""
+        try:
+            probabilities = self.predict_batch(features)
+            return self.decode(probabilities[0])
+        
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            return None, 0.0
+    
+    def predict_proba(self, features):
+        """Get the class probability vector for one encoded hand, or None on failure."""
+        try:
+            return self.predict_batch(features)[0]
+        
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            return None
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run the MLP over a batch of feature vectors and return class probabilities."""
+        hidden = (np.asarray(batch, dtype=np.float32) - self.mean) / self.std
+        return _forward(hidden, self.weights, self.biases)[-1]
+    
+    def decode(self, probabilities):
+        """Convert a probability vector into a letter and its confidence."""
+        predicted_class = int(np.argmax(probabilities))
+        return self.classes[predicted_class], float(probabilities[predicted_class])
+    
+    @property
+    def class_labels(self):
+        """Letters in output class order."""
+        return self.classes
+    
+    @property
+    def model_info(self):
+        """Get model information."""
+        return {
+            "backend": "landmark-mlp",
+            "input_shape": self.input_shape,
+            "model_path": str(self.model_path),
+            "classes": len(self.classes),
+            "loaded": True
+        }
+
+def _softmax(logits):
+    """Row-wise softmax."""
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+def _forward(x, weights, biases):
+    """Run the MLP and return every layer's activations, ending with probabilities."""
+    activations = [x]
+    for i, (weight, bias) in enumerate(zip(weights, biases)):
+        z = activations[-1] @ weight + bias
+        activations.append(_softmax(z) if i == len(weights) - 1 else np.maximum(z, 0))
+    return activations
+
+def train(features, labels, hidden=(128, 64), epochs=200, batch_size=64, learning_rate=1e-3,
+          weight_decay=1e-4, seed=0):
+    """Train the MLP with Adam on softmax cross-entropy and return its parameters."""
+    rng = np.random.default_rng(seed)
+    classes = sorted(set(labels))
+    targets = np.array([classes.index(label) for label in labels])
+    
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-6
+    x = ((features - mean) / std).astype(np.float32)
+    
+    sizes = [x.shape[1]] + list(hidden) + [len(classes)]
+    weights = [(rng.standard_normal((a, b)) * np.sqrt(2.0 / a)).astype(np.float32)
+               for a, b in zip(sizes[:-1], sizes[1:])]
+    biases = [np.zeros(b, dtype=np.float32) for b in sizes[1:]]
+    
+    params = weights + biases
+    moments = [np.zeros_like(p) for p in params]
+    velocities = [np.zeros_like(p) for p in params]
+    beta1, beta2, step = 0.9, 0.999, 0
+    
+    for epoch in range(epochs):
+        order = rng.permutation(len(x))
+        for start in range(0, len(x), batch_size):
+            idx = order[start:start + batch_size]
+            activations = _forward(x[idx], weights, biases)
+            
+            # Softmax cross-entropy gradient, then backprop through the ReLU layers
+            grad = activations[-1].copy()
+            grad[np.arange(len(idx)), targets[idx]] -= 1
+            grad /= len(idx)
+            
+            weight_grads, bias_grads = [None] * len(weights), [None] * len(weights)
+            for layer in reversed(range(len(weights))):
+                weight_grads[layer] = activations[layer].T @ grad + weight_decay * weights[layer]
+                bias_grads[layer] = grad.sum(axis=0)
+                if layer:
+                    grad = (grad @ weights[layer].T) * (activations[layer] > 0)
+            
+            step += 1
+            for p, g, m, v in zip(params, weight_grads + bias_grads, moments, velocities):
+                m *= beta1
+                m += (1 - beta1) * g
+                v *= beta2
+                v += (1 - beta2) * g * g
+                p -= learning_rate * (m / (1 - beta1 ** step)) / (np.sqrt(v / (1 - beta2 ** step)) + 1e-8)
+        
+        if (epoch + 1) % max(1, epochs // 10) == 0:
+            probabilities = _forward(x, weights, biases)[-1]
+            accuracy = float((probabilities.argmax(axis=1) == targets).mean())
+            logger.info(f"Epoch {epoch + 1}/{epochs}: train accuracy {accuracy * 100:.1f}%")
+    
+    return {
+        "weights": weights,
+        "biases": biases,
+        "mean": mean.astype(np.float32),
+        "std": std.astype(np.float32),
+        "classes": classes
+    }
+
+def save_model(model, output_path):
+    """Write trained parameters to an .npz file LandmarkClassifier can load."""
+    arrays = {f"W{i}": w for i, w in enumerate(model["weights"])}
+    arrays.update({f"b{i}": b for i, b in enumerate(model["biases"])})
+    np.savez(
+        output_path,
+        layers=len(model["weights"]),
+        mean=model["mean"],
+        std=model["std"],
+        classes=np.array(model["classes"]),
+        **arrays
+    )
+
+def load_dataset(path):
+    """Load landmarks and labels from an .npz file and build features."""
+    with np.load(path) as data:
+        landmarks = data["landmarks"]
+        labels = [str(label) for label in data["labels"]]
+    return batch_features(landmarks), labels
+
+def main():
+    parser = argparse.ArgumentParser(description="Train or evaluate the landmark sign classifier")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    train_parser = subparsers.add_parser("train", help="Train an MLP on recorded landmarks")
+    train_parser.add_argument("data", help=".npz with landmarks (N, 21, 2|3) and labels (N,)")
+    train_parser.add_argument("--output", default="landmark_mlp.npz")
+    train_parser.add_argument("--hidden", type=int, nargs="+", default=[128, 64])
+    train_parser.add_argument("--epochs", type=int, default=200)
+    train_parser.add_argument("--learning-rate", type=float, default=1e-3)
+    train_parser.add_argument("--validation", type=float, default=0.2,
+                              help="Fraction held out for validation")
+    
+    eval_parser = subparsers.add_parser("evaluate", help="Report accuracy on recorded landmarks")
+    eval_parser.add_argument("model", help="Trained .npz weights")
+    eval_parser.add_argument("data", help=".npz with landmarks and labels")
+    
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    features, labels = load_dataset(args.data)
+    
+    if args.command == "train":
+        order = np.random.default_rng(0).permutation(len(labels))
+        held_out = int(len(order) * args.validation)
+        train_idx, val_idx = order[held_out:], order[:held_out]
+        
+        model = train(features[train_idx], [labels[i] for i in train_idx], hidden=tuple(args.hidden),
+                      epochs=args.epochs, learning_rate=args.learning_rate)
+        save_model(model, args.output)
+        print(f"Saved landmark classifier to {args.output}")
+        
+        if held_out:
+            classifier = LandmarkClassifier(args.output, warmup=False)
+            predictions = classifier.predict_batch(features[val_idx]).argmax(axis=1)
+            correct = [classifier.classes[p] == labels[i] for p, i in zip(predictions, val_idx)]
+            print(f"Validation accuracy: {np.mean(correct) * 100:.2f}% on {held_out} samples")
+    else:
+        classifier = LandmarkClassifier(args.model, warmup=False)
+        predictions = classifier.predict_batch(features).argmax(axis=1)
+        correct = [classifier.classes[p] == label for p, label in zip(predictions, labels)]
+        print(f"Accuracy: {np.mean(correct) * 100:.2f}% on {len(labels)} samples")
+
+if __name__ == "__main__":
+    main()
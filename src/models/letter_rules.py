@@ -0,0 +1,426 @@
+"""
+Landmark rules that turn the 8-group CNN output into letters.
+
+cnn8grps_rad1_model.h5 predicts one of eight letter groups. final_pred.py
+then corrects the group from the top-2 prediction and the hand landmarks,
+picks the letter inside the group and detects the space/next/backspace
+gestures. The rules are kept here as declarative tables in the original
+order. LetterRuleEngine evaluates them: it builds the pairwise coordinate
+differences and distances of the 21 landmarks once per frame, checks
+every comparison in a single vectorized pass, and then walks the tables
+using integer bitmasks for the conditions and the (top-1, top-2) group
+pairs.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# Class index -> letters predicted by cnn8grps_rad1_model.h5
+CNN8_GROUPS = ("AEMNST", "BDFIUVWKR", "CO", "GH", "L", "PQZ", "X", "YJ")
+
+# (pip, tip) landmarks of the index, middle, ring and pinky fingers
+FINGER_JOINTS = ((6, 8), (10, 12), (14, 16), (18, 20))
+
+# --- Condition atoms -------------------------------------------------------
+# Each atom is one comparison on the landmarks; a condition is a list of
+# atoms that must all hold, optionally containing Not(...) groups.
+
+def lt(axis, a, b, offset=0):
+    """pts[a][axis] + offset < pts[b][axis]"""
+    return ("lt", axis, a, b, offset)
+
+def gt(axis, a, b, offset=0):
+    """pts[a][axis] + offset > pts[b][axis]"""
+    return ("gt", axis, a, b, offset)
+
+def dist_lt(a, b, limit):
+    """distance(pts[a], pts[b]) < limit"""
+    return ("dist_lt", a, b, limit)
+
+def dist_gt(a, b, limit):
+    """distance(pts[a], pts[b]) > limit"""
+    return ("dist_gt", a, b, limit)
+
+def spread_lt(pair, other, limit):
+    """distance(pair) - distance(other) < limit"""
+    return ("spread_lt", pair, other, limit)
+
+class Not:
+    def __init__(self, *atoms):
+        """Group of atoms that must not all hold."""
+        self.atoms = atoms
+
+X, Y = 0, 1
+
+def fingers(*states):
+    """Index..pinky states: 'up' (tip above pip), 'down' (tip below pip) or None."""
+    atoms = []
+    for (pip, tip), state in zip(FINGER_JOINTS, states):
+        if state == "up":
+            atoms.append(gt(Y, pip, tip))
+        elif state == "down":
+            atoms.append(lt(Y, pip, tip))
+    return atoms
+
+def all_of(op, axis, a, others, offset=0):
+    """Compare landmark a against each of the others."""
+    return [op(axis, a, b, offset) for b in others]
+
+TIPS = (8, 12, 16, 20)
+
+# --- Rule tables -----------------------------------------------------------
+# Group correction rules, in the original order: (target group, (top-1, top-2)
+# pairs the rule applies to, condition). The first two rules test the pair
+# as predicted by the CNN even after the first rule changed top-1.
+
+INITIAL_PAIR_RULES = 2
+
+GROUP_RULES = (
+    # [Aemnst]
+    (0, [[5, 2], [5, 3], [3, 5], [3, 6], [3, 0], [3, 2], [6, 4], [6, 1], [6, 2], [6, 6], [6, 7], [6, 0], [6, 5],
+         [4, 1], [1, 0], [1, 1], [6, 3], [1, 6], [5, 6], [5, 1], [4, 5], [1, 4], [1, 5], [2, 0], [2, 6], [4, 6],
+         [1, 0], [5, 7], [1, 6], [6, 1], [7, 6], [2, 5], [7, 1], [5, 4], [7, 0], [7, 5], [7, 2]],
+     fingers("down", "down", "down", "down")),
+    # [o][s]
+    (0, [[2, 2], [2, 1]],
+     [lt(X, 5, 4)]),
+    # [c0][aemnst]
+    (2, [[0, 0], [0, 6], [0, 2], [0, 5], [0, 1], [0, 7], [5, 2], [7, 6], [7, 1]],
+     [gt(X, 0, 8), gt(X, 0, 4), gt(X, 0, 12), gt(X, 0, 16), gt(X, 0, 20), gt(X, 5, 4)]),
+    (2, [[6, 0], [6, 6], [6, 2]],
+     [dist_lt(8, 16, 52)]),
+    # [gh][bdfikruvw]
+    (3, [[1, 4], [1, 5], [1, 6], [1, 3], [1, 0]],
+     fingers("up", None, "down", "down") + all_of(lt, X, 0, TIPS)),
+    # [gh][l]
+    (3, [[4, 6], [4, 1], [4, 5], [4, 3], [4, 7]],
+     [gt(X, 4, 0)]),
+    # [gh][pqz]
+    (3, [[5, 3], [5, 0], [5, 7], [5, 4], [5, 2], [5, 1], [5, 5]],
+     [lt(Y, 2, 16, 15)]),
+    # [l][x]
+    (4, [[6, 4], [6, 1], [6, 2]],
+     [dist_gt(4, 11, 55)]),
+    # [l][d]
+    (4, [[1, 4], [1, 6], [1, 1]],
+     [dist_gt(4, 11, 50)] + fingers("up", "down", "down", "down")),
+    # [l][gh]
+    (4, [[3, 6], [3, 4]],
+     [lt(X, 4, 0)]),
+    # [l][c0], listed twice in the original
+    (4, [[2, 2], [2, 5], [2, 4]],
+     [lt(X, 1, 12)]),
+    (4, [[2, 2], [2, 5], [2, 4]],
+     [lt(X, 1, 12)]),
+    # [gh][z]
+    (5, [[3, 6], [3, 5], [3, 4]],
+     fingers("up", "down", "down", "down") + [gt(Y, 4, 10)]),
+    # [gh][pq]
+    (5, [[3, 2], [3, 1], [3, 6]],
+     all_of(gt, Y, 4, TIPS, 17)),
+    # [l][pqz]
+    (5, [[4, 4], [4, 5], [4, 2], [7, 5], [7, 6], [7, 0]],
+     [gt(X, 4, 0)]),
+    # [pqz][aemnst]
+    (5, [[0, 2], [0, 6], [0, 1], [0, 5], [0, 0], [0, 7], [0, 4], [0, 3], [2, 7]],
+     all_of(lt, X, 0, TIPS)),
+    # [pqz][yj]
+    (7, [[5, 7], [5, 2], [5, 6]],
+     [lt(X, 3, 0)]),
+    # [l][yj]
+    (7, [[4, 6], [4, 2], [4, 4], [4, 1], [4, 5], [4, 7]],
+     [lt(Y, 6, 8)]),
+    # [x][yj]
+    (7, [[6, 7], [0, 7], [0, 1], [0, 0], [6, 4], [6, 6], [6, 5], [6, 1]],
+     [gt(Y, 18, 20)]),
+    # [x][aemnst]
+    (6, [[0, 4], [0, 2], [0, 3], [0, 1], [0, 6]],
+     [gt(X, 5, 16)]),
+    # [yj][x]
+    (6, [[7, 2]],
+     [lt(Y, 18, 20), lt(Y, 8, 10)]),
+    # [c0][x]
+    (6, [[2, 1], [2, 2], [2, 6], [2, 7], [2, 0]],
+     [dist_gt(8, 16, 50)]),
+    # [l][x]
+    (6, [[4, 6], [4, 2], [4, 1], [4, 4]],
+     [dist_lt(4, 11, 60)]),
+    # [x][d]
+    (6, [[1, 4], [1, 6], [1, 0], [1, 2]],
+     [lt(X, 4, 5, 15)]),
+    # [b][pqz]
+    (1, [[5, 0], [5, 1], [5, 4], [5, 5], [5, 6], [6, 1], [7, 6], [0, 2], [7, 1], [7, 4], [6, 6], [7, 2], [5, 0],
+         [6, 3], [6, 4], [7, 5], [7, 2]],
+     fingers("up", "up", "up", "up")),
+    # [f][pqz]
+    (1, [[6, 1], [6, 0], [0, 3], [6, 4], [2, 2], [0, 6], [6, 2], [7, 6], [4, 6], [4, 1], [4, 2], [0, 2], [7, 1],
+         [7, 4], [6, 6], [7, 2], [7, 5], [7, 2]],
+     fingers("down", "up", "up", "up")),
+    (1, [[6, 1], [6, 0], [4, 2], [4, 1], [4, 6], [4, 4]],
+     fingers(None, "up", "up", "up")),
+    # [d][pqz]
+    (1, [[5, 0], [3, 4], [3, 0], [3, 1], [3, 5], [5, 5], [5, 4], [5, 1], [7, 6]],
+     fingers("up", "down", "down", "down") + [lt(X, 2, 0), gt(Y, 4, 14)]),
+    (1, [[4, 1], [4, 2], [4, 4]],
+     [dist_lt(4, 11, 50)] + fingers("up", "down", "down", "down")),
+    (1, [[3, 4], [3, 0], [3, 1], [3, 5], [3, 6]],
+     fingers("up", "down", "down", "down") + [lt(X, 2, 0), lt(Y, 14, 4)]),
+    (1, [[6, 6], [6, 4], [6, 1], [6, 2]],
+     [lt(X, 5, 4, -15)]),
+    # [i][pqz]
+    (1, [[5, 4], [5, 5], [5, 1], [0, 3], [0, 7], [5, 0], [0, 2], [6, 2], [7, 5], [7, 1], [7, 6], [7, 7]],
+     fingers("down", "down", "down", "up")),
+    # [yj][bfdi]
+    (7, [[1, 5], [1, 7], [1, 1], [1, 6], [1, 3], [1, 0]],
+     [lt(X, 4, 5, -15)] + fingers("down", "down", "down", "up")),
+    # [uvr]
+    (1, [[5, 5], [5, 0], [5, 4], [5, 1], [4, 6], [4, 1], [7, 6], [3, 0], [3, 5]],
+     fingers("up", "up", "down", "down") + [gt(Y, 4, 14)]),
+    # [w]
+    (1, [[3, 5], [3, 0], [3, 6], [5, 1], [4, 1], [2, 0], [5, 0], [5, 5]],
+     [Not(*all_of(lt, X, 0, TIPS, 13)), Not(*all_of(gt, X, 0, TIPS)), dist_lt(4, 11, 50)]),
+    (1, [[5, 0], [5, 5], [0, 1]],
+     fingers("up", "up", "up", None)),
+)
+
+# Letter inside each group: (default, [(letter, condition), ...]); every
+# matching rule overwrites the letter, so the last match wins
+SUBGROUP_RULES = {
+    0: ("S", [
+        ("A", all_of(lt, X, 4, (6, 10, 14, 18))),
+        ("T", [gt(X, 4, 6), lt(X, 4, 10), lt(X, 4, 14), lt(X, 4, 18), lt(Y, 4, 14), lt(Y, 4, 18)]),
+        ("E", all_of(gt, Y, 4, TIPS)),
+        ("M", [gt(X, 4, 6), gt(X, 4, 10), gt(X, 4, 14), lt(Y, 4, 18)]),
+        ("N", [gt(X, 4, 6), gt(X, 4, 10), lt(Y, 4, 18), lt(Y, 4, 14)]),
+    ]),
+    1: (1, [
+        ("B", fingers("up", "up", "up", "up")),
+        ("D", fingers("up", "down", "down", "down")),
+        ("F", fingers("down", "up", "up", "up")),
+        ("I", fingers("down", "down", "down", "up")),
+        ("W", fingers("up", "up", "up", "down")),
+        ("K", fingers("up", "up", "down", "down") + [lt(Y, 4, 9)]),
+        ("U", [spread_lt((8, 12), (6, 10), 8)] + fingers("up", "up", "down", "down")),
+        ("V", [Not(spread_lt((8, 12), (6, 10), 8))] + fingers("up", "up", "down", "down") + [gt(Y, 4, 9)]),
+        ("R", [gt(X, 8, 12)] + fingers("up", "up", "down", "down")),
+    ]),
+    2: ("O", [("C", [dist_gt(12, 4, 42)])]),
+    3: ("H", [("G", [dist_gt(8, 12, 72)])]),
+    4: ("L", []),
+    5: ("P", [
+        ("Q", all_of(gt, X, 4, (12, 16, 20))),
+        ("Z", all_of(gt, X, 4, (12, 16, 20)) + [lt(Y, 8, 5)]),
+    ]),
+    6: ("X", []),
+    7: ("J", [("Y", [dist_gt(8, 4, 42)])]),
+}
+
+# Gesture overrides: (symbols the rule applies to or None for any, condition, result).
+# The backspace check runs for every symbol, as in the original.
+POST_RULES = (
+    ((1, "E", "S", "X", "Y", "B"), fingers("up", "down", "down", "up"), " "),
+    (("E", "Y", "B"), [lt(X, 4, 5)] + fingers("up", "up", "up", "up"), "next"),
+    (None, all_of(gt, X, 0, TIPS) + all_of(lt, Y, 4, TIPS) + all_of(lt, Y, 4, (6, 10, 14, 18)), "Backspace"),
+)
+
+# --- Engine ----------------------------------------------------------------
+
+_PLANE = NUM_LANDMARKS * NUM_LANDMARKS
+_DX, _DY, _DIST, _SPREAD = (i * _PLANE for i in range(4))
+
+class LetterRuleEngine:
+    def __init__(self, group_rules=GROUP_RULES, subgroup_rules=SUBGROUP_RULES, post_rules=POST_RULES,
+                 initial_pair_rules=INITIAL_PAIR_RULES):
+        """Compile the rule tables into one comparison array and integer bitmasks."""
+        self._atom_bits = {}
+        index, sign, threshold, spreads = [], [], [], []
+        
+        def atom_bit(atom):
+            # Every atom becomes `sign * features[index] < threshold` on the per-frame feature vector
+            if atom in self._atom_bits:
+                return self._atom_bits[atom]
+            
+            kind = atom[0]
+            if kind in ("lt", "gt"):
+                _, axis, a, b, offset = atom
+                plane = _DX if axis == X else _DY
+                # p[a] + off < p[b]  <=>  d[a, b] < -off;   p[a] + off > p[b]  <=>  d[b, a] < off
+                if kind == "lt":
+                    entry = (plane + a * NUM_LANDMARKS + b, 1.0, -offset)
+                else:
+                    entry = (plane + b * NUM_LANDMARKS + a, 1.0, offset)
+            elif kind in ("dist_lt", "dist_gt"):
+                _, a, b, limit = atom
+                flip = -1.0 if kind == "dist_gt" else 1.0
+                entry = (_DIST + a * NUM_LANDMARKS + b, flip, flip * limit)
+            elif kind == "spread_lt":
+                _, (a, b), (c, d), limit = atom
+                entry = (_SPREAD + len(spreads), 1.0, limit)
+                spreads.append((a * NUM_LANDMARKS + b, c * NUM_LANDMARKS + d))
+            else:
+                raise ValueError(f"Unknown rule atom {atom}")
+            
+            bit = 1 << len(index)
+            for values, value in zip((index, sign, threshold), entry):
+                values.append(value)
+            self._atom_bits[atom] = bit
+            return bit
+        
+        def compile_condition(condition):
+            # (bits that must all be set, [bit groups that must not all be set])
+            required, excluded = 0, []
+            for term in condition:
+                if isinstance(term, Not):
+                    mask = 0
+                    for atom in term.atoms:
+                        mask |= atom_bit(atom)
+                    excluded.append(mask)
+                else:
+                    required |= atom_bit(term)
+            return required, excluded
+        
+        groups = len(CNN8_GROUPS)
+        self.group_rules = []
+        rules_by_pair = [[] for _ in range(groups * groups)]
+        for i, (target, pairs, condition) in enumerate(group_rules):
+            pair_mask = 0
+            for top1, top2 in pairs:
+                pair_mask |= 1 << (top1 * groups + top2)
+                if i not in rules_by_pair[top1 * groups + top2]:
+                    rules_by_pair[top1 * groups + top2].append(i)
+            self.group_rules.append((target, pair_mask, compile_condition(condition)))
+        
+        # Rule indices per (top-1, top-2) pair, to skip rules that cannot apply
+        self._rules_by_pair = [tuple(rules) for rules in rules_by_pair]
+        self.initial_pair_rules = initial_pair_rules
+        
+        self.subgroup_rules = {
+            group: (default, [(letter, compile_condition(condition)) for letter, condition in rules])
+            for group, (default, rules) in subgroup_rules.items()
+        }
+        self.post_rules = [
+            (frozenset(symbols) if symbols is not None else None, compile_condition(condition), result)
+            for symbols, condition, result in post_rules
+        ]
+        
+        self._index = np.array(index, dtype=np.intp)
+        self._sign = np.array(sign, dtype=np.float64)
+        self._threshold = np.array(threshold, dtype=np.float64)
+        self._spreads = np.array(spreads, dtype=np.intp).reshape(-1, 2)
+        
+        # Per-frame scratch: dx, dy and distance planes followed by the spreads
+        self._features = np.empty(_SPREAD + len(spreads))
+        self._dx = self._features[_DX:_DY].reshape(NUM_LANDMARKS, NUM_LANDMARKS)
+        self._dy = self._features[_DY:_DIST].reshape(NUM_LANDMARKS, NUM_LANDMARKS)
+        self._dist = self._features[_DIST:_SPREAD].reshape(NUM_LANDMARKS, NUM_LANDMARKS)
+        self._square = np.empty((NUM_LANDMARKS, NUM_LANDMARKS))
+    
+    @property
+    def atom_count(self) -> int:
+        """Number of distinct landmark comparisons in the tables."""
+        return len(self._index)
+    
+    def evaluate_atoms(self, pts) -> int:
+        """Evaluate every comparison for one hand and pack the results into an int."""
+        points = np.asarray(pts, dtype=np.float64)
+        xs, ys = points[:NUM_LANDMARKS, 0], points[:NUM_LANDMARKS, 1]
+        
+        np.subtract(xs[:, None], xs, out=self._dx)
+        np.subtract(ys[:, None], ys, out=self._dy)
+        np.multiply(self._dx, self._dx, out=self._dist)
+        np.multiply(self._dy, self._dy, out=self._square)
+        np.add(self._dist, self._square, out=self._dist)
+        np.sqrt(self._dist, out=self._dist)
+        
+        flat_dist = self._features[_DIST:_SPREAD]
+        np.subtract(flat_dist[self._spreads[:, 0]], flat_dist[self._spreads[:, 1]],
+                    out=self._features[_SPREAD:])
+        
+        truth = self._features[self._index] * self._sign < self._threshold
+        return int.from_bytes(np.packbits(truth, bitorder="little").tobytes(), "little")
+    
+    def evaluate_atoms_batch(self, pts_batch, chunk_size=1024) -> list:
+        """Evaluate every comparison for an (N, 21, 2|3) array of hands, a chunk at a time."""
+        points = np.asarray(pts_batch, dtype=np.float64)[:, :NUM_LANDMARKS, :2]
+        bits = []
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start:start + chunk_size]
+            count = len(chunk)
+            
+            deltas = chunk[:, :, None, :] - chunk[:, None, :, :]
+            dist = np.sqrt((deltas * deltas).sum(axis=3)).reshape(count, _PLANE)
+            features = np.concatenate([
+                deltas[..., 0].reshape(count, _PLANE),
+                deltas[..., 1].reshape(count, _PLANE),
+                dist,
+                dist[:, self._spreads[:, 0]] - dist[:, self._spreads[:, 1]]
+            ], axis=1)
+            
+            truth = features[:, self._index] * self._sign < self._threshold
+            packed = np.packbits(truth, axis=1, bitorder="little")
+            bits.extend(int.from_bytes(row.tobytes(), "little") for row in packed)
+        return bits
+    
+    @staticmethod
+    def _holds(bits, compiled) -> bool:
+        """Check a compiled condition against the packed comparison results."""
+        required, excluded = compiled
+        if bits & required != required:
+            return False
+        for mask in excluded:
+            if bits & mask == mask:
+                return False
+        return True
+    
+    def refine_group(self, bits, ch1, ch2) -> int:
+        """Apply the group correction rules to the CNN's top-2 groups."""
+        groups = len(CNN8_GROUPS)
+        
+        initial_pair = 1 << (ch1 * groups + ch2)
+        for target, pair_mask, condition in self.group_rules[:self.initial_pair_rules]:
+            if pair_mask & initial_pair and self._holds(bits, condition):
+                ch1 = target
+        
+        # Later rules see the current top-1, so jump between the rules listed for that pair
+        start = self.initial_pair_rules
+        while True:
+            candidates = self._rules_by_pair[ch1 * groups + ch2]
+            position = bisect_left(candidates, start)
+            if position == len(candidates):
+                return ch1
+            
+            rule = candidates[position]
+            target, _, condition = self.group_rules[rule]
+            if self._holds(bits, condition):
+                ch1 = target
+            start = rule + 1
+    
+    def decide(self, bits, ch1, ch2):
+        """Run the group, letter and gesture rules on precomputed comparison bits."""
+        group = self.refine_group(bits, int(ch1), int(ch2))
+        
+        symbol, rules = self.subgroup_rules[group]
+        for letter, condition in rules:
+            if self._holds(bits, condition):
+                symbol = letter
+        
+        for symbols, condition, result in self.post_rules:
+            if (symbols is None or symbol in symbols) and self._holds(bits, condition):
+                symbol = result
+        return symbol
+    
+    def classify(self, pts, ch1, ch2):
+        """Decide the symbol for one frame from the landmarks and the CNN's top-2 groups.
+
+        Returns a letter, " ", "next", "Backspace", or 1 when no rule of
+        group 1 matched, exactly like final_pred.py.
+        """
+        return self.decide(self.evaluate_atoms(pts), ch1, ch2)
+    
+    def classify_batch(self, pts_batch, top1, top2) -> list:
+        """Decide symbols for many recorded frames, evaluating comparisons in one pass."""
+        bits = self.evaluate_atoms_batch(pts_batch)
+        return [self.decide(b, ch1, ch2) for b, ch1, ch2 in zip(bits, top1, top2)]
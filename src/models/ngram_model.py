@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+N-gram next-word model for context-aware word recommendations.
+
+The model is built offline from a plain-text corpus (one sentence per line)
+into a directory of NumPy arrays that are memory-mapped at load time, so a
+model with millions of n-grams starts instantly and shares pages between
+processes:
+
+    meta.json        order, id width and counts
+    vocab.txt        vocabulary, one upper-case word per line, sorted
+    counts1.npy      unigram counts, indexed by word id
+    keys{n}.npy      sorted uint64 keys of every n-gram, word ids packed high to low
+    counts{n}.npy    uint32 count of each key
+
+Word ids follow alphabetical order, so all continuations of a context that
+start with a given prefix occupy one contiguous run of keys{n}, found with
+two binary searches. Candidates are scored with stupid backoff.
+
+Usage:
+    python -m src.models.ngram_model build corpus.txt --output ngram_model --order 3
+    python -m src.models.ngram_model query ngram_model I NEED
+"""
+
+import argparse
+import json
+import logging
+import re
+from array import array
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from .word_dictionary import WORD_DICT, PrefixIndex
+
+logger = logging.getLogger(__name__)
+
+# Fingerspelling only produces letters, so everything else splits words
+TOKEN_PATTERN = re.compile(r"[A-Z]+")
+
+# Score multiplier applied each time a lookup falls back to a shorter context
+BACKOFF = 0.4
+
+def tokenize(line: str) -> list:
+    """Split a line of text into upper-case words."""
+    return TOKEN_PATTERN.findall(line.upper())
+
+def pack_keys(ids: np.ndarray, bits: int) -> np.ndarray:
+    """Pack an (N, n) array of word ids into uint64 keys, first word in the high bits."""
+    keys = np.zeros(len(ids), dtype=np.uint64)
+    for column in np.asarray(ids).T:
+        keys = (keys << np.uint64(bits)) | column.astype(np.uint64)
+    return keys
+
+def _read_sentences(corpus_paths, include_builtin=True):
+    """Yield tokenized sentences from corpus files and, optionally, the built-in phrases."""
+    if include_builtin:
+        for entry in WORD_DICT:
+            yield tokenize(entry)
+    
+    for path in corpus_paths:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                words = tokenize(line)
+                if words:
+                    yield words
+
+def build_model(corpus_paths, output_dir, order=3, min_count=1, max_vocab=None, include_builtin=True):
+    """Count n-grams in the corpus and write the memory-mappable model directory."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # First pass: vocabulary
+    word_counts = Counter()
+    for words in _read_sentences(corpus_paths, include_builtin):
+        word_counts.update(words)
+    
+    kept = [(word, count) for word, count in word_counts.most_common(max_vocab) if count >= min_count]
+    vocab = sorted(word for word, _ in kept)
+    if not vocab:
+        raise ValueError("Corpus has no words above the minimum count")
+    
+    bits = max(1, (len(vocab) - 1).bit_length())
+    if bits * order > 63:
+        raise ValueError(f"{len(vocab)} words need {bits} bits per id, too many for order {order}")
+    
+    word_ids = {word: i for i, word in enumerate(vocab)}
+    unigram_counts = np.array([word_counts[word] for word in vocab], dtype=np.uint32)
+    
+    # Second pass: one flat id stream, -1 marks sentence breaks and dropped words
+    stream = array("i")
+    for words in _read_sentences(corpus_paths, include_builtin):
+        stream.extend(word_ids.get(word, -1) for word in words)
+        stream.append(-1)
+    stream = np.frombuffer(stream, dtype=np.int32)
+    
+    np.save(output_dir / "counts1.npy", unigram_counts)
+    (output_dir / "vocab.txt").write_text("\n".join(vocab) + "\n", encoding="utf-8")
+    
+    ngram_sizes = {}
+    for n in range(2, order + 1):
+        windows = np.stack([stream[i:len(stream) - n + 1 + i] for i in range(n)], axis=1)
+        windows = windows[(windows >= 0).all(axis=1)]
+        
+        keys, counts = np.unique(pack_keys(windows, bits), return_counts=True)
+        keep = counts >= min_count
+        np.save(output_dir / f"keys{n}.npy", keys[keep])
+        np.save(output_dir / f"counts{n}.npy", counts[keep].astype(np.uint32))
+        ngram_sizes[n] = int(keep.sum())
+    
+    meta = {
+        "order": order,
+        "bits": bits,
+        "vocab_size": len(vocab),
+        "tokens": int(unigram_counts.sum()),
+        "ngrams": ngram_sizes
+    }
+    (output_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    logger.info(f"Built {order}-gram model in {output_dir}: {len(vocab)} words, {ngram_sizes}")
+    return meta
+
+class NGramModel:
+    def __init__(self, model_dir):
+        """Initialize the n-gram model from a built directory, memory-mapping its tables."""
+        self.model_dir = Path(model_dir)
+        self.order = 1
+        self.bits = 0
+        self.total = 0
+        self.unigram_counts = None
+        self.vocab = None
+        self._keys = {}
+        self._counts = {}
+        self._load_model()
+    
+    def _load_model(self):
+        """Load the vocabulary and map the count tables."""
+        try:
+            meta_path = self.model_dir / "meta.json"
+            if not meta_path.exists():
+                raise FileNotFoundError(f"N-gram model not found: {self.model_dir}")
+            
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            self.order = int(meta["order"])
+            self.bits = int(meta["bits"])
+            self.total = int(meta["tokens"])
+            
+            words = (self.model_dir / "vocab.txt").read_text(encoding="utf-8").split()
+            self.unigram_counts = np.load(self.model_dir / "counts1.npy", mmap_mode="r")
+            
+            # Vocabulary is already sorted, so index positions are the word ids
+            self.vocab = PrefixIndex(words, self.unigram_counts)
+            
+            for n in range(2, self.order + 1):
+                self._keys[n] = np.load(self.model_dir / f"keys{n}.npy", mmap_mode="r")
+                self._counts[n] = np.load(self.model_dir / f"counts{n}.npy", mmap_mode="r")
+            
+            logger.info(f"N-gram model loaded from {self.model_dir} "
+                        f"(order {self.order}, {len(words)} words, {meta['ngrams']} n-grams)")
+        
+        except Exception as e:
+            logger.error(f"Failed to load n-gram model: {e}")
+            raise
+    
+    def word_id(self, word: str) -> int:
+        """Get a word's id, or -1 when it is not in the vocabulary."""
+        lo, hi = self.vocab.prefix_range(word)
+        return lo if lo < hi and self.vocab.entries[lo] == word else -1
+    
+    def context_ids(self, context) -> list:
+        """Ids of the longest run of known words at the end of context, up to order - 1."""
+        ids = []
+        recent = context[-(self.order - 1):] if self.order > 1 else []
+        for word in reversed(recent):
+            word_id = self.word_id(word.upper())
+            if word_id < 0:
+                break
+            ids.append(word_id)
+        return ids[::-1]
+    
+    def count(self, ids) -> int:
+        """Get the corpus count of an n-gram given as word ids."""
+        if len(ids) == 1:
+            return int(self.unigram_counts[ids[0]])
+        
+        keys = self._keys[len(ids)]
+        key = pack_keys(np.array([ids]), self.bits)[0]
+        position = int(np.searchsorted(keys, key))
+        if position < len(keys) and keys[position] == key:
+            return int(self._counts[len(ids)][position])
+        return 0
+    
+    def continuations(self, context_ids, lo_id=0, hi_id=None):
+        """Get (word ids, counts) of every word seen after context_ids with id in [lo_id, hi_id)."""
+        n = len(context_ids) + 1
+        keys, counts = self._keys[n], self._counts[n]
+        hi_id = len(self.vocab) if hi_id is None else hi_id
+        
+        base = 0
+        for word_id in context_ids:
+            base = (base << self.bits) | word_id
+        base <<= self.bits
+        
+        lo = int(np.searchsorted(keys, np.uint64(base + lo_id)))
+        hi = int(np.searchsorted(keys, np.uint64(base + hi_id)))
+        word_ids = (np.asarray(keys[lo:hi]) & np.uint64((1 << self.bits) - 1)).astype(np.int64)
+        return word_ids, np.asarray(counts[lo:hi])
+    
+    def predict(self, context, prefix: str = "", k: int = 5, exclude_exact: bool = True) -> list:
+        """Get the k most likely next words after context that start with prefix, best first."""
+        prefix = prefix.upper()
+        lo_id, hi_id = self.vocab.prefix_range(prefix)
+        if exclude_exact and prefix and lo_id < hi_id and self.vocab.entries[lo_id] == prefix:
+            lo_id += 1
+        if lo_id >= hi_id or k <= 0:
+            return []
+        
+        context_ids = self.context_ids(context)
+        scores = {}
+        weight = 1.0
+        
+        # Stupid backoff: a word keeps the score of the longest context it was seen after
+        for start in range(len(context_ids)):
+            history = context_ids[start:]
+            total = self.count(history)
+            if total:
+                word_ids, counts = self.continuations(history, lo_id, hi_id)
+                
+                # Only the top entries of this order can make the final top k
+                keep = k + len(scores)
+                if len(counts) > keep:
+                    best = np.argpartition(-counts.astype(np.int64), keep)[:keep]
+                    word_ids, counts = word_ids[best], counts[best]
+                
+                for word_id, count in zip(word_ids.tolist(), counts.tolist()):
+                    scores.setdefault(word_id, weight * count / total)
+            weight *= BACKOFF
+        
+        for word in self.vocab.top_k(prefix, k + len(scores), exclude_exact=exclude_exact):
+            word_id = self.word_id(word)
+            scores.setdefault(word_id, weight * int(self.unigram_counts[word_id]) / self.total)
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.vocab.entries[word_id] for word_id, _ in ranked[:k]]
+    
+    def continue_phrase(self, words, max_words: int = 3, min_probability: float = 0.5) -> list:
+        """Greedily extend words while one continuation clearly dominates, e.g. TURN ON -> THE LIGHT."""
+        words = [w.upper() for w in words]
+        extension = []
+        while len(extension) < max_words and self.order > 1:
+            history = self.context_ids(words + extension)
+            if not history:
+                break
+            
+            total = self.count(history)
+            word_ids, counts = self.continuations(history)
+            if not total or not len(counts):
+                break
+            
+            best = int(np.argmax(counts))
+            if counts[best] / total < min_probability:
+                break
+            extension.append(self.vocab.entries[int(word_ids[best])])
+        return extension
+    
+    @property
+    def model_info(self):
+        """Get model information."""
+        return {
+            "model_path": str(self.model_dir),
+            "order": self.order,
+            "vocab_size": len(self.vocab),
+            "ngrams": {n: len(keys) for n, keys in self._keys.items()},
+            "loaded": True
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the n-gram word prediction model")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    build_parser = subparsers.add_parser("build", help="Build a model directory from text corpora")
+    build_parser.add_argument("corpus", nargs="+", help="Text files, one sentence per line")
+    build_parser.add_argument("--output", default="ngram_model")
+    build_parser.add_argument("--order", type=int, default=3)
+    build_parser.add_argument("--min-count", type=int, default=1, help="Drop words and n-grams seen fewer times")
+    build_parser.add_argument("--max-vocab", type=int, help="Keep only the most frequent words")
+    build_parser.add_argument("--no-builtin", action="store_true", help="Leave out the built-in phrases")
+    
+    query_parser = subparsers.add_parser("query", help="Print predictions for a context")
+    query_parser.add_argument("model", help="Model directory")
+    query_parser.add_argument("context", nargs="*", help="Preceding words")
+    query_parser.add_argument("--prefix", default="", help="Letters of the word being spelled")
+    query_parser.add_argument("--limit", type=int, default=5)
+    
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    if args.command == "build":
+        meta = build_model(args.corpus, args.output, order=args.order, min_count=args.min_count,
+                           max_vocab=args.max_vocab, include_builtin=not args.no_builtin)
+        print(json.dumps(meta, indent=2))
+    else:
+        model = NGramModel(args.model)
+        words = model.predict(args.context, args.prefix, args.limit)
+        print(" | ".join(words) or "(no predictions)")
+        if words:
+            extension = model.continue_phrase(args.context + [words[0]])
+            if extension:
+                print(f"Phrase: {' '.join([words[0]] + extension)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Post-training quantization of the sign models with an accuracy/latency report.
+
+Exports dynamic-range and full-int8 TFLite variants of a Keras model,
+calibrating int8 on a directory of skeleton canvases, then evaluates the
+Keras reference and every variant on a labelled canvas set (one
+subdirectory per letter) and prints per-letter accuracy deltas together
+with the measured single-image latency on this CPU.
+
+Works with the 26-class A-Z model and with the 8-group model used by
+final_pred.py, whose classes are letter groups rather than letters.
+
+Usage:
+    python -m src.models.quantization sign_language_AZ_CNN.h5 \\
+        --calibration data/calibration --eval data/fixtures
+    python -m src.models.quantization cnn8grps_rad1_model.h5 --raw-pixels \\
+        --calibration data/calibration
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .backends import create_backend
+from .exporter import export_tflite, load_canvas_dataset
+from .letter_rules import CNN8_GROUPS
+
+logger = logging.getLogger(__name__)
+
+VARIANTS = ("dynamic", "int8")
+
+def letter_to_class(letter, num_classes):
+    """Map a letter label to the class index the model is expected to predict."""
+    if num_classes == 26:
+        return ord(letter) - 65
+    if num_classes == len(CNN8_GROUPS):
+        for index, group in enumerate(CNN8_GROUPS):
+            if letter in group:
+                return index
+    raise ValueError(f"Cannot map letter '{letter}' onto a {num_classes}-class model")
+
+def measure_latency(backend, image, runs=200, warmup=10) -> dict:
+    """Time single-image forward passes and return latency percentiles in ms."""
+    batch = image[np.newaxis]
+    for _ in range(warmup):
+        backend.predict_batch(batch)
+    
+    timings = np.empty(runs)
+    for i in range(runs):
+        started = time.perf_counter()
+        backend.predict_batch(batch)
+        timings[i] = time.perf_counter() - started
+    
+    return {
+        "p50_ms": round(float(np.percentile(timings, 50)) * 1000, 3),
+        "p95_ms": round(float(np.percentile(timings, 95)) * 1000, 3),
+        "mean_ms": round(float(timings.mean()) * 1000, 3)
+    }
+
+def evaluate(backend, images, labels, num_classes, batch_size=32) -> dict:
+    """Compute overall and per-letter top-1 accuracy of a backend."""
+    predictions = []
+    for start in range(0, len(images), batch_size):
+        probabilities = np.asarray(backend.predict_batch(images[start:start + batch_size]))
+        predictions.append(probabilities.argmax(axis=1))
+    predictions = np.concatenate(predictions)
+    
+    expected = np.array([letter_to_class(letter, num_classes) for letter in labels])
+    correct = predictions == expected
+    
+    per_letter = {}
+    for letter in sorted(set(labels)):
+        mask = np.array([label == letter for label in labels])
+        per_letter[letter] = float(correct[mask].mean())
+    
+    return {
+        "accuracy": float(correct.mean()),
+        "per_letter": per_letter,
+        "predictions": predictions
+    }
+
+def build_report(model_path, calibration_dir, eval_dir=None, output_dir=None,
+                 normalize=True, calibration_limit=50, runs=200, num_threads=None) -> dict:
+    """Export the quantized variants and measure them against the Keras model."""
+    model_path = Path(model_path)
+    output_dir = Path(output_dir) if output_dir else model_path.parent
+    
+    reference = create_backend(model_path, backend="keras", inference_mode="function")
+    _, height, width, _ = reference.input_shape
+    input_size = (width, height)
+    
+    calibration, _ = load_canvas_dataset(calibration_dir, input_size, normalize, calibration_limit)
+    images, labels = load_canvas_dataset(eval_dir or calibration_dir, input_size, normalize)
+    if any(label is None for label in labels):
+        raise ValueError("Evaluation canvases must be grouped in per-letter subdirectories")
+    
+    num_classes = int(np.asarray(reference.predict_batch(images[:1])).shape[-1])
+    
+    backends = {"keras": (reference, model_path)}
+    for variant in VARIANTS:
+        artifact = output_dir / f"{model_path.stem}_{variant}.tflite"
+        export_tflite(model_path, artifact, variant, calibration)
+        backends[variant] = (create_backend(artifact, num_threads=num_threads), artifact)
+    
+    report = {
+        "model": str(model_path),
+        "num_classes": num_classes,
+        "samples": len(labels),
+        "variants": {}
+    }
+    
+    baseline = None
+    for name, (backend, artifact) in backends.items():
+        result = evaluate(backend, images, labels, num_classes)
+        if baseline is None:
+            baseline = result
+        
+        report["variants"][name] = {
+            "artifact": str(artifact),
+            "size_kib": round(artifact.stat().st_size / 1024, 1),
+            "accuracy": result["accuracy"],
+            "agreement": float((result["predictions"] == baseline["predictions"]).mean()),
+            "per_letter_delta": {
+                letter: result["per_letter"][letter] - baseline["per_letter"][letter]
+                for letter in result["per_letter"]
+            },
+            "per_letter": result["per_letter"],
+            "latency": measure_latency(backend, images[0], runs)
+        }
+    
+    return report
+
+def format_report(report) -> str:
+    """Render the report as a plain-text table."""
+    variants = report["variants"]
+    names = list(variants)
+    lines = [
+        f"Model: {report['model']} ({report['num_classes']} classes, {report['samples']} samples)",
+        "",
+        f"{'variant':<10}{'size KiB':>10}{'accuracy':>10}{'agree':>8}{'p50 ms':>9}{'p95 ms':>9}"
+    ]
+    for name in names:
+        v = variants[name]
+        lines.append(
+            f"{name:<10}{v['size_kib']:>10.1f}{v['accuracy'] * 100:>9.1f}%"
+            f"{v['agreement'] * 100:>7.1f}%{v['latency']['p50_ms']:>9.3f}{v['latency']['p95_ms']:>9.3f}"
+        )
+    
+    lines += ["", "Per-letter accuracy (delta vs keras):",
+              f"{'letter':<8}" + "".join(f"{name:>16}" for name in names)]
+    for letter in variants["keras"]["per_letter"]:
+        row = f"{letter:<8}"
+        for name in names:
+            v = variants[name]
+            row += f"{v['per_letter'][letter] * 100:>9.1f}%"
+            row += f" {v['per_letter_delta'][letter] * 100:+5.1f}" if name != "keras" else " " * 6
+        lines.append(row)
+    
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize the sign model and report accuracy vs latency")
+    parser.add_argument("model", help="Path to the Keras .h5 model")
+    parser.add_argument("--calibration", required=True,
+                        help="Directory of skeleton canvases in per-letter subdirectories")
+    parser.add_argument("--calibration-limit", type=int, default=50,
+                        help="Calibration images per class")
+    parser.add_argument("--eval", help="Labelled evaluation canvases (defaults to --calibration)")
+    parser.add_argument("--output-dir", help="Where to write the .tflite variants")
+    parser.add_argument("--runs", type=int, default=200, help="Timed forward passes per variant")
+    parser.add_argument("--threads", type=int, default=None, help="TFLite interpreter threads")
+    parser.add_argument("--raw-pixels", action="store_true",
+                        help="Feed 0-255 pixels instead of 0-1 (cnn8grps_rad1_model.h5)")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    report = build_report(
+        args.model, args.calibration, args.eval, args.output_dir,
+        normalize=not args.raw_pixels, calibration_limit=args.calibration_limit,
+        runs=args.runs, num_threads=args.threads
+    )
+    print(format_report(report))
+    
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
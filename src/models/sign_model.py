@@ -1,17 +1,36 @@
 import logging
+import numpy as np
 from pathlib import Path
-from tensorflow.keras.models import load_model
+from .backends import create_backend, INFERENCE_MODES
 from .word_dictionary import WORD_DICT
 
 logger = logging.getLogger(__name__)
 
+# Output class i of the CNN is the letter chr(65 + i)
+CLASS_LABELS = [chr(65 + i) for i in range(26)]
+
 class SignLanguageModel:
-    def __init__(self, model_path: str):
-        """Initialize the sign language recognition model."""
+    def __init__(self, model_path: str, inference_mode: str = "function", warmup: bool = True,
+                 backend: str = "auto", num_threads=None):
+        """Initialize the sign language recognition model.
+
+        The runtime is chosen by `backend`; with "auto" a .tflite or .onnx
+        artifact is served without importing TensorFlow.
+        """
+        if inference_mode not in INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode '{inference_mode}', "
+                             f"expected one of {INFERENCE_MODES}")
+        
         self.model_path = Path(model_path)
-        self.model = None
+        self.inference_mode = inference_mode
+        self.backend_name = backend
+        self.num_threads = num_threads
+        self.backend = None
         self.input_shape = None
         self._load_model()
+        
+        if warmup:
+            self.warmup()
     
     def _load_model(self):
         """Load the trained model."""
@@ -19,40 +38,82 @@ class SignLanguageModel:
             if not self.model_path.exists():
                 raise FileNotFoundError(f"Model file not found: {self.model_path}")
             
-            self.model = load_model(self.model_path)
-            self.input_shape = self.model.input_shape
+            self.backend = create_backend(
+                self.model_path,
+                backend=self.backend_name,
+                inference_mode=self.inference_mode,
+                num_threads=self.num_threads
+            )
+            self.input_shape = self.backend.input_shape
             logger.info(f"Model loaded successfully from {self.model_path}")
             logger.info(f"Model input shape: {self.input_shape}")
-            
+            logger.info(f"Inference backend: {self.backend.name}")
+        
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
     
+    @property
+    def model(self):
+        """Get the underlying Keras model when served by the Keras backend."""
+        return getattr(self.backend, "model", None)
+    
+    def warmup(self, runs: int = 3):
+        """Run dummy forward passes so tracing and allocation happen at startup."""
+        dummy = np.zeros((1,) + tuple(self.input_shape[1:]), dtype=np.float32)
+        for _ in range(runs):
+            self.backend.predict_batch(dummy)
+        logger.info(f"Model warmed up with {runs} {self.backend.name} passes")
+    
     def predict(self, processed_image):
         """Make prediction on processed hand image."""
         try:
-            if self.model is None:
+            if self.backend is None:
                 raise ValueError("Model not loaded")
             
-            prediction = self.model.predict(processed_image, verbose=0)
-            predicted_class = int(prediction.argmax())
-            predicted_letter = chr(65 + predicted_class)
-            confidence = float(prediction[0][predicted_class])
-            
-            return predicted_letter, confidence
-            
+            prediction = self.predict_batch(processed_image)
+            return self.decode(prediction[0])
+        
         except Exception as e:
             logger.error(f"Prediction failed: {e}")
             return None, 0.0
     
+    def predict_proba(self, processed_image):
+        """Get the class probability vector for one processed hand image, or None on failure."""
+        try:
+            return self.predict_batch(processed_image)[0]
+        
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            return None
+    
+    def predict_batch(self, batch) -> np.ndarray:
+        """Run one forward pass over a batch and return class probabilities."""
+        if self.backend is None:
+            raise ValueError("Model not loaded")
+        
+        return np.asarray(self.backend.predict_batch(batch))
+    
+    @staticmethod
+    def decode(probabilities):
+        """Convert a probability vector into a letter and its confidence."""
+        predicted_class = int(np.argmax(probabilities))
+        predicted_letter = chr(65 + predicted_class)
+        confidence = float(probabilities[predicted_class])
+        
+        return predicted_letter, confidence
+    
+    @property
+    def class_labels(self):
+        """Letters in output class order."""
+        return CLASS_LABELS
+    
     @property
     def model_info(self):
         """Get model information."""
-        if self.model is None:
+        if self.backend is None:
             return None
         
-        return {
-            "input_shape": self.input_shape,
-            "model_path": str(self.model_path),
-            "loaded": True
-        }
+        info = self.backend.info
+        info["loaded"] = True
+        return info
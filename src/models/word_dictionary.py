@@ -1,3 +1,12 @@
+import heapq
+import logging
+from bisect import bisect_left
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 # Word and Sentence Recommendations Dictionary
 WORD_DICT = [
     # Common Words
@@ -54,21 +63,174 @@ WORD_DICT = [
     "TURN OFF THE LIGHT"
 ]
 
+class PrefixIndex:
+    def __init__(self, entries, weights=None):
+        """Initialize a sorted prefix index with frequency-ranked top-k lookups.
+
+        Entries are kept in a sorted array so a prefix maps to one contiguous
+        range found with bisect. A min segment tree over each entry's rank
+        (higher weight first, then earlier position in `entries`) returns the
+        best entry of any range, so top-k takes k log n steps instead of
+        scanning every match. Without weights, results keep the list order.
+        """
+        if weights is None:
+            weights = np.ones(len(entries))
+        # Copy: merging duplicates below writes into the array
+        weights = np.array(weights, dtype=np.float64)
+        if len(weights) != len(entries):
+            raise ValueError("entries and weights must have the same length")
+        
+        # Keep the first occurrence of duplicates, with the highest weight seen
+        first_seen = {}
+        for position, entry in enumerate(entries):
+            entry = entry.upper()
+            if entry in first_seen:
+                index = first_seen[entry]
+                weights[index] = max(weights[index], weights[position])
+            else:
+                first_seen[entry] = position
+        positions = np.fromiter(first_seen.values(), dtype=np.int64, count=len(first_seen))
+        words = list(first_seen)
+        
+        order = sorted(range(len(words)), key=words.__getitem__)
+        self.entries = [words[i] for i in order]
+        self.weights = weights[positions[order]]
+        
+        # Rank 0 is the best entry: highest weight, then earliest in the input
+        ranking = np.lexsort((positions[order], -self.weights))
+        self._rank = np.empty(len(ranking), dtype=np.int64)
+        self._rank[ranking] = np.arange(len(ranking))
+        self._slot_of_rank = ranking
+        
+        self._size = 1
+        while self._size < max(1, len(self.entries)):
+            self._size *= 2
+        self._tree = self._build_tree()
+    
+    def _build_tree(self) -> np.ndarray:
+        """Build the array-based min tree bottom-up, one level at a time."""
+        tree = np.full(2 * self._size, np.iinfo(np.int64).max, dtype=np.int64)
+        tree[self._size:self._size + len(self._rank)] = self._rank
+        
+        level = self._size
+        while level > 1:
+            parents = np.arange(level // 2, level)
+            tree[parents] = np.minimum(tree[2 * parents], tree[2 * parents + 1])
+            level //= 2
+        return tree
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def prefix_range(self, prefix: str):
+        """Get the [lo, hi) slice of entries that start with prefix."""
+        lo = bisect_left(self.entries, prefix)
+        # "\uffff" sorts after every character used in the lexicon
+        hi = bisect_left(self.entries, prefix + "\uffff", lo)
+        return lo, hi
+    
+    def _best_rank(self, lo, hi) -> int:
+        """Smallest rank in entries[lo:hi]."""
+        best = np.iinfo(np.int64).max
+        tree = self._tree
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                best = min(best, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = min(best, tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return int(best)
+    
+    def top_k(self, prefix: str, k: int, exclude_exact: bool = True) -> list:
+        """Get the k best entries starting with prefix, best first."""
+        lo, hi = self.prefix_range(prefix)
+        if exclude_exact and lo < hi and self.entries[lo] == prefix:
+            lo += 1
+        if lo >= hi or k <= 0:
+            return []
+        
+        # Best-first search over ranges: pop the best entry, split its range around it
+        heap = [(self._best_rank(lo, hi), lo, hi)]
+        results = []
+        while heap and len(results) < k:
+            rank, lo, hi = heapq.heappop(heap)
+            slot = int(self._slot_of_rank[rank])
+            results.append(self.entries[slot])
+            
+            for start, end in ((lo, slot), (slot + 1, hi)):
+                if start < end:
+                    heapq.heappush(heap, (self._best_rank(start, end), start, end))
+        return results
+
+def load_lexicon(path):
+    """Load a lexicon file with one word or phrase per line and an optional tab-separated count."""
+    entries, weights = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            
+            entry, _, count = line.partition("\t")
+            entries.append(entry.strip().upper())
+            weights.append(float(count) if count.strip() else 1.0)
+    return entries, weights
+
 class WordRecommender:
-    def __init__(self, word_dict=None, limit=5):
-        """Initialize word recommender."""
+    def __init__(self, word_dict=None, limit=5, weights=None, lexicon_path=None, ngram_model=None,
+                 phrase_context=3):
+        """Initialize word recommender.
+
+        With an NGramModel, recommendations take the preceding words into
+        account and a next word is predicted before any letter is signed.
+        """
+        if lexicon_path:
+            word_dict, weights = load_lexicon(lexicon_path)
+            logger.info(f"Loaded {len(word_dict)} lexicon entries from {Path(lexicon_path).name}")
+        
         self.word_dict = word_dict or WORD_DICT
         self.limit = limit
+        self.index = PrefixIndex(self.word_dict, weights)
+        self.ngram_model = ngram_model
+        self.phrase_context = phrase_context
     
-    def get_recommendations(self, current_word: str) -> list:
-        """Get word recommendations based on current input."""
-        if not current_word:
+    def get_recommendations(self, current_word: str, context=None) -> list:
+        """Get word recommendations for the word being spelled after the given preceding words."""
+        prefix = (current_word or "").upper()
+        context = [word.upper() for word in context or []]
+        if not prefix and not context:
             return []
         
-        current_word = current_word.upper()
-        matches = [
-            word for word in self.word_dict 
-            if word.startswith(current_word) and word != current_word
-        ]
+        recommendations = []
+        
+        def add(candidate):
+            if candidate and candidate != prefix and candidate not in recommendations:
+                recommendations.append(candidate)
+        
+        # Lexicon phrases the recent words have started, e.g. "I NEED H" -> "HELP"
+        for start in range(max(0, len(context) - self.phrase_context), len(context)):
+            typed = " ".join(context[start:] + [prefix])
+            for entry in self.index.top_k(typed, self.limit):
+                add(entry[len(typed) - len(prefix):])
+        
+        if self.ngram_model is not None:
+            predicted = self.ngram_model.predict(context, prefix, self.limit)
+            for position, word in enumerate(predicted):
+                add(word)
+                
+                # Offer the likely rest of the phrase after the best word
+                if position == 0:
+                    extension = self.ngram_model.continue_phrase(context + [word])
+                    if extension:
+                        add(" ".join([word] + extension))
+        
+        if prefix:
+            for entry in self.index.top_k(prefix, self.limit):
+                add(entry)
         
-        return matches[:self.limit]
+        return recommendations[:self.limit]
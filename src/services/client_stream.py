@@ -0,0 +1,147 @@
+import time
+import threading
+import logging
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class ClientFrameStream:
+    def __init__(self, stream_id: str, recognizer=None, worker_pool=None,
+                 on_result: Optional[Callable[[dict], None]] = None, result_timeout=2.0):
+        """Initialize recognition of JPEG frames sent by one client connection.
+
+        Frames are recognized one at a time on a dedicated thread, either
+        in process by recognizer or by worker_pool as stream_id. While one
+        frame is being recognized, a newer frame replaces the pending one,
+        so a client sending faster than recognition runs loses its stale
+        frames instead of building up a backlog. on_result receives the
+        event of every recognized frame.
+        """
+        self.stream_id = stream_id
+        self.recognizer = recognizer
+        self.worker_pool = worker_pool
+        self.on_result = on_result
+        self.result_timeout = result_timeout
+        
+        self._cond = threading.Condition()
+        self._pending = None
+        self._closed = False
+        self._thread = None
+        self._result = None
+        self._result_ready = threading.Event()
+        
+        # Counters
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.frames_processed = 0
+        self.decode_errors = 0
+        self.processing_errors = 0
+        self.last_latency = 0.0
+        
+        if worker_pool is not None:
+            worker_pool.add_handler(stream_id, self._handle_worker_result)
+    
+    def start(self):
+        """Start the recognition thread."""
+        self._thread = threading.Thread(
+            target=self._run, name=f"client-stream-{self.stream_id[:8]}", daemon=True
+        )
+        self._thread.start()
+    
+    def push(self, data: bytes):
+        """Queue an encoded frame, replacing one that has not been picked up yet."""
+        with self._cond:
+            self.frames_received += 1
+            if self._pending is not None:
+                self.frames_dropped += 1
+            self._pending = (data, self.frames_received, time.time())
+            self._cond.notify()
+    
+    def close(self):
+        """Stop the recognition thread and release the stream's worker state."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        
+        if self._thread is not None:
+            self._thread.join(timeout=self.result_timeout + 1.0)
+            self._thread = None
+        
+        if self.worker_pool is not None:
+            self.worker_pool.remove_handler(self.stream_id)
+            self.worker_pool.close_stream(self.stream_id)
+    
+    def _run(self):
+        """Recognize the newest pending frame until closed."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._pending is not None)
+                if self._closed:
+                    return
+                data, seq, received_at = self._pending
+                self._pending = None
+            
+            # Decode straight from the received message without copying it
+            frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is None:
+                self.decode_errors += 1
+                continue
+            
+            try:
+                event = self._recognize(frame, seq)
+            except Exception as e:
+                self.processing_errors += 1
+                logger.error(f"Error recognizing client frame: {e}")
+                continue
+            
+            if event is None:
+                continue
+            self.frames_processed += 1
+            self.last_latency = time.time() - received_at
+            
+            if self.on_result is not None:
+                try:
+                    self.on_result(event)
+                except Exception as e:
+                    logger.error(f"Client stream result handler failed: {e}")
+    
+    def _recognize(self, frame, seq) -> Optional[dict]:
+        """Run a frame through the recognizer or the stream's worker."""
+        if self.worker_pool is None:
+            _, event = self.recognizer.recognize(frame, seq)
+            return event
+        
+        self._result_ready.clear()
+        if not self.worker_pool.submit(self.stream_id, frame, seq):
+            # The worker's slots are busy with other streams
+            self.frames_dropped += 1
+            return None
+        
+        deadline = time.time() + self.result_timeout
+        while self._result_ready.wait(max(0.0, deadline - time.time())):
+            self._result_ready.clear()
+            # Skip a late result for a frame that already timed out
+            if self._result["seq"] == seq:
+                return self._result
+        self.processing_errors += 1
+        return None
+    
+    def _handle_worker_result(self, stream_id, event, frame):
+        """Hand a worker's event back to the recognition thread."""
+        self._result = event
+        self._result_ready.set()
+    
+    @property
+    def stats(self):
+        """Get per-connection counters."""
+        return {
+            "frames_received": self.frames_received,
+            "frames_dropped": self.frames_dropped,
+            "frames_processed": self.frames_processed,
+            "decode_errors": self.decode_errors,
+            "processing_errors": self.processing_errors,
+            "last_latency_ms": round(self.last_latency * 1000, 1)
+        }
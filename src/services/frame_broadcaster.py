@@ -0,0 +1,205 @@
+import cv2
+import time
+import threading
+import logging
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class StreamTier(NamedTuple):
+    name: str
+    width: int  # 0 keeps the source width
+    quality: int
+
+def parse_stream_tiers(spec: str, default_quality=80) -> List[StreamTier]:
+    """Parse "name:width:quality,..." into tiers, largest first.
+
+    An empty spec gives a single full-size "full" tier at default_quality.
+    """
+    tiers = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, width, quality = entry.split(":")
+        tiers.append(StreamTier(name, int(width), int(quality)))
+    if not tiers:
+        tiers.append(StreamTier("full", 0, default_quality))
+    return sorted(tiers, key=lambda tier: (tier.width == 0, tier.width, tier.quality), reverse=True)
+
+class _TierState:
+    def __init__(self):
+        """Initialize the latest encoded chunk and subscriber caps of one tier."""
+        self.chunk = None
+        self.seq = 0
+        self.fps_caps: List[Optional[float]] = []
+        self.last_encoded = 0.0
+
+        # Counters
+        self.frames_encoded = 0
+        self.encode_time = 0.0
+
+    def min_interval(self) -> float:
+        """Seconds between encodes needed by the fastest subscriber."""
+        if not self.fps_caps or None in self.fps_caps:
+            return 0.0
+        return 1.0 / max(self.fps_caps)
+
+class FrameBroadcaster:
+    def __init__(self, tiers: Optional[List[StreamTier]] = None, subscriber_timeout=5.0):
+        """Initialize broadcast hub for encoded video frames.
+
+        Frames are published raw and encoded lazily: once per tier that
+        has subscribers, no faster than its fastest subscriber's fps cap,
+        and not at all while nobody watches. Every subscriber of a tier
+        shares the same encoded multipart chunk.
+        """
+        self.tiers = tiers or parse_stream_tiers("")
+        self.subscriber_timeout = subscriber_timeout
+        self._cond = threading.Condition()
+        self._states: Dict[str, _TierState] = {tier.name: _TierState() for tier in self.tiers}
+        self._closed = False
+
+        # Counters
+        self.subscribers = 0
+        self.frames_published = 0
+        self.frames_unwatched = 0
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+    def select_tier(self, name: Optional[str] = None, max_width: Optional[int] = None,
+                    max_quality: Optional[int] = None) -> StreamTier:
+        """Pick a tier by name, or the largest one within the width and quality caps.
+
+        Falls back to the smallest tier when none fits the caps.
+        """
+        for tier in self.tiers:
+            if tier.name == name:
+                return tier
+
+        for tier in self.tiers:
+            if max_width and (tier.width == 0 or tier.width > max_width):
+                continue
+            if max_quality and tier.quality > max_quality:
+                continue
+            return tier
+        return self.tiers[-1] if (max_width or max_quality) else self.tiers[0]
+
+    def publish(self, frame) -> int:
+        """Publish a new frame; returns the number of tiers it was encoded for."""
+        with self._cond:
+            self.frames_published += 1
+            now = time.time()
+            due = [
+                tier for tier in self.tiers
+                if self._states[tier.name].fps_caps
+                and now - self._states[tier.name].last_encoded >= self._states[tier.name].min_interval()
+            ]
+            if not due:
+                self.frames_unwatched += 1
+                return 0
+
+        # Encode outside the lock so subscribers keep streaming meanwhile
+        encoded = []
+        for tier in due:
+            started = time.perf_counter()
+            chunk = self._encode(frame, tier)
+            if chunk is not None:
+                encoded.append((tier, chunk, time.perf_counter() - started))
+
+        with self._cond:
+            for tier, chunk, elapsed in encoded:
+                state = self._states[tier.name]
+                state.chunk = chunk
+                state.seq += 1
+                state.last_encoded = now
+                state.frames_encoded += 1
+                state.encode_time += elapsed
+            self._cond.notify_all()
+        return len(encoded)
+
+    @staticmethod
+    def _encode(frame, tier: StreamTier) -> Optional[bytes]:
+        """Encode a frame for a tier as one multipart chunk."""
+        height, width = frame.shape[:2]
+        if tier.width and width > tier.width:
+            frame = cv2.resize(frame, (tier.width, height * tier.width // width), interpolation=cv2.INTER_AREA)
+
+        ret, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), tier.quality])
+        if not ret:
+            return None
+
+        # One copy of the JPEG into the chunk, straight from the encoder's buffer
+        header = b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % buffer.nbytes
+        return b''.join((header, buffer, b'\r\n'))
+
+    def subscribe(self, tier: Optional[StreamTier] = None, max_fps: Optional[float] = None) -> Iterator[bytes]:
+        """Yield the newest frame of a tier each time one is encoded.
+
+        Subscribers that fall behind jump straight to the latest frame
+        instead of queueing, so a slow client never holds up the publisher.
+        max_fps caps how often this subscriber gets a frame.
+        """
+        tier = tier or self.tiers[0]
+        min_interval = 1.0 / max_fps if max_fps else 0.0
+        with self._cond:
+            state = self._states[tier.name]
+            state.fps_caps.append(max_fps)
+            self.subscribers += 1
+            last_seq = state.seq
+
+        try:
+            while True:
+                with self._cond:
+                    ready = self._cond.wait_for(
+                        lambda: self._closed or state.seq > last_seq,
+                        timeout=self.subscriber_timeout
+                    )
+                    if self._closed:
+                        return
+                    if not ready:
+                        continue
+
+                    if state.seq - last_seq > 1:
+                        self.frames_skipped += state.seq - last_seq - 1
+                    chunk, last_seq = state.chunk, state.seq
+                    self.frames_sent += 1
+
+                sent_at = time.time()
+                yield chunk
+
+                if min_interval:
+                    time.sleep(max(0.0, min_interval - (time.time() - sent_at)))
+
+        finally:
+            with self._cond:
+                state.fps_caps.remove(max_fps)
+                self.subscribers -= 1
+
+    def close(self):
+        """Stop all subscribers."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def stats(self):
+        """Get broadcast counters."""
+        with self._cond:
+            return {
+                "subscribers": self.subscribers,
+                "frames_published": self.frames_published,
+                "frames_unwatched": self.frames_unwatched,
+                "frames_sent": self.frames_sent,
+                "frames_skipped": self.frames_skipped,
+                "tiers": {
+                    tier.name: {
+                        "width": tier.width,
+                        "quality": tier.quality,
+                        "subscribers": len(self._states[tier.name].fps_caps),
+                        "frames_encoded": self._states[tier.name].frames_encoded,
+                        "encode_ms": round(
+                            self._states[tier.name].encode_time
+                            / max(1, self._states[tier.name].frames_encoded) * 1000, 2
+                        )
+                    }
+                    for tier in self.tiers
+                }
+            }
@@ -0,0 +1,130 @@
+import threading
+import time
+import logging
+import numpy as np
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class FrameRingBuffer:
+    def __init__(self, capacity=2):
+        """Initialize a ring buffer that keeps only the newest frames."""
+        if capacity < 2:
+            raise ValueError("Frame ring buffer needs at least 2 slots")
+
+        self.capacity = capacity
+        self._slots = None
+        self._slot_seq = [0] * capacity
+        self._slot_time = [0.0] * capacity
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # Single writer / single reader bookkeeping
+        self._write_seq = 0
+        self._write_slot = None
+        self._latest_slot = None
+        self._latest_time = 0.0
+        self._read_seq = 0
+        self._leased_slot = None
+
+        # Counters
+        self.frames_written = 0
+        self.frames_read = 0
+        self.frames_dropped = 0
+
+    def _allocate(self, shape, dtype):
+        """Allocate slot storage for frames of the given shape."""
+        self._slots = np.empty((self.capacity,) + tuple(shape), dtype=dtype)
+        self._slot_seq = [0] * self.capacity
+        self._latest_slot = None
+        self._leased_slot = None
+        logger.info(f"Frame ring buffer allocated {self.capacity} slots of shape {tuple(shape)}")
+
+    def begin_write(self, shape, dtype=np.uint8) -> np.ndarray:
+        """Reserve the oldest free slot and return it for the writer to fill in place."""
+        with self._cond:
+            if (self._slots is None or self._slots.shape[1:] != tuple(shape)
+                    or self._slots.dtype != dtype):
+                self._allocate(shape, dtype)
+
+            # Oldest slot that is neither leased to the reader nor the newest frame
+            candidates = [
+                i for i in range(self.capacity)
+                if i != self._leased_slot and i != self._latest_slot
+            ]
+            if not candidates:
+                candidates = [i for i in range(self.capacity) if i != self._leased_slot]
+            slot = min(candidates, key=lambda i: self._slot_seq[i])
+            if slot == self._latest_slot:
+                # With two slots the newest frame is reclaimed while the reader
+                # holds the other one; the reader waits for the next commit
+                self._latest_slot = None
+
+            # Overwriting a frame the reader never saw counts as a drop
+            if self._slot_seq[slot] > self._read_seq:
+                self.frames_dropped += 1
+            self._slot_seq[slot] = 0
+            self._write_slot = slot
+            return self._slots[slot]
+
+    def commit_write(self, timestamp: Optional[float] = None) -> int:
+        """Publish the slot filled since begin_write() as the newest frame."""
+        with self._cond:
+            if self._write_slot is None:
+                raise RuntimeError("commit_write() called without begin_write()")
+
+            self._write_seq += 1
+            slot = self._write_slot
+            self._slot_seq[slot] = self._write_seq
+            self._slot_time[slot] = timestamp if timestamp is not None else time.time()
+            self._latest_slot = slot
+            self._latest_time = self._slot_time[slot]
+            self._write_slot = None
+            self.frames_written += 1
+            self._cond.notify_all()
+            return self._write_seq
+
+    def read_latest(self, timeout: Optional[float] = None) -> Tuple[int, Optional[np.ndarray]]:
+        """Wait for a frame newer than the last one read and lease it to the caller.
+
+        The returned array is a view into the ring and stays valid until the
+        next call to read_latest().
+        """
+        with self._cond:
+            self._leased_slot = None
+            ready = self._cond.wait_for(
+                lambda: self._closed or (self._latest_slot is not None
+                                         and self._write_seq > self._read_seq),
+                timeout=timeout
+            )
+            if not ready or self._closed or self._latest_slot is None:
+                return 0, None
+
+            slot = self._latest_slot
+            self._read_seq = self._slot_seq[slot]
+            self._leased_slot = slot
+            self.frames_read += 1
+            return self._read_seq, self._slots[slot]
+
+    def latest_timestamp(self) -> float:
+        """Get the capture time of the newest frame."""
+        with self._cond:
+            return self._latest_time
+
+    def close(self):
+        """Wake up any waiting reader and stop handing out frames."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def stats(self):
+        """Get buffer counters."""
+        with self._cond:
+            return {
+                "capacity": self.capacity,
+                "latest_seq": self._write_seq,
+                "frames_written": self.frames_written,
+                "frames_read": self.frames_read,
+                "frames_dropped": self.frames_dropped
+            }
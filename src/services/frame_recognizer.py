@@ -0,0 +1,122 @@
+import cv2
+import time
+import logging
+
+from .prediction_scheduler import PredictionScheduler, RUN, REUSE
+
+logger = logging.getLogger(__name__)
+
+def prepare_model_input(hand_roi, target_size=(64, 64)):
+    """Resize and normalize a hand canvas into a model input batch of one."""
+    processed = cv2.resize(hand_roi, target_size)
+    return (processed.astype("float32") / 255.0).reshape(1, target_size[1], target_size[0], 3)
+
+def summarize_event(event, include_landmarks=True) -> dict:
+    """JSON-safe view of a recognition event for clients (without the probability vector)."""
+    summary = {
+        "seq": event["seq"],
+        "timestamp": event["timestamp"],
+        "hand_detected": event["hand_detected"],
+        "letter": event["predicted_letter"],
+        "confidence": float(event["confidence"]),
+        "reused": event["reused"]
+    }
+    if include_landmarks:
+        summary["landmarks"] = event["landmarks"]
+        summary["bbox"] = event["bbox"]
+        summary["frame_size"] = event["frame_size"]
+    return summary
+
+class FrameRecognizer:
+    def __init__(self, hand_detector, sign_model, scheduler=None, canvas_size=400,
+                 model_input_size=(64, 64), hand_encoder=None):
+        """Initialize hand detection and letter prediction for one stream of frames.
+
+        Holds the per-stream state (the detector's tracking and the
+        prediction scheduler), so each camera or client stream needs its
+        own instance; the model can be shared. hand_encoder, when given,
+        maps a detected hand straight to the model input and replaces the
+        canvas drawing and resizing path. Streams that already have the
+        landmarks pass no hand_detector and call recognize_hand().
+        """
+        self.hand_detector = hand_detector
+        self.sign_model = sign_model
+        self.scheduler = scheduler or PredictionScheduler(adaptive=False, cpu_budget=1.0)
+        self.canvas_size = canvas_size
+        self.model_input_size = model_input_size
+        self.hand_encoder = hand_encoder
+        
+        # Counters
+        self.predictions_made = 0
+        self.predictions_reused = 0
+    
+    def _model_input(self, frame, hand):
+        """Build the model input for a detected hand."""
+        if self.hand_encoder is not None:
+            return self.hand_encoder(hand)
+        
+        hand_roi = self.hand_detector.extract_hand_roi(frame, hand, self.canvas_size)
+        try:
+            return prepare_model_input(hand_roi, self.model_input_size)
+        except Exception as e:
+            logger.error(f"Error processing hand ROI: {e}")
+            return None
+    
+    def recognize(self, frame, seq=0):
+        """Run hand detection and prediction on a frame.
+
+        Returns the annotated frame and a recognition event describing it.
+        """
+        hands, frame = self.hand_detector.detect_hands(frame)
+        return frame, self.recognize_hand(hands[0] if hands else None, seq, frame)
+    
+    def recognize_hand(self, hand, seq=0, frame=None, timestamp=None) -> dict:
+        """Run prediction on a detected hand (None when there is none) and get its recognition event.
+
+        frame is only needed by the canvas drawing path; its size, when
+        given, tells clients what the landmark coordinates refer to.
+        """
+        event = {
+            "seq": seq,
+            "timestamp": timestamp or time.time(),
+            "hand_detected": False,
+            "predicted_letter": None,
+            "confidence": 0.0,
+            "probabilities": None,
+            "reused": False,
+            "landmarks": None,
+            "bbox": None,
+            "frame_size": [frame.shape[1], frame.shape[0]] if frame is not None else None
+        }
+        
+        if hand is None:
+            self.scheduler.reset()
+            return event
+        
+        event["hand_detected"] = True
+        event["landmarks"] = [[int(point[0]), int(point[1])] for point in hand['lmList']]
+        event["bbox"] = [int(value) for value in hand['bbox']]
+        
+        decision = self.scheduler.decide(hand)
+        if decision == RUN:
+            processed_roi = self._model_input(frame, hand)
+            if processed_roi is not None:
+                started = time.perf_counter()
+                probabilities = self.sign_model.predict_proba(processed_roi)
+                self.predictions_made += 1
+                result = None
+                if probabilities is not None:
+                    # Keep the full distribution for decoders that fuse it with a language prior
+                    predicted_letter, confidence = self.sign_model.decode(probabilities)
+                    result = (predicted_letter, confidence, probabilities)
+                self.scheduler.record(result, time.perf_counter() - started)
+                if result is not None:
+                    event["predicted_letter"], event["confidence"], event["probabilities"] = result
+        
+        elif decision == REUSE and self.scheduler.last_result is not None:
+            # The pose has not changed since the last prediction
+            event["predicted_letter"], event["confidence"], event["probabilities"] = self.scheduler.last_result
+            event["reused"] = True
+            self.predictions_reused += 1
+        
+        return event
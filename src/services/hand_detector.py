@@ -6,10 +6,15 @@ from cvzone.HandTrackingModule import HandDetector
 logger = logging.getLogger(__name__)
 
 class HandDetectionService:
-    def __init__(self, max_hands=1, detection_confidence=0.7):
-        """Initialize hand detection service."""
+    def __init__(self, max_hands=1, detection_confidence=0.7, draw=True):
+        """Initialize hand detection service.
+
+        draw controls whether the detector paints the hand overlay into the
+        frame; without it detect_hands returns the frame untouched.
+        """
         self.max_hands = max_hands
         self.detection_confidence = detection_confidence
+        self.draw = draw
         self.detector = HandDetector(
             maxHands=max_hands, 
             detectionCon=detection_confidence
@@ -19,12 +24,21 @@ class HandDetectionService:
     def detect_hands(self, frame):
         """Detect hands in the given frame."""
         try:
-            hands, processed_frame = self.detector.findHands(frame, draw=True, flipType=False)
-            return hands, processed_frame
+            return self._find_hands(self.detector, frame)
         except Exception as e:
             logger.error(f"Hand detection failed: {e}")
             return [], frame
     
+    def _find_hands(self, detector, frame):
+        """Run a cvzone detector and get the hands and the (annotated) frame."""
+        result = detector.findHands(frame, draw=self.draw, flipType=False)
+        if self.draw:
+            return result
+        
+        # Depending on the cvzone version, draw=False returns hands or (hands, image)
+        hands = result[0] if isinstance(result, tuple) else result
+        return hands or [], frame
+    
     def extract_hand_roi(self, frame, hand_info, canvas_size=400):
         """Extract and process hand region of interest."""
         try:
@@ -0,0 +1,115 @@
+import json
+import threading
+import logging
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+class HandOverlayFeed:
+    def __init__(self, heartbeat_interval=15.0, retry_ms=1000):
+        """Initialize the hand landmark side channel of the camera stream.
+
+        Instead of the server drawing the hand into every video frame, each
+        recognition event is reduced to the frame size, bbox and landmarks
+        and pushed to the page as a server-sent event, where it is drawn on
+        a canvas over the video. A message is built once per event and
+        shared by all connections, not at all while nobody listens, and
+        consecutive frames without a hand send a single update. Connections
+        that fall behind skip to the newest update.
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_ms = retry_ms
+        self._cond = threading.Condition()
+        self._message = None
+        self._seq = 0
+        self._hand_shown = False
+        self._closed = False
+        
+        # Counters
+        self.subscribers = 0
+        self.updates_published = 0
+        self.updates_unwatched = 0
+        self.updates_sent = 0
+        self.updates_skipped = 0
+        self.bytes_sent = 0
+    
+    @staticmethod
+    def format_update(event) -> str:
+        """Encode the hand of a recognition event as one SSE message."""
+        payload = {"seq": event["seq"], "frame_size": event.get("frame_size"), "bbox": None, "landmarks": None}
+        if event["hand_detected"]:
+            payload["bbox"] = event["bbox"]
+            payload["landmarks"] = event["landmarks"]
+            payload["letter"] = event["predicted_letter"]
+        return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+    
+    def publish(self, event):
+        """Push the hand of a recognition event to all connections."""
+        with self._cond:
+            if not event["hand_detected"] and not self._hand_shown:
+                # The page already shows no hand
+                return
+            self._hand_shown = event["hand_detected"]
+            if not self.subscribers:
+                self.updates_unwatched += 1
+                self._message = None
+                return
+        
+        message = self.format_update(event)
+        with self._cond:
+            self._message = message
+            self._seq += 1
+            self.updates_published += 1
+            self._cond.notify_all()
+    
+    def stream(self) -> Iterator[str]:
+        """Yield SSE messages with the newest hand until the client disconnects."""
+        with self._cond:
+            self.subscribers += 1
+            # Make the next frame refresh the page even if the hand is gone
+            self._hand_shown = True
+            last_seq = self._seq
+        
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+            while True:
+                with self._cond:
+                    ready = self._cond.wait_for(
+                        lambda: self._closed or self._seq > last_seq,
+                        timeout=self.heartbeat_interval
+                    )
+                    if self._closed:
+                        return
+                    if not ready:
+                        message = ": keepalive\n\n"
+                    else:
+                        if self._seq - last_seq > 1:
+                            self.updates_skipped += self._seq - last_seq - 1
+                        message, last_seq = self._message, self._seq
+                        self.updates_sent += 1
+                    self.bytes_sent += len(message)
+                
+                yield message
+        
+        finally:
+            with self._cond:
+                self.subscribers -= 1
+    
+    def close(self):
+        """Stop all connections."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+    
+    @property
+    def stats(self):
+        """Get side channel counters."""
+        with self._cond:
+            return {
+                "subscribers": self.subscribers,
+                "updates_published": self.updates_published,
+                "updates_unwatched": self.updates_unwatched,
+                "updates_sent": self.updates_sent,
+                "updates_skipped": self.updates_skipped,
+                "bytes_sent": self.bytes_sent
+            }
@@ -0,0 +1,163 @@
+import time
+import logging
+import numpy as np
+from cvzone.HandTrackingModule import HandDetector
+
+from .hand_detector import HandDetectionService
+
+logger = logging.getLogger(__name__)
+
+class HandTracker(HandDetectionService):
+    def __init__(self, max_hands=1, detection_confidence=0.7, max_box_change=0.5, roi_margin=0.5,
+                 min_roi_size=160, velocity_smoothing=0.5, redetect_interval=60, draw=True):
+        """Initialize hand tracking that searches only around the predicted hand position.
+
+        After a detection, the next bounding box is predicted from the
+        smoothed velocity of the hand center, and landmarks are estimated on
+        a crop around it (the box grown by roi_margin on each side plus the
+        expected motion, at least min_roi_size pixels). Tracking falls back
+        to full-frame detection on the same frame when the hand is not found
+        in the crop, touches its border, or its box is not consistent with
+        the tracked one (its size, or its center relative to the predicted
+        center, moved by more than max_box_change of the previous box size),
+        and every redetect_interval frames. Tracking needs max_hands=1; with
+        more hands every frame is a full-frame detection.
+        """
+        super().__init__(max_hands=max_hands, detection_confidence=detection_confidence, draw=draw)
+        self.max_box_change = max_box_change
+        self.roi_margin = roi_margin
+        self.min_roi_size = min_roi_size
+        self.velocity_smoothing = velocity_smoothing
+        self.redetect_interval = redetect_interval
+        
+        # Separate landmark state for crops so the full-frame detector keeps its own tracking
+        self.roi_detector = HandDetector(maxHands=1, detectionCon=detection_confidence)
+        
+        self._bbox = None
+        self._velocity = np.zeros(2)
+        self._frames_since_detection = 0
+        
+        # Counters
+        self.frames_tracked = 0
+        self.full_detections = 0
+        self.tracking_lost = 0
+        self.roi_time = 0.0
+        self.full_time = 0.0
+    
+    def _predicted_center(self) -> np.ndarray:
+        """Where the center of the tracked box is expected in this frame."""
+        x, y, w, h = self._bbox
+        return np.array([x + w / 2, y + h / 2]) + self._velocity
+    
+    def _predict_roi(self, frame_shape):
+        """Crop window around where the hand is expected in this frame."""
+        x, y, w, h = self._bbox
+        center = self._predicted_center()
+        side = max(w, h) * (1 + 2 * self.roi_margin) + 2 * np.abs(self._velocity).max()
+        side = max(side, self.min_roi_size)
+        
+        frame_h, frame_w = frame_shape[:2]
+        x0 = int(np.clip(center[0] - side / 2, 0, max(0, frame_w - side)))
+        y0 = int(np.clip(center[1] - side / 2, 0, max(0, frame_h - side)))
+        return x0, y0, min(frame_w, x0 + int(side)), min(frame_h, y0 + int(side))
+    
+    def _box_consistent(self, bbox) -> bool:
+        """Whether a full-frame box found in the crop plausibly is the tracked hand.
+
+        A crop that cuts off fingers or catches the other hand gives a box
+        that jumps in size or position, so this is used as the tracking
+        quality check.
+        """
+        x, y, w, h = bbox
+        _, _, pw, ph = self._bbox
+        size = max(pw, ph, 1)
+        
+        scale = max(w, h) / size
+        if not 1 / (1 + self.max_box_change) <= scale <= 1 + self.max_box_change:
+            return False
+        
+        drift = np.array([x + w / 2, y + h / 2]) - self._predicted_center()
+        return np.hypot(*drift) <= self.max_box_change * size
+    
+    def _track(self, frame):
+        """Find the hand in the predicted crop; None when tracking is not confident."""
+        x0, y0, x1, y1 = self._predict_roi(frame.shape)
+        # The detector draws into the crop, so only then does it need its own copy
+        crop = frame[y0:y1, x0:x1]
+        if self.draw:
+            crop = crop.copy()
+        
+        hands, annotated = self._find_hands(self.roi_detector, crop)
+        if not hands:
+            return None
+        
+        hand = hands[0]
+        x, y, w, h = hand['bbox']
+        crop_h, crop_w = crop.shape[:2]
+        if x <= 0 or y <= 0 or x + w >= crop_w or y + h >= crop_h:
+            # Partly outside the crop; landmarks near the border are unreliable
+            return None
+        if not self._box_consistent((x + x0, y + y0, w, h)):
+            return None
+        
+        # Back to full-frame coordinates; the crop is not resized, so z (in pixels like x) stays as is
+        hand['lmList'] = [[px + x0, py + y0, pz] for px, py, pz in hand['lmList']]
+        hand['bbox'] = (x + x0, y + y0, w, h)
+        hand['center'] = (hand['center'][0] + x0, hand['center'][1] + y0)
+        if self.draw:
+            frame[y0:y1, x0:x1] = annotated
+        return hand
+    
+    def _update_motion(self, hand):
+        """Update the tracked box and the smoothed center velocity."""
+        x, y, w, h = hand['bbox']
+        if self._bbox is not None:
+            px, py, pw, ph = self._bbox
+            shift = np.array([x + w / 2 - px - pw / 2, y + h / 2 - py - ph / 2])
+            self._velocity = self.velocity_smoothing * self._velocity + (1 - self.velocity_smoothing) * shift
+        self._bbox = (x, y, w, h)
+    
+    def detect_hands(self, frame):
+        """Detect hands, tracking a single hand through crops when possible."""
+        try:
+            if (self.max_hands == 1 and self._bbox is not None
+                    and self._frames_since_detection < self.redetect_interval):
+                started = time.perf_counter()
+                hand = self._track(frame)
+                self.roi_time += time.perf_counter() - started
+                
+                if hand is not None:
+                    self.frames_tracked += 1
+                    self._frames_since_detection += 1
+                    self._update_motion(hand)
+                    return [hand], frame
+                self.tracking_lost += 1
+            
+            started = time.perf_counter()
+            hands, processed_frame = self._find_hands(self.detector, frame)
+            self.full_time += time.perf_counter() - started
+            self.full_detections += 1
+            self._frames_since_detection = 0
+            
+            if hands:
+                self._update_motion(hands[0])
+            else:
+                self._bbox = None
+                self._velocity = np.zeros(2)
+            return hands, processed_frame
+        
+        except Exception as e:
+            logger.error(f"Hand tracking failed: {e}")
+            self._bbox = None
+            return [], frame
+    
+    @property
+    def stats(self):
+        """Get tracking counters."""
+        return {
+            "frames_tracked": self.frames_tracked,
+            "full_detections": self.full_detections,
+            "tracking_lost": self.tracking_lost,
+            "roi_ms": round(self.roi_time / max(1, self.frames_tracked + self.tracking_lost) * 1000, 2),
+            "full_ms": round(self.full_time / max(1, self.full_detections) * 1000, 2)
+        }
@@ -0,0 +1,75 @@
+import time
+import logging
+from typing import List, Optional
+
+from cvzone.HandTrackingModule import HandDetector
+
+logger = logging.getLogger(__name__)
+
+class LandmarkExtractor:
+    def __init__(self, max_hands=1, detection_confidence=0.5, flip_type=True):
+        """Initialize single-pass hand landmark extraction for the desktop and data collection scripts.
+
+        Those scripts used to detect the hand on the frame, crop around its
+        box and detect it again on the crop to get crop-relative
+        landmarks. Here the frame detection is reused and its landmarks are
+        shifted into crop coordinates instead, so each frame costs one
+        detector call.
+        """
+        self.flip_type = flip_type
+        self.detector = HandDetector(maxHands=max_hands, detectionCon=detection_confidence)
+        
+        # Counters
+        self.detector_calls = 0
+        self.detect_time = 0.0
+    
+    def detect(self, image) -> List[dict]:
+        """Run the detector once and get the cvzone hand dicts."""
+        started = time.perf_counter()
+        result = self.detector.findHands(image, draw=False, flipType=self.flip_type)
+        self.detect_time += time.perf_counter() - started
+        self.detector_calls += 1
+        
+        # Depending on the cvzone version, draw=False returns hands or (hands, image)
+        if isinstance(result, tuple):
+            result = result[0]
+        return result or []
+    
+    @staticmethod
+    def to_crop(landmarks, origin) -> List[list]:
+        """Shift frame landmarks into the coordinates of a crop starting at origin."""
+        x0, y0 = origin
+        return [[point[0] - x0, point[1] - y0] + list(point[2:]) for point in landmarks]
+    
+    def extract(self, frame, offset=0) -> Optional[dict]:
+        """Detect the first hand and map its landmarks into the crop around its box.
+
+        Returns None when no hand is found, else a dict with the cvzone
+        hand, its bbox, the crop origin (x - offset, y - offset), the crop
+        itself and lmList in crop coordinates, which is what a second
+        detection on the crop used to provide. Near the frame edges the
+        crop is clipped to the frame and the origin with it.
+        """
+        hands = self.detect(frame)
+        if not hands:
+            return None
+        
+        hand = hands[0]
+        x, y, w, h = hand['bbox']
+        origin = (max(0, x - offset), max(0, y - offset))
+        crop = frame[origin[1]:y + h + offset, origin[0]:x + w + offset]
+        return {
+            "hand": hand,
+            "bbox": (x, y, w, h),
+            "origin": origin,
+            "crop": crop,
+            "lmList": self.to_crop(hand['lmList'], origin)
+        }
+    
+    @property
+    def stats(self):
+        """Get detector call counters."""
+        return {
+            "detector_calls": self.detector_calls,
+            "detect_ms": round(self.detect_time / max(1, self.detector_calls) * 1000, 2)
+        }
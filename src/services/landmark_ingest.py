@@ -0,0 +1,143 @@
+import time
+import threading
+import logging
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_LANDMARKS = 21
+BATCH_VERSION = 1
+FLAG_FLOAT16 = 0x01
+
+# Batch header: format version, flags and number of records, little-endian
+BATCH_HEADER = np.dtype([("version", "u1"), ("flags", "u1"), ("count", "<u2")])
+
+def record_dtype(float16=False) -> np.dtype:
+    """One hand per record: client timestamp in ms, hand flag and 21 (x, y, z) points in frame pixels."""
+    return np.dtype([
+        ("timestamp_ms", "<u4"),
+        ("hand", "u1"),
+        ("reserved", "u1"),
+        ("points", "<f2" if float16 else "<i2", (NUM_LANDMARKS, 3))
+    ])
+
+RECORD_DTYPES = {False: record_dtype(False), True: record_dtype(True)}
+
+def encode_landmark_batch(records, float16=False) -> bytes:
+    """Pack (timestamp_ms, landmarks or None) pairs into a batch message."""
+    header = np.zeros(1, BATCH_HEADER)
+    header["version"] = BATCH_VERSION
+    header["flags"] = FLAG_FLOAT16 if float16 else 0
+    header["count"] = len(records)
+    
+    body = np.zeros(len(records), RECORD_DTYPES[float16])
+    for i, (timestamp_ms, landmarks) in enumerate(records):
+        body["timestamp_ms"][i] = int(timestamp_ms) & 0xFFFFFFFF
+        if landmarks is not None:
+            points = np.asarray(landmarks)[:, :3]
+            body["hand"][i] = 1
+            body["points"][i, :, :points.shape[1]] = points
+    return header.tobytes() + body.tobytes()
+
+def decode_landmark_batch(data, max_records=256) -> np.ndarray:
+    """Parse a batch message into a structured record array viewing data.
+
+    Raises ValueError for a malformed or oversized batch.
+    """
+    if len(data) < BATCH_HEADER.itemsize:
+        raise ValueError("Landmark batch is shorter than its header")
+    header = np.frombuffer(data, BATCH_HEADER, count=1)[0]
+    if header["version"] != BATCH_VERSION:
+        raise ValueError(f"Unsupported landmark batch version {header['version']}")
+    
+    count = int(header["count"])
+    if count > max_records:
+        raise ValueError(f"Landmark batch has {count} records, at most {max_records} allowed")
+    
+    dtype = RECORD_DTYPES[bool(header["flags"] & FLAG_FLOAT16)]
+    if len(data) != BATCH_HEADER.itemsize + count * dtype.itemsize:
+        raise ValueError("Landmark batch size does not match its record count")
+    return np.frombuffer(data, dtype, count=count, offset=BATCH_HEADER.itemsize)
+
+def hand_from_landmarks(points) -> dict:
+    """Build a cvzone-style hand dict, with the bbox cvzone derives from the landmarks."""
+    landmarks = np.asarray(points).astype(np.int32)
+    x_min, y_min = landmarks[:, :2].min(axis=0)
+    x_max, y_max = landmarks[:, :2].max(axis=0)
+    return {
+        "lmList": landmarks.tolist(),
+        "bbox": (int(x_min), int(y_min), int(x_max - x_min), int(y_max - y_min)),
+        "center": (int(x_min + x_max) // 2, int(y_min + y_max) // 2)
+    }
+
+class LandmarkStream:
+    def __init__(self, recognizer, max_records=256):
+        """Initialize recognition of landmark batches sent by one client.
+
+        The client runs hand detection itself and sends only the 21
+        landmarks per frame, so the server skips JPEG decoding and hand
+        detection. Records are recognized in order through
+        recognizer.recognize_hand (skeleton render or landmark features,
+        prediction scheduler and model).
+        """
+        self.recognizer = recognizer
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._seq = 0
+        
+        # Counters
+        self.batches_received = 0
+        self.records_received = 0
+        self.hands_received = 0
+        self.bytes_received = 0
+        self.batch_errors = 0
+        self.process_time = 0.0
+    
+    def process(self, data) -> List[dict]:
+        """Recognize every record of a batch message and get their events.
+
+        Raises ValueError for a malformed batch.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                records = decode_landmark_batch(data, self.max_records)
+            except ValueError:
+                self.batch_errors += 1
+                raise
+            
+            # Place the records on the server clock relative to the newest one
+            received_at = time.time()
+            newest_ms = int(records["timestamp_ms"][-1]) if len(records) else 0
+            
+            events = []
+            for record in records:
+                self._seq += 1
+                hand = hand_from_landmarks(record["points"]) if record["hand"] else None
+                age_ms = (newest_ms - int(record["timestamp_ms"])) & 0xFFFFFFFF
+                if age_ms >= 1 << 31:
+                    # Out of order record
+                    age_ms = 0
+                event = self.recognizer.recognize_hand(hand, self._seq, timestamp=received_at - age_ms / 1000.0)
+                events.append(event)
+            
+            self.batches_received += 1
+            self.records_received += len(records)
+            self.hands_received += int(np.count_nonzero(records["hand"]))
+            self.bytes_received += len(data)
+            self.process_time += time.perf_counter() - started
+            return events
+    
+    @property
+    def stats(self):
+        """Get per-stream counters."""
+        return {
+            "batches_received": self.batches_received,
+            "records_received": self.records_received,
+            "hands_received": self.hands_received,
+            "bytes_received": self.bytes_received,
+            "batch_errors": self.batch_errors,
+            "process_ms_per_record": round(self.process_time / max(1, self.records_received) * 1000, 3)
+        }
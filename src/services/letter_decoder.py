@@ -0,0 +1,210 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from src.models.word_dictionary import WORD_DICT, PrefixIndex
+from .letter_stabilizer import LetterStabilizer
+
+logger = logging.getLogger(__name__)
+
+class LexiconLetterPrior:
+    def __init__(self, labels, words=None, weights=None, ngram_model=None, context_weight=0.5,
+                 pseudo_words=10.0, cache_size=4096):
+        """Initialize P(next letter | spelled prefix, preceding words) from a lexicon.
+
+        The unconditioned part counts how much lexicon frequency mass
+        continues the prefix with each letter; with an NGramModel, the mass
+        of words seen after the preceding words is mixed in. Both are
+        smoothed towards uniform by pseudo_words average-weight words, so a
+        prefix that few lexicon words share barely constrains the next
+        letter and names stay spellable.
+        """
+        self.labels = list(labels)
+        self.ngram_model = ngram_model
+        self.context_weight = context_weight if ngram_model is not None else 0.0
+        self.pseudo_words = pseudo_words
+        
+        if ngram_model is not None:
+            self.index = ngram_model.vocab
+        else:
+            words = WORD_DICT if words is None else words
+            weights = np.ones(len(words)) if weights is None else np.asarray(weights, dtype=np.float64)
+            singles = [(w.upper(), weight) for w, weight in zip(words, weights) if w.isalpha()]
+            self.index = PrefixIndex([w for w, _ in singles], [weight for _, weight in singles])
+        self._cumulative = np.concatenate([[0.0], np.cumsum(self.index.weights, dtype=np.float64)])
+        self._pseudo_mass = pseudo_words * self._cumulative[-1] / max(1, len(self.index))
+        
+        self.cache_size = cache_size
+        # Shared by every session's decoder across request threads
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _mass(self, prefix: str) -> float:
+        """Total lexicon weight of words starting with prefix."""
+        lo, hi = self.index.prefix_range(prefix)
+        return self._cumulative[hi] - self._cumulative[lo]
+    
+    def _context_mass(self, history, prefix: str) -> float:
+        """Count of words seen after history that start with prefix."""
+        lo, hi = self.index.prefix_range(prefix)
+        if lo >= hi:
+            return 0.0
+        _, counts = self.ngram_model.continuations(history, lo, hi)
+        return float(counts.sum())
+    
+    def _distribution(self, masses, pseudo_mass) -> np.ndarray:
+        """Normalize next-letter masses smoothed towards uniform."""
+        return (masses + pseudo_mass / len(self.labels)) / (masses.sum() + pseudo_mass)
+    
+    def log_probs(self, context, prefix: str) -> np.ndarray:
+        """Get the log prior of every label following prefix."""
+        history = self.ngram_model.context_ids(context) if self.context_weight else []
+        key = (tuple(history), prefix)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        masses = np.array([self._mass(prefix + label) for label in self.labels])
+        probs = self._distribution(masses, self._pseudo_mass)
+        
+        # Back off to shorter histories until the context has seen this prefix
+        for start in range(len(history)):
+            context_masses = np.array([self._context_mass(history[start:], prefix + label)
+                                       for label in self.labels])
+            if context_masses.sum() > 0:
+                # Smooth with the average count of a word seen after this history
+                word_ids, _ = self.ngram_model.continuations(history[start:])
+                pseudo_mass = self.pseudo_words * self.ngram_model.count(history[start:]) / len(word_ids)
+                probs = (1 - self.context_weight) * probs + \
+                    self.context_weight * self._distribution(context_masses, pseudo_mass)
+                break
+        
+        log_probs = np.log(probs)
+        with self._cache_lock:
+            self._cache[key] = log_probs
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return log_probs
+
+class BeamLetterDecoder(LetterStabilizer):
+    def __init__(self, labels, prior=None, beam_width=8, commit_threshold=0.95, min_frames=3,
+                 frame_weight=0.5, evidence_decay=0.9, prior_weight=1.0, **stabilizer_options):
+        """Initialize a beam search over spellings of the current word.
+
+        Per-frame class probabilities are accumulated as decayed
+        log-likelihoods (frame_weight < 1 because consecutive frames are
+        correlated). A letter is committed once its posterior, marginalized
+        over the beam and weighted by the lexicon prior, reaches
+        commit_threshold; otherwise the voting rules of LetterStabilizer
+        apply. Every beam is extended at each commit, so a later letter can
+        revise an earlier ambiguous one.
+        """
+        super().__init__(**stabilizer_options)
+        self.labels = list(labels)
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+        self.prior = prior
+        self.beam_width = beam_width
+        self.commit_threshold = commit_threshold
+        self.min_frames = min_frames
+        self.frame_weight = frame_weight
+        self.evidence_decay = evidence_decay
+        self.prior_weight = prior_weight
+        
+        self.context = []
+        self.beams = [("", 0.0)]
+        self._reset_segment()
+    
+    def _reset_segment(self):
+        """Forget the evidence gathered for the letter being signed."""
+        self._evidence = np.zeros(len(self.labels))
+        self.frames = 0
+        self._posterior = None
+    
+    def _prior(self, prefix: str) -> np.ndarray:
+        """Weighted log prior of each label after prefix."""
+        if self.prior is None:
+            return np.zeros(len(self.labels))
+        return self.prior_weight * self.prior.log_probs(self.context, prefix)
+    
+    def add_prediction(self, predicted_letter: str, probabilities=None, confidence: float = 1.0):
+        """Add a frame's prediction and, when available, its probability vector."""
+        super().add_prediction(predicted_letter, confidence=confidence)
+        if probabilities is None:
+            return
+        
+        probabilities = np.asarray(probabilities, dtype=np.float64).ravel()
+        if len(probabilities) != len(self.labels):
+            return
+        
+        self._evidence *= self.evidence_decay
+        self._evidence += self.frame_weight * np.log(np.clip(probabilities, 1e-6, 1.0))
+        self.frames += 1
+        self._posterior = None
+    
+    def letter_posterior(self):
+        """Posterior of the next letter given the evidence, summed over the beam."""
+        if self._posterior is None and self.frames:
+            scores = np.array([score for _, score in self.beams])
+            joint = (scores - scores.max())[:, None] + \
+                np.stack([self._prior(prefix) for prefix, _ in self.beams]) + self._evidence[None, :]
+            posterior = np.exp(joint - joint.max()).sum(axis=0)
+            self._posterior = posterior / posterior.sum()
+        return self._posterior
+    
+    def get_current_letter(self) -> str:
+        """Get the most probable next letter."""
+        posterior = self.letter_posterior()
+        if posterior is None:
+            return super().get_current_letter()
+        return self.labels[int(np.argmax(posterior))]
+    
+    def should_add_letter(self, current_letter: str) -> bool:
+        """Commit as soon as the posterior is confident, else fall back to stable voting."""
+        posterior = self.letter_posterior()
+        index = self._label_index.get(current_letter)
+        if (posterior is not None and index is not None and self.frames >= self.min_frames
+                and posterior[index] >= self.commit_threshold):
+            return not (current_letter == self.last_added and
+                        time.time() - self.last_added_time < self.letter_cooldown)
+        
+        return super().should_add_letter(current_letter)
+    
+    def add_letter(self, letter: str):
+        """Extend every beam with the letters the evidence supports."""
+        if self.frames:
+            evidence = self._evidence - np.logaddexp.reduce(self._evidence)
+            candidates = []
+            for prefix, score in self.beams:
+                scores = score + self._prior(prefix) + evidence
+                for i in np.argsort(-scores)[:self.beam_width]:
+                    candidates.append((prefix + self.labels[i], float(scores[i])))
+            candidates.sort(key=lambda item: -item[1])
+            self.beams = candidates[:self.beam_width]
+        else:
+            self.beams = [(prefix + letter, score) for prefix, score in self.beams]
+        
+        self._reset_segment()
+        super().add_letter(letter)
+    
+    def decoded_word(self):
+        """Get the best spelling of the current word."""
+        return self.beams[0][0]
+    
+    def sync_text(self, context, current_word: str):
+        """Restart the beam when the sentence was edited outside the decoder."""
+        self.context = list(context)
+        if current_word != self.beams[0][0]:
+            self.beams = [(current_word, 0.0)]
+            self._reset_segment()
+    
+    def reset_state(self):
+        """Reset processing state."""
+        super().reset_state()
+        self.context = []
+        self.beams = [("", 0.0)]
+        self._reset_segment()
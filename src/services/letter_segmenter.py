@@ -0,0 +1,201 @@
+import logging
+from collections import deque
+
+import numpy as np
+
+from .letter_stabilizer import LetterStabilizer
+
+logger = logging.getLogger(__name__)
+
+# State 0 is "between letters"; state i + 1 is "holding labels[i]"
+TRANSITION = 0
+
+class ViterbiLetterSegmenter(LetterStabilizer):
+    def __init__(self, labels, max_lag=6, min_hold=2, commit_margin=2.0, gate=0.12, stay_probability=0.5,
+                 enter_probability=0.5, jump_probability=0.1, frame_weight=1.0, **stabilizer_options):
+        """Initialize streaming hold/transition segmentation of the prediction stream.
+
+        An HMM with one "holding X" state per label and a shared
+        "transition" state is decoded online with Viterbi. A frame's state
+        is fixed as soon as all surviving paths agree on it, and at the
+        latest max_lag frames later. Once min_hold frames of a hold segment
+        are fixed, its letter is committed as soon as the summed frame
+        log-probabilities put it commit_margin ahead of the runner-up, or
+        when the segment ends, so commit time follows the evidence instead
+        of HAND_STABLE_TIME. Leaving a hold state through a transition and
+        coming back starts a new segment, which is how double letters are
+        told apart without LETTER_COOLDOWN.
+
+        gate is the probability the top letter must beat for a frame to
+        look like a hold rather than a transition.
+        """
+        super().__init__(**stabilizer_options)
+        self.labels = list(labels)
+        self.max_lag = max_lag
+        self.min_hold = min_hold
+        self.commit_margin = commit_margin
+        self.frame_weight = frame_weight
+        self._transition_emission = frame_weight * np.log(gate)
+        
+        # The frame probabilities already choose between letters, so moving
+        # into any one hold state costs what moving into "some letter" does
+        size = len(self.labels)
+        stay, enter, jump = stay_probability, enter_probability, jump_probability
+        transitions = np.full((size + 1, size + 1), (1 - stay) * jump)
+        np.fill_diagonal(transitions, stay)
+        transitions[1:, TRANSITION] = (1 - stay) * (1 - jump)
+        transitions[TRANSITION, TRANSITION] = 1 - enter
+        transitions[TRANSITION, 1:] = enter
+        self._log_transitions = np.log(transitions)
+        
+        self._reset_decoder()
+    
+    def _reset_decoder(self):
+        """Forget the Viterbi lattice and the open segment."""
+        self._delta = None
+        self._pointers = deque()
+        self._frames = deque()
+        self._segment_state = TRANSITION
+        self._segment_length = 0
+        self._segment_evidence = np.zeros(len(self.labels))
+        self._segment_committed = False
+        self.pending = deque()
+        
+        # Counters
+        self.frames_seen = 0
+        self.frames_decided = 0
+    
+    def _emissions(self, probabilities) -> np.ndarray:
+        """Log-likelihood of a frame under every state."""
+        emissions = np.empty(len(self.labels) + 1)
+        emissions[TRANSITION] = self._transition_emission
+        emissions[1:] = self.frame_weight * np.log(np.clip(probabilities, 1e-6, 1.0))
+        return emissions
+    
+    def _step(self, emissions):
+        """Advance the lattice by one frame and fix the states that are settled."""
+        self._frames.append(emissions[1:])
+        if self._delta is None:
+            pointers = None
+            delta = emissions.copy()
+            delta[1:] += np.log(0.5)
+        else:
+            scores = self._delta[:, None] + self._log_transitions
+            pointers = scores.argmax(axis=0)
+            delta = scores[pointers, np.arange(len(pointers))] + emissions
+        self._delta = delta - delta.max()
+        self._pointers.append(pointers)
+        self.frames_seen += 1
+        
+        # Trace back the best path; note where all paths have merged
+        path = [int(np.argmax(self._delta))]
+        survivors = np.arange(len(self._delta))
+        merged = -1
+        for k in range(len(self._pointers) - 1, 0, -1):
+            step = self._pointers[k]
+            path.append(int(step[path[-1]]))
+            if merged < 0:
+                survivors = np.unique(step[survivors])
+                if len(survivors) == 1:
+                    merged = k - 1
+        path.reverse()
+        
+        settled = max(merged + 1, len(self._pointers) - self.max_lag)
+        for state in path[:settled]:
+            self._settle(state, self._frames.popleft())
+            self._pointers.popleft()
+    
+    def _settle(self, state, log_probs):
+        """Feed one decided frame to the segment logic."""
+        self.frames_decided += 1
+        if state != self._segment_state:
+            self._close_segment()
+            self._segment_state = state
+        if state == TRANSITION:
+            return
+        
+        self._segment_length += 1
+        self._segment_evidence += log_probs
+        if self._segment_length >= self.min_hold and not self._segment_committed:
+            top, runner_up = np.partition(self._segment_evidence, -2)[-2:][::-1]
+            if top - runner_up >= self.commit_margin:
+                self._commit_segment()
+    
+    def _commit_segment(self):
+        """Queue the letter best supported by the open segment."""
+        self._segment_committed = True
+        self.pending.append(self.labels[int(np.argmax(self._segment_evidence))])
+    
+    def _close_segment(self):
+        """End the open hold segment, committing it if it was held long enough."""
+        if (self._segment_state != TRANSITION and not self._segment_committed
+                and self._segment_length >= self.min_hold):
+            self._commit_segment()
+        self._segment_state = TRANSITION
+        self._segment_length = 0
+        self._segment_evidence = np.zeros(len(self.labels))
+        self._segment_committed = False
+    
+    def add_prediction(self, predicted_letter: str, probabilities=None, confidence: float = 1.0):
+        """Add a frame's prediction to the lattice."""
+        super().add_prediction(predicted_letter, confidence=confidence)
+        
+        if probabilities is None:
+            # Spread the remaining mass when only the top letter is known
+            if predicted_letter not in self.labels:
+                return
+            probabilities = np.full(len(self.labels), (1 - confidence) / max(1, len(self.labels) - 1))
+            probabilities[self.labels.index(predicted_letter)] = confidence
+        
+        probabilities = np.asarray(probabilities, dtype=np.float64).ravel()
+        if len(probabilities) == len(self.labels):
+            self._step(self._emissions(probabilities))
+    
+    def get_current_letter(self) -> str:
+        """Get the next letter to commit, else the letter currently most likely held."""
+        if self.pending:
+            return self.pending[0]
+        if self._delta is None:
+            return ""
+        
+        state = int(np.argmax(self._delta))
+        return self.labels[state - 1] if state != TRANSITION else ""
+    
+    def should_add_letter(self, current_letter: str) -> bool:
+        """Commit letters whose hold segment has been decided, without timers."""
+        return bool(self.pending) and self.pending[0] == current_letter
+    
+    def add_letter(self, letter: str):
+        """Mark the pending letter as added to the sentence."""
+        if self.pending and self.pending[0] == letter:
+            self.pending.popleft()
+        super().add_letter(letter)
+    
+    def hand_lost(self) -> list:
+        """Close the open segment and return letters that were still undecided."""
+        if self._delta is not None:
+            path_end = int(np.argmax(self._delta))
+            path = [path_end]
+            for k in range(len(self._pointers) - 1, 0, -1):
+                path.append(int(self._pointers[k][path[-1]]))
+            for state in reversed(path):
+                self._settle(state, self._frames.popleft())
+            self._close_segment()
+            
+            self._delta = None
+            self._pointers.clear()
+        return list(self.pending)
+    
+    def reset_state(self):
+        """Reset processing state."""
+        super().reset_state()
+        self._reset_decoder()
+    
+    @property
+    def stats(self):
+        """Get segmentation counters."""
+        return {
+            "frames_seen": self.frames_seen,
+            "frames_decided": self.frames_decided,
+            "pending": list(self.pending)
+        }
@@ -0,0 +1,90 @@
+import time
+import logging
+
+from .vote_counter import SlidingVoteCounter
+
+logger = logging.getLogger(__name__)
+
+class LetterStabilizer:
+    def __init__(self, vote_queue_size=6, letter_cooldown=1.2, hand_stable_time=2.0,
+                 no_hand_space_time=4.0, vote_decay=1.0, confidence_weighted=False):
+        """Initialize voting and timing state used to commit letters."""
+        self.vote_queue_size = vote_queue_size
+        self.confidence_weighted = confidence_weighted
+        self.letter_cooldown = letter_cooldown
+        self.hand_stable_time = hand_stable_time
+        self.no_hand_space_time = no_hand_space_time
+        
+        # State variables
+        self.vote_queue = SlidingVoteCounter(vote_queue_size, decay=vote_decay)
+        self.current_letter = ""
+        self.stable_letter = ""
+        self.stable_start_time = 0
+        self.last_added = ""
+        self.last_added_time = 0
+        self.last_hand_time = time.time()
+    
+    def add_prediction(self, predicted_letter: str, probabilities=None, confidence: float = 1.0):
+        """Add prediction to vote queue."""
+        self.vote_queue.append(predicted_letter, confidence if self.confidence_weighted else 1.0)
+    
+    def get_current_letter(self) -> str:
+        """Get current letter based on vote queue."""
+        return self.vote_queue.leader or ""
+    
+    def should_add_letter(self, current_letter: str) -> bool:
+        """Check if letter should be added to sentence."""
+        current_time = time.time()
+        
+        # Check if letter is stable
+        if current_letter != self.stable_letter:
+            self.stable_letter = current_letter
+            self.stable_start_time = current_time
+            return False
+        
+        # Check if stable for required time
+        if current_time - self.stable_start_time < self.hand_stable_time:
+            return False
+        
+        # Check cooldown
+        if (current_letter == self.last_added and 
+            current_time - self.last_added_time < self.letter_cooldown):
+            return False
+        
+        return True
+    
+    def add_letter(self, letter: str):
+        """Add letter to sentence."""
+        current_time = time.time()
+        self.last_added = letter
+        self.last_added_time = current_time
+        self.vote_queue.clear()
+    
+    def decoded_word(self):
+        """Get the decoder's spelling of the current word, or None when letters are appended as voted."""
+        return None
+    
+    def sync_text(self, context, current_word: str):
+        """Follow edits to the sentence made outside the decoder."""
+    
+    def hand_lost(self) -> list:
+        """Get letters that are settled only once the hand leaves the frame."""
+        return []
+    
+    def should_add_space(self) -> bool:
+        """Check if space should be added (no hand detected)."""
+        return time.time() - self.last_hand_time > self.no_hand_space_time
+    
+    def update_last_hand_time(self):
+        """Update the last time a hand was detected."""
+        self.last_hand_time = time.time()
+    
+    def reset_state(self):
+        """Reset processing state."""
+        self.vote_queue.clear()
+        self.current_letter = ""
+        self.stable_letter = ""
+        self.stable_start_time = 0
+        self.last_added = ""
+        self.last_added_time = 0
+        self.last_hand_time = time.time()
@@ -0,0 +1,140 @@
+import time
+import logging
+from collections import deque
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Scheduling decisions
+RUN = "run"
+REUSE = "reuse"
+SKIP = "skip"
+
+class PredictionScheduler:
+    def __init__(self, predict_every=4, adaptive=True, motion_threshold=0.03, static_threshold=0.015,
+                 max_reuse=15, cpu_budget=0.5, budget_window=1.0):
+        """Initialize motion-driven scheduling of model predictions for one stream.
+
+        Landmark displacement is measured relative to the hand's bounding
+        box, so it does not depend on how far the hand is from the camera.
+        While the hand moves more than motion_threshold per frame the model
+        runs on every frame. While the pose stays within static_threshold of
+        the pose at the last prediction, the cached result is reused on the
+        predict_every cadence instead of running the model again, for at
+        most max_reuse predictions in a row. Otherwise the model runs every
+        predict_every frames, as before.
+
+        cpu_budget caps the share of wall time spent in inference over the
+        last budget_window seconds; over budget, a prediction is replaced by
+        the cached result or skipped. With adaptive=False only the fixed
+        predict_every cadence and the budget apply.
+        """
+        self.predict_every = max(1, predict_every)
+        self.adaptive = adaptive
+        self.motion_threshold = motion_threshold
+        self.static_threshold = static_threshold
+        self.max_reuse = max_reuse
+        self.cpu_budget = cpu_budget
+        self.budget_window = budget_window
+        
+        self._inference_times = deque()
+        self._inference_total = 0.0
+        self.reset()
+        
+        # Counters
+        self.executed = 0
+        self.executed_motion = 0
+        self.reused_static = 0
+        self.reused_budget = 0
+        self.skipped_interval = 0
+        self.skipped_budget = 0
+    
+    def reset(self):
+        """Forget the tracked hand, e.g. when it leaves the frame."""
+        self.frames_since_prediction = 0
+        self.reuse_streak = 0
+        self.last_landmarks = None
+        self.predicted_landmarks = None
+        self.last_result = None
+        self.last_motion = 0.0
+    
+    @staticmethod
+    def _landmarks(hand_info):
+        """Landmark positions scaled by the hand's bounding box size."""
+        landmarks = np.asarray(hand_info['lmList'], dtype=np.float32)[:, :2]
+        _, _, w, h = hand_info['bbox']
+        return landmarks / max(w, h, 1)
+    
+    @staticmethod
+    def _displacement(a, b) -> float:
+        """Mean landmark displacement between two poses."""
+        if a is None or b is None or a.shape != b.shape:
+            return float("inf")
+        return float(np.linalg.norm(a - b, axis=1).mean())
+    
+    def _budget_used(self, now) -> float:
+        """Seconds spent in inference during the last budget window."""
+        while self._inference_times and now - self._inference_times[0][0] > self.budget_window:
+            self._inference_total -= self._inference_times.popleft()[1]
+        return self._inference_total
+    
+    def decide(self, hand_info) -> str:
+        """Decide whether to run the model (RUN), emit the cached result (REUSE) or nothing (SKIP)."""
+        landmarks = self._landmarks(hand_info) if self.adaptive else None
+        self.last_motion = self._displacement(landmarks, self.last_landmarks)
+        self.last_landmarks = landmarks
+        self.frames_since_prediction += 1
+        
+        due = self.frames_since_prediction >= self.predict_every or self.last_result is None
+        moving = self.adaptive and self.last_motion > self.motion_threshold
+        if not (due or moving):
+            self.skipped_interval += 1
+            return SKIP
+        
+        decision = RUN
+        if (self.adaptive and due and self.last_result is not None and self.reuse_streak < self.max_reuse
+                and self._displacement(landmarks, self.predicted_landmarks) <= self.static_threshold):
+            decision = REUSE
+            self.reused_static += 1
+        elif self._budget_used(time.time()) >= self.cpu_budget * self.budget_window:
+            if not due:
+                self.skipped_budget += 1
+                return SKIP
+            decision = REUSE if self.last_result is not None else SKIP
+            if decision == REUSE:
+                self.reused_budget += 1
+            else:
+                self.skipped_budget += 1
+        
+        if decision == RUN:
+            self.executed += 1
+            if not due:
+                self.executed_motion += 1
+            self.reuse_streak = 0
+            self.predicted_landmarks = landmarks
+        elif decision == REUSE:
+            self.reuse_streak += 1
+        self.frames_since_prediction = 0
+        return decision
+    
+    def record(self, result, elapsed: float):
+        """Store the result of a prediction that ran and the time it took."""
+        self.last_result = result
+        self._inference_times.append((time.time(), elapsed))
+        self._inference_total += elapsed
+    
+    @property
+    def stats(self):
+        """Get scheduling counters."""
+        return {
+            "adaptive": self.adaptive,
+            "executed": self.executed,
+            "executed_motion": self.executed_motion,
+            "reused_static": self.reused_static,
+            "reused_budget": self.reused_budget,
+            "skipped_interval": self.skipped_interval,
+            "skipped_budget": self.skipped_budget,
+            "cpu_share": round(self._budget_used(time.time()) / self.budget_window, 3),
+            "last_motion": round(self.last_motion, 4) if np.isfinite(self.last_motion) else None
+        }
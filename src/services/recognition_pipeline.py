@@ -0,0 +1,157 @@
+import time
+import threading
+import logging
+from typing import Callable, List
+
+from .frame_recognizer import FrameRecognizer
+from .prediction_scheduler import PredictionScheduler
+
+logger = logging.getLogger(__name__)
+
+class RecognitionPipeline:
+    def __init__(self, video_processor, hand_detector, sign_model, broadcaster,
+                 canvas_size=400, model_input_size=(64, 64), hand_encoder=None,
+                 scheduler=None, worker_pool=None, stream_id="camera"):
+        """Initialize the shared camera recognition loop.
+
+        hand_encoder, when given, maps a detected hand straight to the model
+        input and replaces the canvas drawing and resizing path. scheduler
+        decides per frame whether the model runs; by default it follows the
+        video processor's fixed predict_every cadence. Without a broadcaster
+        no video is published, only recognition events.
+
+        With a worker_pool, frames are handed to a recognition worker
+        process as stream_id and hand_detector, sign_model, hand_encoder
+        and scheduler are unused; events and annotated frames are published
+        as results come back.
+        """
+        self.video_processor = video_processor
+        self.broadcaster = broadcaster
+        self.worker_pool = worker_pool
+        self.stream_id = stream_id
+        self.recognizer = None
+        if worker_pool is None:
+            self.recognizer = FrameRecognizer(
+                hand_detector,
+                sign_model,
+                scheduler or PredictionScheduler(video_processor.predict_every, adaptive=False, cpu_budget=1.0),
+                canvas_size=canvas_size,
+                model_input_size=model_input_size,
+                hand_encoder=hand_encoder
+            )
+        else:
+            worker_pool.add_handler(stream_id, self._handle_worker_result)
+        
+        self._listeners: List[Callable[[dict], None]] = []
+        self._stop_event = threading.Event()
+        self._thread = None
+        
+        # Counters
+        self.frames_processed = 0
+        self.frames_submitted = 0
+        self.processing_errors = 0
+        self.last_loop_time = 0.0
+        
+        logger.info("Recognition pipeline initialized")
+    
+    def add_listener(self, callback: Callable[[dict], None]):
+        """Register a callback that receives every recognition event."""
+        self._listeners.append(callback)
+    
+    def start(self):
+        """Start the background recognition loop."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="recognition-pipeline", daemon=True
+        )
+        self._thread.start()
+        logger.info("Recognition pipeline started")
+    
+    def stop(self):
+        """Stop the recognition loop and release subscribers."""
+        self._stop_event.set()
+        if self.broadcaster is not None:
+            self.broadcaster.close()
+        
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        logger.info("Recognition pipeline stopped")
+    
+    def _run(self):
+        """Read, recognize, encode and publish frames until stopped."""
+        while not self._stop_event.is_set():
+            success, frame = self.video_processor.get_frame()
+            if not success:
+                continue
+            
+            if self.worker_pool is not None:
+                # The worker annotates the frame; results come back through _handle_worker_result
+                if self.worker_pool.submit(self.stream_id, frame, self.video_processor.frame_count):
+                    self.frames_submitted += 1
+                continue
+            
+            started = time.time()
+            try:
+                frame, event = self.process_frame(frame)
+                self._emit(event)
+                self._publish(frame)
+                self.frames_processed += 1
+            
+            except Exception as e:
+                self.processing_errors += 1
+                logger.error(f"Error in recognition pipeline: {e}")
+            
+            self.last_loop_time = time.time() - started
+    
+    def process_frame(self, frame):
+        """Run hand detection and prediction on a frame.
+
+        Returns the annotated frame and a recognition event describing it.
+        """
+        return self.recognizer.recognize(frame, self.video_processor.frame_count)
+    
+    def _handle_worker_result(self, stream_id, event, frame):
+        """Publish an event and annotated frame recognized by a worker process."""
+        self._emit(event)
+        self._publish(frame)
+        self.frames_processed += 1
+        self.last_loop_time = time.time() - event["timestamp"]
+    
+    def _emit(self, event):
+        """Deliver a recognition event to all listeners."""
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Recognition listener failed: {e}")
+    
+    def _publish(self, frame):
+        """Hand the annotated frame to the broadcaster, which encodes it only for watched tiers."""
+        if self.broadcaster is not None:
+            self.broadcaster.publish(frame)
+    
+    @property
+    def stats(self):
+        """Get pipeline counters."""
+        stats = {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "frames_processed": self.frames_processed,
+            "frames_submitted": self.frames_submitted,
+            "processing_errors": self.processing_errors,
+            "last_loop_ms": round(self.last_loop_time * 1000, 1)
+        }
+        if self.broadcaster is not None:
+            stats["broadcast"] = self.broadcaster.stats
+        if self.recognizer is not None:
+            stats.update({
+                "predictions_made": self.recognizer.predictions_made,
+                "predictions_reused": self.recognizer.predictions_reused,
+                "scheduler": self.recognizer.scheduler.stats
+            })
+        else:
+            stats["workers"] = self.worker_pool.stats
+        return stats
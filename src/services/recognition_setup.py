@@ -0,0 +1,67 @@
+import logging
+
+from src.config.settings import *
+from src.models.sign_model import SignLanguageModel
+from src.models.landmark_classifier import LandmarkClassifier
+from .hand_detector import HandDetectionService
+from .hand_tracker import HandTracker
+from .prediction_scheduler import PredictionScheduler
+from .skeleton_renderer import SkeletonRenderer
+
+logger = logging.getLogger(__name__)
+
+def build_sign_model():
+    """Load the configured recognizer."""
+    if RECOGNIZER == "landmark":
+        return LandmarkClassifier(LANDMARK_MODEL_PATH, warmup=MODEL_WARMUP)
+    
+    return SignLanguageModel(
+        MODEL_PATH,
+        inference_mode=INFERENCE_MODE,
+        warmup=MODEL_WARMUP,
+        backend=MODEL_BACKEND,
+        num_threads=MODEL_NUM_THREADS
+    )
+
+def build_hand_encoder(sign_model, fast_render=FAST_ROI_RENDER):
+    """Create the hand -> model input function for one stream, or None for the canvas path.
+
+    The skeleton renderer reuses its output buffer, so streams must not share one.
+    """
+    if RECOGNIZER == "landmark":
+        return sign_model.encode
+    if fast_render:
+        return SkeletonRenderer(CANVAS_SIZE, MODEL_INPUT_SIZE).render
+    return None
+
+def build_hand_detector(draw=STREAM_MODE == "overlay"):
+    """Create a hand detector for one stream of frames.
+
+    draw paints the hand overlay into the frames; only the server camera's
+    video in the overlay stream mode shows them.
+    """
+    if HAND_TRACKING:
+        return HandTracker(
+            max_hands=MAX_HANDS,
+            detection_confidence=HAND_DETECTION_CONFIDENCE,
+            max_box_change=HAND_TRACKING_MAX_BOX_CHANGE,
+            roi_margin=HAND_TRACKING_MARGIN,
+            redetect_interval=HAND_REDETECT_INTERVAL,
+            draw=draw
+        )
+    return HandDetectionService(
+        max_hands=MAX_HANDS,
+        detection_confidence=HAND_DETECTION_CONFIDENCE,
+        draw=draw
+    )
+
+def build_scheduler():
+    """Create the prediction scheduler for one stream of frames."""
+    return PredictionScheduler(
+        PREDICT_EVERY,
+        adaptive=ADAPTIVE_PREDICTION,
+        motion_threshold=PREDICTION_MOTION_THRESHOLD,
+        static_threshold=PREDICTION_STATIC_THRESHOLD,
+        max_reuse=PREDICTION_MAX_REUSE,
+        cpu_budget=PREDICTION_CPU_BUDGET
+    )
@@ -0,0 +1,301 @@
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class RecognitionSession:
+    def __init__(self, session_id: str, stabilizer, word_recommender=None):
+        """Initialize per-client text and letter decision state."""
+        self.session_id = session_id
+        self.stabilizer = stabilizer
+        self.word_recommender = word_recommender
+        # "camera" follows the shared camera pipeline, "client" a stream sent by the client
+        self.frame_source = "camera"
+
+        # Text state
+        self.sentence = ""
+        self.current_letter = ""
+        self.recommendations = []
+
+        # Bumped whenever sentence, letter or recommendations change, so push clients can resync
+        self.version = 0
+        self.updated_at = time.time()
+        self._published = ("", "", ())
+
+        self.created_at = time.time()
+        self.last_seen = self.created_at
+        # Open push or frame connections; the store never drops a session while they last
+        self.open_streams = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def touch(self):
+        """Mark the session as used by its client."""
+        self.last_seen = time.time()
+
+    def attach_stream(self):
+        """Pin the session in its store while a long-lived connection uses it."""
+        with self._lock:
+            self.open_streams += 1
+        self.touch()
+
+    def detach_stream(self):
+        """Release a pin taken with attach_stream()."""
+        with self._lock:
+            self.open_streams -= 1
+        self.touch()
+
+    def observe(self, event: dict):
+        """Apply a recognition event from the pipeline to this session."""
+        with self._lock:
+            stabilizer = self.stabilizer
+
+            if event["hand_detected"]:
+                stabilizer.update_last_hand_time()
+
+                if event["predicted_letter"]:
+                    stabilizer.add_prediction(event["predicted_letter"], event.get("probabilities"),
+                                              event.get("confidence", 1.0))
+
+                self.current_letter = stabilizer.get_current_letter()
+
+                # Check if letter should be added to sentence
+                if self.current_letter and stabilizer.should_add_letter(self.current_letter):
+                    self._add_letter(self.current_letter)
+
+            else:
+                for letter in stabilizer.hand_lost():
+                    self._add_letter(letter)
+
+                if stabilizer.should_add_space():
+                    if self.sentence and not self.sentence.endswith(" "):
+                        self.sentence += " "
+                        self._update_recommendations()
+
+            self._publish_locked()
+
+    def _add_letter(self, letter: str):
+        """Add a committed letter to the sentence."""
+        self.stabilizer.add_letter(letter)
+        decoded = self.stabilizer.decoded_word()
+        if decoded is None:
+            self.sentence += letter
+        else:
+            # The decoder may respell earlier letters of the current word
+            self.sentence = self.sentence[:self.sentence.rfind(" ") + 1] + decoded
+        self._update_recommendations()
+
+    def clear(self):
+        """Clear current text."""
+        with self._lock:
+            self.sentence = ""
+            self.current_letter = ""
+            self.stabilizer.reset_state()
+            self._update_recommendations()
+            self._publish_locked()
+
+    def append_suggestion(self, word: str) -> str:
+        """Replace the last word with a suggested word, or append it after a space."""
+        with self._lock:
+            if word:
+                words = self.sentence.split()
+                if self.sentence.endswith(" "):
+                    self.sentence += word
+                elif words:
+                    words[-1] = word
+                    self.sentence = ' '.join(words)
+                else:
+                    self.sentence = word
+                self._update_recommendations()
+            self._publish_locked()
+            return self.sentence
+
+    def delete_last(self) -> str:
+        """Delete last character from sentence."""
+        with self._lock:
+            if self.sentence:
+                self.sentence = self.sentence[:-1]
+                self._update_recommendations()
+            self._publish_locked()
+            return self.sentence
+
+    def add_space(self) -> str:
+        """Add space to sentence."""
+        with self._lock:
+            if self.sentence and not self.sentence.endswith(" "):
+                self.sentence += " "
+                self._update_recommendations()
+            self._publish_locked()
+            return self.sentence
+
+    def snapshot(self) -> dict:
+        """Get current text state."""
+        with self._lock:
+            return self._snapshot_locked()
+
+    def _snapshot_locked(self) -> dict:
+        """Current text state; the caller holds the lock."""
+        return {
+            "version": self.version,
+            "sentence": self.sentence,
+            "letter": self.current_letter,
+            "recs": list(self.recommendations)
+        }
+
+    def _publish_locked(self):
+        """Bump the version and wake waiting push clients if the visible text state changed."""
+        state = (self.sentence, self.current_letter, tuple(self.recommendations))
+        if state == self._published:
+            return
+        self._published = state
+        self.version += 1
+        self.updated_at = time.time()
+        self._changed.notify_all()
+
+    def wait_for_change(self, version: int, timeout: float) -> Optional[dict]:
+        """Wait until the state moves past version; returns the new snapshot, or None on timeout.
+
+        Any version other than the current one counts as stale, so a client
+        resuming with a version from an earlier session is resynced too.
+        """
+        with self._changed:
+            if not self._changed.wait_for(lambda: self.version != version, timeout):
+                return None
+            return self._snapshot_locked()
+
+    def _update_recommendations(self):
+        """Update word recommendations and decoder context based on current sentence."""
+        try:
+            words = self.sentence.split()
+
+            # After a space the next word is predicted from all the words so far
+            if self.sentence.endswith(" ") or not words:
+                current_word, context = "", words
+            else:
+                current_word, context = words[-1], words[:-1]
+
+            self.stabilizer.sync_text(context, current_word)
+
+            if self.word_recommender is None:
+                return
+
+            if not words:
+                self.recommendations = []
+                return
+
+            self.recommendations = self.word_recommender.get_recommendations(current_word, context)
+
+        except Exception as e:
+            logger.error(f"Error updating recommendations: {e}")
+
+class SessionStore:
+    def __init__(self, session_factory: Callable[[str], RecognitionSession],
+                 max_sessions=100, idle_ttl=600.0, sweep_interval=1.0):
+        """Initialize LRU store of recognition sessions with idle expiry."""
+        self.session_factory = session_factory
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.time()
+
+        # Counters
+        self.sessions_created = 0
+        self.sessions_evicted = 0
+        self.sessions_expired = 0
+
+    def get_or_create(self, session_id: str) -> RecognitionSession:
+        """Get a session by id, creating it if needed, and mark it as recently used."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self.session_factory(session_id)
+                self._sessions[session_id] = session
+                self.sessions_created += 1
+                logger.info(f"Created recognition session {session_id[:8]}")
+
+                self._evict_locked(keep=session_id)
+            else:
+                self._sessions.move_to_end(session_id)
+
+            session.touch()
+            self._sweep_locked()
+            return session
+
+    def get(self, session_id: str) -> Optional[RecognitionSession]:
+        """Get a session by id without creating it."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.touch()
+            return session
+
+    def remove(self, session_id: str):
+        """Remove a session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def sessions(self) -> List[RecognitionSession]:
+        """Get a snapshot of live sessions."""
+        with self._lock:
+            self._sweep_locked()
+            return list(self._sessions.values())
+
+    def evict_expired(self):
+        """Drop sessions that have been idle longer than the TTL."""
+        with self._lock:
+            self._last_sweep = 0
+            self._sweep_locked()
+
+    def _evict_locked(self, keep: str):
+        """Evict least recently used sessions beyond capacity, skipping pinned ones."""
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return
+
+        evicted = [
+            session_id for session_id, session in self._sessions.items()
+            if session_id != keep and not session.open_streams
+        ][:excess]
+        for session_id in evicted:
+            del self._sessions[session_id]
+            self.sessions_evicted += 1
+            logger.info(f"Evicted recognition session {session_id[:8]}")
+
+    def _sweep_locked(self):
+        """Expire idle sessions, at most once per sweep interval."""
+        now = time.time()
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+
+        expired = [
+            session_id for session_id, session in self._sessions.items()
+            if now - session.last_seen > self.idle_ttl and not session.open_streams
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
+            self.sessions_expired += 1
+            logger.info(f"Expired idle recognition session {session_id[:8]}")
+
+    def __len__(self):
+        return len(self._sessions)
+
+    @property
+    def stats(self):
+        """Get session store counters."""
+        with self._lock:
+            return {
+                "active": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "idle_ttl": self.idle_ttl,
+                "created": self.sessions_created,
+                "evicted": self.sessions_evicted,
+                "expired": self.sessions_expired
+            }
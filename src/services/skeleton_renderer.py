@@ -0,0 +1,76 @@
+import cv2
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Landmark chains drawn by HandDetectionService._draw_hand_skeleton: the thumb,
+# then index tip through pinky as one polyline (its segments link 8-9, 12-13, 16-17)
+SKELETON_CHAINS = ((0, 5), (5, 21))
+
+# Sub-pixel bits passed to the OpenCV drawing calls
+DRAW_SHIFT = 4
+
+class SkeletonRenderer:
+    def __init__(self, canvas_size=400, output_size=(64, 64), line_thickness=3, point_radius=2):
+        """Initialize a renderer that draws hand skeletons straight at model resolution.
+
+        Landmarks are laid out on the same virtual canvas_size canvas as
+        HandDetectionService.extract_hand_roi and scaled down to output_size,
+        so no full-size canvas is drawn or resized.
+        """
+        self.canvas_size = canvas_size
+        self.output_size = output_size
+        width, height = output_size
+        self._scale = np.array([width / canvas_size, height / canvas_size]) * (1 << DRAW_SHIFT)
+        
+        # Strokes thinner than a pixel are drawn 1px wide with a lighter colour,
+        # matching how the downscaled full-size stroke blends into the background
+        self._line_color = self._blend((0, 255, 0), line_thickness * width / canvas_size)
+        self._point_color = self._blend((0, 0, 255), 2 * point_radius * width / canvas_size)
+        self._point_radius = max(1, int(round(point_radius * (1 << DRAW_SHIFT) * width / canvas_size)))
+        
+        # Reused buffers; render() returns a view of _output
+        self._canvas = np.empty((height, width, 3), np.uint8)
+        self._output = np.empty((1, height, width, 3), np.float32)
+        
+        logger.info(f"Skeleton renderer initialized at {width}x{height} for canvas_size={canvas_size}")
+    
+    @staticmethod
+    def _blend(color, coverage):
+        """Mix a BGR colour with white by the fraction of a pixel a stroke covers."""
+        coverage = min(1.0, coverage)
+        return tuple(255 - (255 - c) * coverage for c in color)
+    
+    def landmark_points(self, hand_info) -> np.ndarray:
+        """Map hand landmarks to fixed-point pixel coordinates in the output buffer."""
+        x, y, w, h = hand_info['bbox']
+        landmarks = np.asarray(hand_info['lmList'])[:, :2]
+        
+        # Same centring as extract_hand_roi, then scaled to the output size
+        offset = np.array([(self.canvas_size - w) // 2 - x, (self.canvas_size - h) // 2 - y])
+        points = (landmarks + offset).astype(np.int32) * self._scale
+        return np.rint(points).astype(np.int32)
+    
+    def render(self, hand_info) -> np.ndarray:
+        """Render the hand skeleton as a normalized (1, H, W, 3) float32 model input.
+
+        The returned array is overwritten by the next call.
+        """
+        try:
+            points = self.landmark_points(hand_info)
+            canvas = self._canvas
+            canvas.fill(255)
+            
+            chains = [points[start:end] for start, end in SKELETON_CHAINS if len(points) > start + 1]
+            cv2.polylines(canvas, chains, False, self._line_color, 1, cv2.LINE_AA, DRAW_SHIFT)
+            for point in points:
+                cv2.circle(canvas, (int(point[0]), int(point[1])), self._point_radius,
+                           self._point_color, -1, cv2.LINE_AA, DRAW_SHIFT)
+            
+            np.multiply(canvas, np.float32(1.0 / 255.0), out=self._output[0])
+            return self._output
+        
+        except Exception as e:
+            logger.error(f"Skeleton rendering failed: {e}")
+            return None
@@ -0,0 +1,224 @@
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+from src.models.word_dictionary import WORD_DICT
+
+logger = logging.getLogger(__name__)
+
+# Local word lists tried when no path is given, before falling back to WORD_DICT
+SYSTEM_WORD_LISTS = ("/usr/share/dict/words", "/usr/share/dict/american-english")
+
+def load_word_list(path=None):
+    """Load words and optional tab-separated counts from a local word list."""
+    candidates = [path] if path else list(SYSTEM_WORD_LISTS)
+    for candidate in candidates:
+        if candidate and Path(candidate).is_file():
+            words = {}
+            with open(candidate, encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    word, _, count = line.strip().partition("\t")
+                    if word.isalpha():
+                        word = word.lower()
+                        words[word] = max(words.get(word, 0.0), float(count) if count else 1.0)
+            logger.info(f"Loaded {len(words)} words from {candidate}")
+            return words
+    
+    if path:
+        raise FileNotFoundError(f"Word list not found: {path}")
+    
+    words = {}
+    for entry in WORD_DICT:
+        for word in entry.split():
+            words[word.lower()] = words.get(word.lower(), 0.0) + 1.0
+    logger.info(f"No word list found, using {len(words)} built-in words")
+    return words
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+class SpellSuggester:
+    def __init__(self, words=None, word_list_path=None, max_edit_distance=2, prefix_length=7,
+                 cache_size=1024, lazy=False):
+        """Initialize SymSpell-style spelling suggestions over a local word list.
+
+        Every word's deletions (up to max_edit_distance characters from its
+        first prefix_length letters) are precomputed, so a lookup only
+        generates the deletions of the input and checks the few words they
+        point to instead of comparing against the whole list. With lazy, the
+        word list is loaded and indexed on the first lookup instead, which
+        suggest_async() runs in the background.
+        """
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.word_list_path = word_list_path
+        self.words = words
+        self._deletes = None
+        self._index_lock = threading.Lock()
+        
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Background lookups: only the newest pending word is kept
+        self._cond = threading.Condition()
+        self._pending = None
+        self._thread = None
+        self._stopped = False
+        
+        if not lazy:
+            self._ensure_index()
+    
+    def _deletions(self, word: str) -> set:
+        """All strings reachable by deleting up to max_edit_distance characters."""
+        results = {word}
+        frontier = {word}
+        for _ in range(self.max_edit_distance):
+            next_frontier = set()
+            for item in frontier:
+                for i in range(len(item)):
+                    candidate = item[:i] + item[i + 1:]
+                    if candidate not in results:
+                        next_frontier.add(candidate)
+            results |= next_frontier
+            frontier = next_frontier
+        return results
+    
+    def _ensure_index(self):
+        """Load the word list and precompute the deletion index, once."""
+        with self._index_lock:
+            if self._deletes is not None:
+                return
+            
+            if self.words is None:
+                self.words = load_word_list(self.word_list_path)
+            deletes = {}
+            for word in self.words:
+                for key in self._deletions(word[:self.prefix_length]):
+                    deletes.setdefault(key, []).append(word)
+            self._deletes = deletes
+        
+        logger.info(f"Spell suggester indexed {len(self.words)} words "
+                    f"({len(self._deletes)} deletion keys)")
+    
+    def lookup(self, word: str, limit: int = 5) -> list:
+        """Find the closest known words, ranked by edit distance then frequency."""
+        query = word.lower()
+        if not query:
+            return []
+        
+        self._ensure_index()
+        candidates = set()
+        for key in self._deletions(query[:self.prefix_length]):
+            candidates.update(self._deletes.get(key, ()))
+        
+        scored = []
+        for candidate in candidates:
+            distance = edit_distance(query, candidate, self.max_edit_distance)
+            if distance <= self.max_edit_distance:
+                scored.append((distance, -self.words[candidate], candidate))
+        scored.sort()
+        
+        suggestions = [candidate for _, _, candidate in scored[:limit]]
+        if word.isupper():
+            suggestions = [s.upper() for s in suggestions]
+        return suggestions
+    
+    def suggest(self, word: str, limit: int = 5) -> list:
+        """Get suggestions for a word, served from the LRU cache when possible."""
+        key = (word, limit)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+        
+        suggestions = self.lookup(word, limit)
+        
+        with self._cache_lock:
+            self._cache[key] = suggestions
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return suggestions
+    
+    def cached(self, word: str, limit: int = 5):
+        """Get cached suggestions without computing them, or None."""
+        with self._cache_lock:
+            return self._cache.get((word, limit))
+    
+    def suggest_async(self, word: str, limit: int = 5):
+        """Get cached suggestions, or schedule a background lookup and return None.
+
+        Meant for UI loops: a miss never blocks, and the result is picked up
+        from the cache on a later call.
+        """
+        suggestions = self.cached(word, limit)
+        if suggestions is not None:
+            return suggestions
+        
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="spell-suggester", daemon=True)
+                self._thread.start()
+            self._pending = (word, limit)
+            self._cond.notify()
+        return None
+    
+    def _run(self):
+        """Compute pending lookups in the background."""
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                word, limit = self._pending
+                self._pending = None
+            
+            try:
+                self.suggest(word, limit)
+            except Exception as e:
+                logger.error(f"Spelling lookup failed for '{word}': {e}")
+    
+    def stop(self):
+        """Stop the background lookup thread."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+    
+    @property
+    def stats(self):
+        """Get index and cache counters."""
+        with self._cache_lock:
+            return {
+                "words": len(self.words or ()),
+                "deletion_keys": len(self._deletes or ()),
+                "cache_entries": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses
+            }
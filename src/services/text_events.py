@@ -0,0 +1,108 @@
+import json
+import threading
+import logging
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+TEXT_FIELDS = ("sentence", "letter", "recs")
+
+class TextEventStream:
+    def __init__(self, heartbeat_interval=15.0, retry_ms=1000):
+        """Initialize server-sent text updates for recognition sessions.
+
+        Each connection waits on its session's change condition and sends
+        an event only when the sentence, letter or recommendations change,
+        carrying the new version and just the fields that differ from the
+        last event. The version is the SSE event id, so a reconnecting
+        EventSource sends it back as Last-Event-ID and only gets a full
+        snapshot if it missed something. Comments are sent every
+        heartbeat_interval seconds to keep proxies from closing idle
+        connections.
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_ms = retry_ms
+        self._lock = threading.Lock()
+        
+        # Counters
+        self.connections_opened = 0
+        self.active_connections = 0
+        self.events_sent = 0
+        self.resyncs = 0
+        self.heartbeats_sent = 0
+        self.bytes_sent = 0
+        self.polls_served = 0
+    
+    def poll(self, session) -> dict:
+        """Serve a /get_text poll (the fallback for clients without EventSource)."""
+        with self._lock:
+            self.polls_served += 1
+        return session.snapshot()
+    
+    @staticmethod
+    def format_event(version: int, payload: dict) -> str:
+        """Encode one SSE message with the version as its id."""
+        return f"id: {version}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+    
+    def _send(self, chunk: str) -> str:
+        """Count an outgoing chunk."""
+        with self._lock:
+            self.bytes_sent += len(chunk)
+        return chunk
+    
+    def stream(self, session, last_version: Optional[int] = None) -> Iterator[str]:
+        """Yield SSE messages for a session until the client disconnects."""
+        with self._lock:
+            self.connections_opened += 1
+            self.active_connections += 1
+        # Keep the session from being evicted while the client listens
+        session.attach_stream()
+        
+        try:
+            yield self._send(f"retry: {self.retry_ms}\n\n")
+            
+            sent = session.snapshot()
+            if last_version != sent["version"]:
+                # New or out-of-date client: start from the full state
+                with self._lock:
+                    self.resyncs += 1
+                    self.events_sent += 1
+                yield self._send(self.format_event(sent["version"], sent))
+            
+            while True:
+                state = session.wait_for_change(sent["version"], self.heartbeat_interval)
+                session.touch()
+                if state is None:
+                    with self._lock:
+                        self.heartbeats_sent += 1
+                    yield self._send(": keepalive\n\n")
+                    continue
+                
+                delta = {"version": state["version"]}
+                for field in TEXT_FIELDS:
+                    if state[field] != sent[field]:
+                        delta[field] = state[field]
+                sent = state
+                
+                with self._lock:
+                    self.events_sent += 1
+                yield self._send(self.format_event(state["version"], delta))
+        
+        finally:
+            session.detach_stream()
+            with self._lock:
+                self.active_connections -= 1
+    
+    @property
+    def stats(self):
+        """Get push channel counters."""
+        with self._lock:
+            return {
+                "connections_opened": self.connections_opened,
+                "active_connections": self.active_connections,
+                "events_sent": self.events_sent,
+                "resyncs": self.resyncs,
+                "heartbeats_sent": self.heartbeats_sent,
+                "bytes_sent": self.bytes_sent,
+                "polls_served": self.polls_served
+            }
@@ -2,71 +2,139 @@ import cv2
 import numpy as np
 import time
 import logging
-from collections import deque
+import threading
 from typing import Optional, Tuple, List
 
+from .frame_buffer import FrameRingBuffer
+from .frame_recognizer import prepare_model_input
+
 logger = logging.getLogger(__name__)
 
 class VideoProcessor:
     def __init__(self, camera_index=0, canvas_size=400, predict_every=4, 
-                 vote_queue_size=6, letter_cooldown=1.2, hand_stable_time=2.0, 
-                 no_hand_space_time=4.0):
+                 threaded_capture=True, frame_buffer_size=2, frame_timeout=1.0):
         """Initialize video processor."""
         self.camera_index = camera_index
         self.canvas_size = canvas_size
         self.predict_every = predict_every
-        self.vote_queue_size = vote_queue_size
-        self.letter_cooldown = letter_cooldown
-        self.hand_stable_time = hand_stable_time
-        self.no_hand_space_time = no_hand_space_time
+        self.threaded_capture = threaded_capture
+        self.frame_timeout = frame_timeout
+        
+        # Threaded capture state
+        self.frame_buffer = FrameRingBuffer(frame_buffer_size)
+        self.capture_failures = 0
+        self.max_retry_delay = 0.5
+        self._failure_streak = 0
+        self.last_frame_seq = 0
+        self._raw_frame = None
+        self._stop_capture = threading.Event()
+        self._capture_thread = None
         
         # Initialize camera
         self.cap = cv2.VideoCapture(camera_index)
         if not self.cap.isOpened():
             raise RuntimeError(f"Failed to open camera at index {camera_index}")
         
+        # Keep the driver queue short so the capture thread sees fresh frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         # State variables
         self.frame_count = 0
-        self.vote_queue = deque(maxlen=vote_queue_size)
-        self.current_letter = ""
-        self.stable_letter = ""
-        self.stable_start_time = 0
-        self.last_added = ""
-        self.last_added_time = 0
-        self.last_hand_time = time.time()
+        
+        if self.threaded_capture:
+            self.start_capture()
         
         logger.info(f"Video processor initialized with camera index {camera_index}")
     
+    def start_capture(self):
+        """Start the background capture thread."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        
+        self._stop_capture.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="camera-capture", daemon=True
+        )
+        self._capture_thread.start()
+        logger.info(f"Capture thread started with {self.frame_buffer.capacity} frame slots")
+    
+    def _capture_loop(self):
+        """Continuously grab frames into the ring buffer, dropping the oldest."""
+        while not self._stop_capture.is_set():
+            try:
+                if self._raw_frame is None:
+                    success, raw = self.cap.read()
+                else:
+                    success, raw = self.cap.read(self._raw_frame)
+                
+                if not success or raw is None:
+                    self.capture_failures += 1
+                    if self.capture_failures % 30 == 1:
+                        logger.warning("Failed to read frame from camera")
+                    time.sleep(0.01)
+                    continue
+                
+                self._raw_frame = raw
+                captured_at = time.time()
+                
+                # Flip horizontally for mirror effect straight into the ring slot
+                slot = self.frame_buffer.begin_write(raw.shape, raw.dtype)
+                cv2.flip(raw, 1, dst=slot)
+                self.frame_buffer.commit_write(captured_at)
+            
+            except Exception as e:
+                logger.error(f"Error in capture thread: {e}")
+                time.sleep(0.1)
+    
     def get_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
-        """Get a single frame from the camera."""
+        """Get the freshest frame from the camera.
+        
+        With threaded capture the returned frame is owned by the ring buffer
+        and stays valid until the next call.
+        """
+        if self.threaded_capture:
+            seq, frame = self.frame_buffer.read_latest(timeout=self.frame_timeout)
+            if frame is None:
+                logger.warning("No new frame from capture thread")
+                return False, None
+            
+            self.last_frame_seq = seq
+            self.frame_count += 1
+            return True, frame
+        
         try:
             success, frame = self.cap.read()
             if not success:
-                logger.warning("Failed to read frame from camera")
+                self._read_failed()
                 return False, None
             
             # Flip frame horizontally for mirror effect
             frame = cv2.flip(frame, 1)
             self.frame_count += 1
+            self._failure_streak = 0
             
             return True, frame
             
         except Exception as e:
             logger.error(f"Error getting frame: {e}")
+            self._read_failed()
             return False, None
     
+    def _read_failed(self):
+        """Back off after a failed read so callers retrying in a loop don't spin."""
+        self.capture_failures += 1
+        if self.capture_failures % 30 == 1:
+            logger.warning("Failed to read frame from camera")
+        
+        # 10ms doubling up to half a second while the camera stays unavailable
+        delay = min(0.01 * 2 ** self._failure_streak, self.max_retry_delay)
+        self._failure_streak = min(self._failure_streak + 1, 10)
+        time.sleep(delay)
+    
     def process_hand_roi(self, hand_roi, model, target_size=(64, 64)):
         """Process hand ROI for model prediction."""
         try:
-            # Resize to model input size
-            processed = cv2.resize(hand_roi, target_size)
-            
-            # Normalize and reshape for model
-            processed = (processed.astype("float32") / 255.0).reshape(
-                1, target_size[1], target_size[0], 3
-            )
-            
-            return processed
+            return prepare_model_input(hand_roi, target_size)
             
         except Exception as e:
             logger.error(f"Error processing hand ROI: {e}")
@@ -76,65 +144,32 @@ class VideoProcessor:
         """Check if prediction should be made on current frame."""
         return self.frame_count % self.predict_every == 0
     
-    def add_prediction(self, predicted_letter: str):
-        """Add prediction to vote queue."""
-        self.vote_queue.append(predicted_letter)
+    @property
+    def capture_stats(self):
+        """Get capture and frame dropping counters."""
+        stats = self.frame_buffer.stats
+        stats.update({
+            "threaded": self.threaded_capture,
+            "frames_processed": self.frame_count,
+            "capture_failures": self.capture_failures,
+            "frame_age_ms": round(
+                (time.time() - self.frame_buffer.latest_timestamp()) * 1000, 1
+            ) if self.frame_buffer.frames_written else None
+        })
+        return stats
     
-    def get_current_letter(self) -> str:
-        """Get current letter based on vote queue."""
-        if not self.vote_queue:
-            return ""
-        
-        return max(set(self.vote_queue), key=self.vote_queue.count)
-    
-    def should_add_letter(self, current_letter: str) -> bool:
-        """Check if letter should be added to sentence."""
-        current_time = time.time()
-        
-        # Check if letter is stable
-        if current_letter != self.stable_letter:
-            self.stable_letter = current_letter
-            self.stable_start_time = current_time
-            return False
+    def stop_capture(self):
+        """Stop the background capture thread."""
+        self._stop_capture.set()
+        self.frame_buffer.close()
         
-        # Check if stable for required time
-        if current_time - self.stable_start_time < self.hand_stable_time:
-            return False
-        
-        # Check cooldown
-        if (current_letter == self.last_added and 
-            current_time - self.last_added_time < self.letter_cooldown):
-            return False
-        
-        return True
-    
-    def add_letter(self, letter: str):
-        """Add letter to sentence."""
-        current_time = time.time()
-        self.last_added = letter
-        self.last_added_time = current_time
-        self.vote_queue.clear()
-    
-    def should_add_space(self) -> bool:
-        """Check if space should be added (no hand detected)."""
-        return time.time() - self.last_hand_time > self.no_hand_space_time
-    
-    def update_last_hand_time(self):
-        """Update the last time a hand was detected."""
-        self.last_hand_time = time.time()
-    
-    def reset_state(self):
-        """Reset processing state."""
-        self.vote_queue.clear()
-        self.current_letter = ""
-        self.stable_letter = ""
-        self.stable_start_time = 0
-        self.last_added = ""
-        self.last_added_time = 0
-        self.last_hand_time = time.time()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
     
     def release(self):
         """Release camera resources."""
+        self.stop_capture()
         if self.cap.isOpened():
             self.cap.release()
             logger.info("Camera released")
@@ -0,0 +1,145 @@
+import logging
+from collections import deque
+from typing import Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rescale stored weights before the growing decay factor overflows
+_MAX_SCALE = 1e100
+
+class SlidingVoteCounter:
+    def __init__(self, window=6, decay=1.0):
+        """Initialize a sliding-window vote tally with optional exponential decay.
+
+        Keeps a running weight per label, updated on append and eviction,
+        plus the leader and runner-up. Appending is O(1); only evicting
+        the leader or runner-up rescans the labels currently in the window,
+        which is bounded by the alphabet rather than the window size.
+
+        With decay < 1 a vote's weight is multiplied by decay for every
+        newer vote. Instead of touching every count, new votes are stored
+        scaled up by 1/decay per step and weights are read back scaled
+        down, which leaves the ranking unchanged.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        
+        self.window = window
+        self.decay = decay
+        self._growth = 1.0 / decay
+        self._entries = deque()
+        self._weights = {}
+        self._votes = {}
+        self._scale = 1.0
+        self._total = 0.0
+        self._leader = None
+        self._runner_up = None
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def append(self, label: Hashable, weight: float = 1.0):
+        """Add a vote, evicting the oldest one once the window is full."""
+        if len(self._entries) == self.window:
+            self._evict()
+        
+        if self._growth != 1.0:
+            self._scale *= self._growth
+            if self._scale > _MAX_SCALE:
+                self._rescale()
+        
+        stored = weight * self._scale
+        self._entries.append((label, stored))
+        self._weights[label] = self._weights.get(label, 0.0) + stored
+        self._votes[label] = self._votes.get(label, 0) + 1
+        self._total += stored
+        self._promote(label)
+    
+    def _promote(self, label):
+        """Update leader and runner-up after label gained weight."""
+        weights = self._weights
+        if label == self._leader:
+            return
+        if self._leader is None or weights[label] > weights[self._leader]:
+            self._runner_up = self._leader
+            self._leader = label
+        elif self._runner_up is None or label == self._runner_up or weights[label] > weights[self._runner_up]:
+            self._runner_up = label
+    
+    def _evict(self):
+        """Remove the oldest vote."""
+        label, stored = self._entries.popleft()
+        remaining = self._weights[label] - stored
+        self._total -= stored
+        
+        if not self._entries:
+            self._reset_counts()
+            return
+        
+        self._votes[label] -= 1
+        if self._votes[label] == 0:
+            del self._weights[label]
+            del self._votes[label]
+        else:
+            self._weights[label] = remaining
+        
+        if label == self._leader or label == self._runner_up:
+            self._rank()
+    
+    def _rank(self):
+        """Recompute leader and runner-up from the current weights."""
+        self._leader = self._runner_up = None
+        for label in self._weights:
+            self._promote(label)
+    
+    def _rescale(self):
+        """Bring stored weights back to scale 1."""
+        factor = 1.0 / self._scale
+        self._entries = deque((label, stored * factor) for label, stored in self._entries)
+        self._weights = {label: weight * factor for label, weight in self._weights.items()}
+        self._total *= factor
+        self._scale = 1.0
+    
+    def _reset_counts(self):
+        """Drop all tallies, also clearing accumulated rounding error."""
+        self._weights = {}
+        self._votes = {}
+        self._scale = 1.0
+        self._total = 0.0
+        self._leader = None
+        self._runner_up = None
+    
+    def clear(self):
+        """Remove all votes."""
+        self._entries.clear()
+        self._reset_counts()
+    
+    def count(self, label: Hashable) -> float:
+        """Current (decayed) weight of a label."""
+        return self._weights.get(label, 0.0) / self._scale
+    
+    @property
+    def leader(self) -> Optional[Hashable]:
+        """Label with the most weight; a tie does not replace the current leader."""
+        return self._leader
+    
+    @property
+    def margin(self) -> float:
+        """Weight of the leader minus the runner-up's."""
+        if self._leader is None:
+            return 0.0
+        return self.count(self._leader) - (self.count(self._runner_up) if self._runner_up is not None else 0.0)
+    
+    @property
+    def share(self) -> float:
+        """Fraction of the window's weight held by the leader."""
+        if self._leader is None or self._total <= 0:
+            return 0.0
+        return min(1.0, self._weights[self._leader] / self._total)
+    
+    @property
+    def total(self) -> float:
+        """Current (decayed) weight of all votes in the window."""
+        return self._total / self._scale
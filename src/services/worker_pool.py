@@ -0,0 +1,347 @@
+import time
+import zlib
+import logging
+import threading
+import multiprocessing as mp
+from multiprocessing import connection, shared_memory
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _worker_main(index, shm_name, slot_bytes, tasks, results):
+    """Recognize frames placed in this worker's shared-memory slots until told to stop."""
+    from src.config.settings import CANVAS_SIZE, MODEL_INPUT_SIZE, LOG_LEVEL, LOG_FORMAT
+    from src.utils.logger import setup_logger
+    from .frame_recognizer import FrameRecognizer
+    from .recognition_setup import build_sign_model, build_hand_encoder, build_hand_detector, build_scheduler
+    
+    setup_logger("src", LOG_LEVEL, LOG_FORMAT)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    sign_model = build_sign_model()
+    
+    # Per-stream detector tracking and scheduling state; the model is shared
+    streams = {}
+    results.send(("ready", index, None, None))
+    logger.info(f"Recognition worker {index} ready")
+    
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            if task[0] == "close":
+                streams.pop(task[1], None)
+                continue
+            
+            _, stream_id, slot, shape, seq = task
+            recognizer = streams.get(stream_id)
+            if recognizer is None:
+                recognizer = streams[stream_id] = FrameRecognizer(
+                    build_hand_detector(),
+                    sign_model,
+                    build_scheduler(),
+                    canvas_size=CANVAS_SIZE,
+                    model_input_size=MODEL_INPUT_SIZE,
+                    hand_encoder=build_hand_encoder(sign_model)
+                )
+            
+            # Recognize and annotate the frame in place in shared memory
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+            try:
+                annotated, event = recognizer.recognize(frame, seq)
+                if annotated is not frame:
+                    np.copyto(frame, annotated)
+                if event["probabilities"] is not None:
+                    event["probabilities"] = np.asarray(event["probabilities"], dtype=np.float32).ravel()
+            except Exception as e:
+                logger.error(f"Recognition worker {index} failed on a frame: {e}")
+                event = None
+            finally:
+                # Views must be gone before the segment can be closed
+                frame = annotated = None
+            
+            results.send(("result", index, slot, (stream_id, event)))
+    finally:
+        shm.close()
+        results.close()
+
+class RecognitionWorkerPool:
+    def __init__(self, num_workers=2, max_frame_shape=(480, 640, 3), slots_per_worker=3, start_timeout=120.0):
+        """Initialize recognition worker processes fed through shared-memory frame slots.
+
+        Each worker owns a shared-memory ring of slots_per_worker frame
+        slots. submit() copies a frame into a free slot and sends only the
+        slot index, shape and stream id; the worker recognizes and annotates
+        the frame in place and sends back a compact event (letter,
+        probabilities, landmarks). Streams are assigned to workers by
+        crc32 of their id, so a stream's tracking and scheduling state stays
+        in one process. Workers use the spawn start method so none of the
+        web process's threads or camera handles are inherited. Each worker
+        has its own task queue and result pipe, replaced when it is
+        restarted, so a worker killed mid-read or mid-write cannot block
+        the others or its successor.
+        """
+        self.num_workers = num_workers
+        self.slots_per_worker = slots_per_worker
+        self.max_frame_shape = tuple(max_frame_shape)
+        self.slot_bytes = int(np.prod(self.max_frame_shape))
+        self.start_timeout = start_timeout
+        
+        self._context = mp.get_context("spawn")
+        self._handlers: Dict[str, Callable[[str, dict, np.ndarray], None]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._result_thread = None
+        
+        self._segments: List[shared_memory.SharedMemory] = []
+        self._tasks = []
+        self._results = []
+        self._processes = []
+        self._free_slots = []
+        # Bumped on every restart of a worker, invalidating slots taken before it
+        self._generations = [0] * num_workers
+        
+        # Counters
+        self.frames_submitted = [0] * num_workers
+        self.frames_completed = [0] * num_workers
+        self.frames_dropped = 0
+        self.frames_downscaled = 0
+        self.worker_errors = 0
+        self.worker_restarts = 0
+        self.last_latency = 0.0
+        self._in_flight = {}
+        
+        for index in range(num_workers):
+            segment = shared_memory.SharedMemory(create=True, size=self.slot_bytes * slots_per_worker)
+            self._segments.append(segment)
+            self._tasks.append(None)
+            self._results.append(None)
+            self._free_slots.append(list(range(slots_per_worker)))
+            self._processes.append(None)
+    
+    def add_handler(self, stream_id: str, handler: Callable[[str, dict, np.ndarray], None]):
+        """Set the callback receiving (stream_id, event, annotated frame) for a stream's finished frames.
+
+        The frame is a view of the slot and is only valid during the call.
+        """
+        self._handlers[stream_id] = handler
+    
+    def remove_handler(self, stream_id: str):
+        """Stop delivering a stream's results."""
+        self._handlers.pop(stream_id, None)
+    
+    def start(self):
+        """Start the worker processes and wait until their models are loaded."""
+        for index in range(self.num_workers):
+            self._start_worker(index)
+        
+        pending = {self._results[index]: index for index in range(self.num_workers)}
+        deadline = time.time() + self.start_timeout
+        while pending and time.time() < deadline:
+            if not any(process.is_alive() for process in self._processes):
+                break
+            for reader in connection.wait(list(pending), timeout=1.0):
+                try:
+                    kind, *_ = reader.recv()
+                except (EOFError, OSError):
+                    # Died while loading; the result thread restarts it
+                    kind = "exited"
+                if kind in ("ready", "exited"):
+                    pending.pop(reader)
+        ready = self.num_workers - len(pending)
+        if pending:
+            logger.warning(f"Only {ready} of {self.num_workers} recognition workers are ready")
+        
+        self._stop_event.clear()
+        self._result_thread = threading.Thread(
+            target=self._collect_results, name="worker-results", daemon=True
+        )
+        self._result_thread.start()
+        logger.info(f"Recognition worker pool started with {self.num_workers} workers, "
+                    f"{self.slots_per_worker} slots each")
+    
+    def _start_worker(self, index):
+        """Spawn the process for one worker with a new task queue and result pipe.
+
+        The previous channels are discarded with any stale tasks and partial
+        results: a killed worker can leave the queue's reader lock held or a
+        result half written.
+        """
+        tasks = self._context.Queue()
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, self._segments[index].name, self.slot_bytes, tasks, writer),
+            name=f"recognition-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        # Only the worker writes, so the pipe reports EOF once it exits
+        writer.close()
+        
+        old_tasks, old_results = self._tasks[index], self._results[index]
+        self._tasks[index], self._results[index] = tasks, reader
+        self._processes[index] = process
+        
+        if old_tasks is not None:
+            old_tasks.cancel_join_thread()
+            old_tasks.close()
+        if old_results is not None:
+            old_results.close()
+    
+    def worker_for(self, stream_id: str) -> int:
+        """Sticky worker index for a stream."""
+        return zlib.crc32(stream_id.encode("utf-8")) % self.num_workers
+    
+    def _slot_view(self, index, slot, shape) -> np.ndarray:
+        """Array view of a slot in a worker's segment."""
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._segments[index].buf, offset=slot * self.slot_bytes)
+    
+    def submit(self, stream_id: str, frame: np.ndarray, seq: int = 0) -> bool:
+        """Copy a frame into a free slot of the stream's worker; drops it when all slots are busy."""
+        index = self.worker_for(stream_id)
+        with self._lock:
+            if not self._free_slots[index]:
+                self.frames_dropped += 1
+                return False
+            slot = self._free_slots[index].pop()
+            generation = self._generations[index]
+        
+        if frame.nbytes > self.slot_bytes:
+            # Larger than the slots were sized for: downscale to fit
+            scale = np.sqrt(self.slot_bytes / frame.nbytes)
+            frame = cv2.resize(frame, (int(frame.shape[1] * scale), int(frame.shape[0] * scale)))
+            self.frames_downscaled += 1
+        
+        with self._lock:
+            if generation != self._generations[index]:
+                # The worker was restarted meanwhile, which freed every slot
+                self.frames_dropped += 1
+                return False
+            np.copyto(self._slot_view(index, slot, frame.shape), frame)
+            self._in_flight[(index, slot)] = (time.time(), frame.shape)
+            self.frames_submitted[index] += 1
+            self._tasks[index].put(("frame", stream_id, slot, frame.shape, seq))
+        return True
+    
+    def close_stream(self, stream_id: str):
+        """Drop a finished stream's state in its worker."""
+        with self._lock:
+            self._tasks[self.worker_for(stream_id)].put(("close", stream_id))
+    
+    def _release(self, index, slot):
+        """Return a slot to its worker's free list."""
+        with self._lock:
+            self._free_slots[index].append(slot)
+    
+    def _collect_results(self):
+        """Deliver worker results to the handler and recycle their slots."""
+        last_check = time.time()
+        while not self._stop_event.is_set():
+            if time.time() - last_check > 1.0:
+                self._check_workers()
+                last_check = time.time()
+            
+            readers = {reader: index for index, reader in enumerate(self._results) if reader is not None}
+            for reader in connection.wait(list(readers), timeout=0.5):
+                try:
+                    kind, index, slot, payload = reader.recv()
+                except (EOFError, OSError):
+                    # The worker exited; _check_workers restarts it with a new pipe
+                    self._results[readers[reader]] = None
+                    reader.close()
+                    continue
+                if kind == "result":
+                    self._handle_result(index, slot, payload)
+    
+    def _handle_result(self, index, slot, payload):
+        """Deliver one worker result to its stream's handler and recycle the slot."""
+        stream_id, event = payload
+        self.frames_completed[index] += 1
+        with self._lock:
+            in_flight = self._in_flight.pop((index, slot), None)
+        if in_flight is None:
+            # Slot was reclaimed after its worker died
+            return
+        submitted_at, shape = in_flight
+        self.last_latency = time.time() - submitted_at
+        
+        try:
+            handler = self._handlers.get(stream_id)
+            if event is None:
+                self.worker_errors += 1
+            elif handler is not None:
+                handler(stream_id, event, self._slot_view(index, slot, shape))
+        except Exception as e:
+            logger.error(f"Worker result handler failed: {e}")
+        finally:
+            self._release(index, slot)
+    
+    def _check_workers(self):
+        """Restart dead workers and reclaim the slots they held."""
+        for index, process in enumerate(self._processes):
+            if process is None or process.is_alive() or self._stop_event.is_set():
+                continue
+            logger.error(f"Recognition worker {index} exited with code {process.exitcode}, restarting")
+            with self._lock:
+                self._start_worker(index)
+                self._generations[index] += 1
+                self._free_slots[index] = list(range(self.slots_per_worker))
+                for slot in range(self.slots_per_worker):
+                    self._in_flight.pop((index, slot), None)
+            self.worker_restarts += 1
+    
+    def stop(self):
+        """Stop the workers and free the shared memory."""
+        self._stop_event.set()
+        for tasks in self._tasks:
+            if tasks is not None:
+                tasks.put(None)
+        for process in self._processes:
+            if process is not None:
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    process.terminate()
+        
+        if self._result_thread is not None:
+            self._result_thread.join(timeout=2.0)
+            self._result_thread = None
+        
+        for index, reader in enumerate(self._results):
+            if reader is not None:
+                reader.close()
+                self._results[index] = None
+        
+        for segment in self._segments:
+            try:
+                segment.close()
+                segment.unlink()
+            except Exception as e:
+                logger.error(f"Failed to release worker frame slots: {e}")
+        self._segments = []
+        logger.info("Recognition worker pool stopped")
+    
+    @property
+    def stats(self):
+        """Get per-worker and transport counters."""
+        with self._lock:
+            free = [len(slots) for slots in self._free_slots]
+        return {
+            "workers": [
+                {
+                    "alive": process is not None and process.is_alive(),
+                    "submitted": self.frames_submitted[index],
+                    "completed": self.frames_completed[index],
+                    "in_flight": self.slots_per_worker - free[index]
+                }
+                for index, process in enumerate(self._processes)
+            ],
+            "frames_dropped": self.frames_dropped,
+            "frames_downscaled": self.frames_downscaled,
+            "worker_errors": self.worker_errors,
+            "worker_restarts": self.worker_restarts,
+            "last_latency_ms": round(self.last_latency * 1000, 1)
+        }
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Make the src package importable when pytest runs from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Open right hand, wrist at the origin, roughly 200px tall
+TEMPLATE_HAND = np.array([
+    [0, 0], [-30, -20], [-50, -45], [-65, -70], [-80, -90],
+    [-20, -80], [-25, -120], [-28, -145], [-30, -165],
+    [0, -85], [0, -130], [0, -158], [0, -180],
+    [18, -80], [22, -120], [25, -145], [27, -165],
+    [35, -70], [42, -100], [46, -120], [50, -138]
+], dtype=np.float64)
+
+@pytest.fixture(scope="session")
+def hands():
+    """Cvzone-style hand dicts: rotated, scaled and jittered copies of the template hand."""
+    rng = np.random.default_rng(0)
+    result = []
+    for _ in range(200):
+        angle = rng.uniform(-0.6, 0.6)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        jittered = TEMPLATE_HAND + rng.normal(0, 8, TEMPLATE_HAND.shape)
+        points = (jittered @ rotation.T * rng.uniform(0.7, 1.4) + [320, 300]).astype(int)
+        x, y = points.min(axis=0)
+        w, h = points.max(axis=0) - points.min(axis=0)
+        result.append({
+            "bbox": (int(x), int(y), int(w), int(h)),
+            "lmList": [[int(px), int(py), 0] for px, py in points]
+        })
+    return result
+
+@pytest.fixture(scope="session")
+def tiny_model_path(tmp_path_factory):
+    """An untrained CNN with the sign model's 64x64 input and 26 letter outputs, saved as .h5.
+
+    The input is inverted and the output weights are wide so the skeleton
+    strokes rather than the white background decide the top-1 letter,
+    which then differs between hands.
+    """
+    tf = pytest.importorskip("tensorflow")
+    tf.keras.utils.set_random_seed(0)
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input((64, 64, 3)),
+        tf.keras.layers.Rescaling(-1.0, offset=1.0),
+        tf.keras.layers.Conv2D(8, 3, strides=2, activation="relu"),
+        tf.keras.layers.MaxPooling2D(),
+        tf.keras.layers.Flatten(),
+        tf.keras.layers.Dense(26, activation="softmax",
+                              kernel_initializer=tf.keras.initializers.RandomNormal(stddev=0.5))
+    ])
+    path = tmp_path_factory.mktemp("model") / "tiny.h5"
+    model.save(path)
+    return path
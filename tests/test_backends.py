@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.models.backends import TFLiteBackend, create_backend, resolve_backend_name
+from src.models.exporter import export_tflite
+
+@pytest.fixture(scope="module")
+def tflite_path(tiny_model_path, tmp_path_factory):
+    return export_tflite(tiny_model_path, tmp_path_factory.mktemp("tflite") / "tiny.tflite")
+
+def test_backend_is_picked_by_extension():
+    assert resolve_backend_name("model.tflite") == "tflite"
+    assert resolve_backend_name("model.onnx") == "onnx"
+    assert resolve_backend_name("model.h5") == "keras"
+    assert resolve_backend_name("model.h5", backend="tflite") == "tflite"
+    with pytest.raises(ValueError):
+        resolve_backend_name("model.h5", backend="torch")
+
+def test_padded_sizes_are_powers_of_two():
+    assert [TFLiteBackend.padded_size(n) for n in (1, 2, 3, 5, 8, 9, 16)] == [1, 2, 4, 8, 8, 16, 16]
+
+def test_tflite_batches_are_padded_to_preallocated_sizes(tflite_path):
+    backend = create_backend(tflite_path, backend="tflite")
+    rng = np.random.default_rng(0)
+    images = rng.random((16,) + backend.input_shape[1:], dtype=np.float32)
+    single = np.concatenate([backend.predict_batch(image[None]) for image in images])
+    
+    # Micro-batcher flushes come in every size; only power-of-two interpreters are allocated
+    for count in (3, 5, 16, 7, 3, 2, 13):
+        output = backend.predict_batch(images[:count])
+        assert output.shape == (count, 26)
+        np.testing.assert_allclose(output, single[:count], atol=1e-5)
+    
+    info = backend.info
+    assert info["allocated_batch_sizes"] == [1, 2, 4, 8, 16]
+    assert info["batches_padded"] == 5
+    assert info["rows_padded"] == 1 + 3 + 1 + 1 + 3
@@ -0,0 +1,64 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.models.batch_inference import BatchInferenceEngine
+from src.models.sign_model import SignLanguageModel
+
+@pytest.fixture(scope="module")
+def model(tiny_model_path):
+    return SignLanguageModel(str(tiny_model_path), warmup=False)
+
+class FailingModel:
+    input_shape = (None, 4)
+    
+    def predict_batch(self, batch):
+        raise RuntimeError("forward pass failed")
+
+def test_concurrent_requests_share_forward_passes(model):
+    engine = BatchInferenceEngine(model, max_batch_size=8, max_wait_ms=50)
+    engine.start()
+    rng = np.random.default_rng(0)
+    images = rng.random((24, 1) + model.input_shape[1:], dtype=np.float32)
+    expected = model.predict_batch(np.concatenate(images))
+    results = [None] * len(images)
+    
+    def request(i):
+        results[i] = engine.predict_proba(images[i])
+    
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(len(images))]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        engine.stop()
+    
+    # Every caller gets its own row back, from fewer passes than requests
+    np.testing.assert_allclose(np.stack(results), expected, atol=1e-5)
+    stats = engine.stats
+    assert stats["items_processed"] == len(images)
+    assert stats["batches_run"] < len(images)
+    assert stats["avg_batch_size"] > 1
+
+def test_failed_forward_pass_fails_every_request_in_the_batch():
+    engine = BatchInferenceEngine(FailingModel(), max_batch_size=4, max_wait_ms=20)
+    engine.start()
+    try:
+        futures = [engine.submit(np.zeros(4, np.float32)) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=1)
+        assert engine.predict_proba(np.zeros(4, np.float32)) is None
+    finally:
+        engine.stop()
+    assert engine.stats["items_failed"] == 4
+
+def test_stop_fails_pending_requests(model):
+    engine = BatchInferenceEngine(model)
+    future = engine.submit(np.zeros((1,) + model.input_shape[1:], np.float32))
+    engine.stop()
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
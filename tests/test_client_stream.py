@@ -0,0 +1,69 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from src.services.client_stream import ClientFrameStream
+
+JPEG = cv2.imencode('.jpg', np.zeros((48, 64, 3), np.uint8))[1].tobytes()
+
+class GatedRecognizer:
+    """Recognizes a frame only once the test opens the gate."""
+    
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+    
+    def recognize(self, frame, seq):
+        self.started.set()
+        self.gate.wait(timeout=2)
+        if seq == 2:
+            raise RuntimeError("model failed")
+        return frame, {"seq": seq, "shape": frame.shape}
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.005)
+
+def test_newest_frame_replaces_frames_waiting_behind_a_slow_one():
+    recognizer = GatedRecognizer()
+    results = []
+    stream = ClientFrameStream("client", recognizer, on_result=results.append)
+    stream.start()
+    try:
+        stream.push(JPEG)
+        assert recognizer.started.wait(timeout=2)
+        for _ in range(5):
+            stream.push(JPEG)
+        recognizer.gate.set()
+        wait_until(lambda: len(results) == 2)
+    finally:
+        stream.close()
+    
+    # Frame 1 was being recognized; of frames 2-6 only the newest ran
+    assert [event["seq"] for event in results] == [1, 6]
+    assert results[0]["shape"] == (48, 64, 3)
+    assert stream.stats["frames_received"] == 6
+    assert stream.stats["frames_dropped"] == 4
+
+def test_bad_frames_and_failures_are_counted_and_skipped():
+    recognizer = GatedRecognizer()
+    recognizer.gate.set()
+    results = []
+    stream = ClientFrameStream("client", recognizer, on_result=results.append)
+    stream.start()
+    try:
+        for data in (b"not a jpeg", JPEG, JPEG):
+            stream.push(data)
+            wait_until(lambda: stream._pending is None)
+        wait_until(lambda: results)
+    finally:
+        stream.close()
+    
+    stats = stream.stats
+    assert stats["decode_errors"] == 1
+    assert stats["processing_errors"] == 1
+    assert [event["seq"] for event in results] == [3]
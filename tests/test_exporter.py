@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.models.backends import create_backend
+from src.models.exporter import check_parity, export_onnx, export_tflite
+from src.services.skeleton_renderer import SkeletonRenderer
+
+@pytest.fixture(scope="module")
+def fixtures(hands):
+    """Skeleton canvases at model resolution, as the live pipeline feeds them."""
+    renderer = SkeletonRenderer(400, (64, 64))
+    return np.concatenate([renderer.render(hand).copy() for hand in hands[:64]])
+
+def test_tflite_export_matches_keras(tiny_model_path, fixtures, tmp_path):
+    output = export_tflite(tiny_model_path, tmp_path / "tiny.tflite")
+    
+    parity = check_parity(
+        create_backend(tiny_model_path, backend="keras"),
+        create_backend(output, backend="tflite"),
+        fixtures
+    )
+    assert parity["samples"] == len(fixtures)
+    assert parity["agreement"] == 1.0, parity["mismatches"]
+    assert parity["max_probability_diff"] < 1e-4
+
+def test_onnx_export_matches_keras(tiny_model_path, fixtures, tmp_path):
+    pytest.importorskip("tf2onnx")
+    pytest.importorskip("onnxruntime")
+    output = export_onnx(tiny_model_path, tmp_path / "tiny.onnx")
+    
+    parity = check_parity(
+        create_backend(tiny_model_path, backend="keras"),
+        create_backend(output, backend="onnx"),
+        fixtures
+    )
+    assert parity["agreement"] == 1.0, parity["mismatches"]
+    assert parity["max_probability_diff"] < 1e-4
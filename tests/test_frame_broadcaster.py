@@ -0,0 +1,104 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.services.frame_broadcaster import FrameBroadcaster, parse_stream_tiers
+
+def solid_frame(value, width=640, height=480):
+    return np.full((height, width, 3), value, np.uint8)
+
+def decode(chunk):
+    """Decode the JPEG inside a multipart chunk."""
+    jpeg = chunk[chunk.index(b'\r\n\r\n') + 4:-2]
+    return cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+
+def wait_for_subscribers(broadcaster, count, timeout=2.0):
+    deadline = time.time() + timeout
+    while broadcaster.stats["subscribers"] < count:
+        assert time.time() < deadline, "subscriber never registered"
+        time.sleep(0.005)
+
+def start_subscriber(broadcaster, **options):
+    """Subscribe on a thread that takes the first chunk; returns the generator and the thread."""
+    stream = broadcaster.subscribe(**options)
+    first = []
+    thread = threading.Thread(target=lambda: first.append(next(stream, None)), daemon=True)
+    thread.start()
+    wait_for_subscribers(broadcaster, 1)
+    return stream, thread, first
+
+def test_unwatched_frames_are_not_encoded():
+    broadcaster = FrameBroadcaster()
+    assert broadcaster.publish(solid_frame(10)) == 0
+    stats = broadcaster.stats
+    assert stats["frames_unwatched"] == 1
+    assert stats["tiers"]["full"]["frames_encoded"] == 0
+
+def test_slow_subscriber_skips_to_the_newest_frame():
+    broadcaster = FrameBroadcaster()
+    stream, thread, first = start_subscriber(broadcaster)
+    broadcaster.publish(solid_frame(10))
+    thread.join(timeout=2)
+    assert decode(first[0]).mean() == pytest.approx(10, abs=2)
+    
+    # Three frames arrive while the client is busy; it gets only the last one
+    for value in (60, 120, 200):
+        broadcaster.publish(solid_frame(value))
+    assert decode(next(stream)).mean() == pytest.approx(200, abs=2)
+    
+    stats = broadcaster.stats
+    assert stats["frames_sent"] == 2
+    assert stats["frames_skipped"] == 2
+    assert stats["tiers"]["full"]["frames_encoded"] == 4
+    
+    stream.close()
+    assert broadcaster.stats["subscribers"] == 0
+
+def test_close_ends_subscriber_streams():
+    broadcaster = FrameBroadcaster()
+    stream, thread, first = start_subscriber(broadcaster)
+    broadcaster.close()
+    thread.join(timeout=2)
+    assert not thread.is_alive() and first == [None]
+
+TIERS = parse_stream_tiers("low:320:50,full:0:80,medium:480:70")
+
+def test_tiers_are_sorted_largest_first():
+    assert [tier.name for tier in TIERS] == ["full", "medium", "low"]
+    assert parse_stream_tiers("", default_quality=75) == [("full", 0, 75)]
+
+def test_tier_selection_by_name_and_caps():
+    broadcaster = FrameBroadcaster(TIERS)
+    assert broadcaster.select_tier().name == "full"
+    assert broadcaster.select_tier("low").name == "low"
+    assert broadcaster.select_tier(max_width=500).name == "medium"
+    assert broadcaster.select_tier(max_width=400, max_quality=80).name == "low"
+    assert broadcaster.select_tier(max_quality=60).name == "low"
+    # Nothing fits: the smallest tier
+    assert broadcaster.select_tier(max_width=100).name == "low"
+    assert broadcaster.select_tier("missing").name == "full"
+
+def test_only_watched_tiers_are_encoded_at_their_width():
+    broadcaster = FrameBroadcaster(TIERS)
+    stream, thread, first = start_subscriber(broadcaster, tier=broadcaster.select_tier("low"))
+    assert broadcaster.publish(solid_frame(90)) == 1
+    thread.join(timeout=2)
+    
+    assert decode(first[0]).shape == (240, 320, 3)
+    tiers = broadcaster.stats["tiers"]
+    assert tiers["low"]["frames_encoded"] == 1
+    assert tiers["full"]["frames_encoded"] == tiers["medium"]["frames_encoded"] == 0
+    stream.close()
+
+def test_tier_is_encoded_no_faster_than_its_fastest_viewer():
+    broadcaster = FrameBroadcaster(TIERS)
+    stream, thread, first = start_subscriber(broadcaster, tier=TIERS[0], max_fps=5)
+    encoded = [broadcaster.publish(solid_frame(value)) for value in range(10)]
+    thread.join(timeout=2)
+    
+    # Ten frames published back to back, one encode within the 200ms interval
+    assert encoded == [1] + [0] * 9
+    stream.close()
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.services.frame_buffer import FrameRingBuffer
+
+SHAPE = (32, 32)
+
+def test_rejects_single_slot():
+    with pytest.raises(ValueError):
+        FrameRingBuffer(1)
+
+def test_reader_gets_newest_frame_and_counts_drops():
+    buffer = FrameRingBuffer(3)
+    for value in (1, 2, 3):
+        buffer.begin_write(SHAPE)[:] = value
+        buffer.commit_write(timestamp=float(value))
+    
+    seq, frame = buffer.read_latest(timeout=0.1)
+    assert seq == 3 and (frame == 3).all()
+    assert buffer.latest_timestamp() == 3.0
+    # Nothing newer: the reader times out instead of getting the same frame twice
+    assert buffer.read_latest(timeout=0.05) == (0, None)
+    assert buffer.stats["frames_dropped"] == 0
+    
+    for value in (4, 5, 6, 7):
+        buffer.begin_write(SHAPE)[:] = value
+        buffer.commit_write()
+    seq, frame = buffer.read_latest(timeout=0.1)
+    assert seq == 7 and (frame == 7).all()
+    # Only frame 4 was overwritten unread; 5 and 6 are skipped but still in the ring
+    assert buffer.stats["frames_dropped"] == 1
+
+def test_close_wakes_waiting_reader():
+    buffer = FrameRingBuffer(2)
+    threading.Timer(0.05, buffer.close).start()
+    assert buffer.read_latest(timeout=2) == (0, None)
+
+@pytest.mark.parametrize("capacity", [2, 3])
+def test_reader_never_sees_a_frame_being_written(capacity):
+    buffer = FrameRingBuffer(capacity)
+    stop = threading.Event()
+    errors = []
+    
+    def writer():
+        seq = 0
+        while not stop.is_set():
+            seq += 1
+            slot = buffer.begin_write(SHAPE, np.int64)
+            # Fill in two halves so a torn read shows up as mixed values
+            slot[:SHAPE[0] // 2] = seq
+            time.sleep(0)
+            slot[SHAPE[0] // 2:] = seq
+            buffer.commit_write()
+    
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    last_seq = 0
+    reads = 0
+    deadline = time.time() + 1.0
+    try:
+        while time.time() < deadline:
+            seq, frame = buffer.read_latest(timeout=1)
+            assert frame is not None
+            assert seq > last_seq
+            # Hold the lease while the writer keeps going
+            time.sleep(0.0002)
+            if frame.min() != seq or frame.max() != seq:
+                errors.append((seq, int(frame.min()), int(frame.max())))
+            last_seq = seq
+            reads += 1
+    finally:
+        stop.set()
+        thread.join(timeout=2)
+    
+    assert reads > 50
+    assert not errors, errors[:5]
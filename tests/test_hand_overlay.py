@@ -0,0 +1,53 @@
+import json
+
+from src.services.hand_overlay import HandOverlayFeed
+
+def event(seq, hand=True):
+    return {
+        "seq": seq,
+        "frame_size": [640, 480],
+        "hand_detected": hand,
+        "bbox": [10, 20, 100, 120] if hand else None,
+        "landmarks": [[15, 25, 0]] * 21 if hand else None,
+        "predicted_letter": "A" if hand else ""
+    }
+
+def data(message):
+    assert message.startswith("data: ")
+    return json.loads(message[len("data: "):])
+
+def test_unwatched_updates_are_not_encoded():
+    feed = HandOverlayFeed()
+    feed.publish(event(1))
+    stats = feed.stats
+    assert stats["updates_unwatched"] == 1 and stats["updates_published"] == 0
+
+def test_viewer_gets_hand_then_a_single_clear():
+    feed = HandOverlayFeed(heartbeat_interval=0.05)
+    stream = feed.stream()
+    assert next(stream) == "retry: 1000\n\n"
+    
+    feed.publish(event(1))
+    update = data(next(stream))
+    assert update["seq"] == 1 and update["letter"] == "A" and len(update["landmarks"]) == 21
+    
+    # Consecutive frames without a hand clear the overlay once
+    for seq in (2, 3, 4):
+        feed.publish(event(seq, hand=False))
+    assert data(next(stream)) == {"seq": 2, "frame_size": [640, 480], "bbox": None, "landmarks": None}
+    assert next(stream) == ": keepalive\n\n"
+    
+    stream.close()
+    assert feed.stats["subscribers"] == 0
+
+def test_slow_viewer_skips_to_the_newest_hand():
+    feed = HandOverlayFeed()
+    stream = feed.stream()
+    next(stream)
+    for seq in range(1, 6):
+        feed.publish(event(seq))
+    
+    assert data(next(stream))["seq"] == 5
+    assert feed.stats["updates_skipped"] == 4
+    feed.close()
+    assert list(stream) == []
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cvzone")
+
+from src.services.hand_tracker import HandTracker
+
+@pytest.fixture
+def tracker():
+    tracker = HandTracker(max_box_change=0.5, velocity_smoothing=0.0, draw=False)
+    # Hand last seen at 100,100 200x200, moving 20px right per frame
+    tracker._update_motion({"bbox": (80, 100, 200, 200)})
+    tracker._update_motion({"bbox": (100, 100, 200, 200)})
+    return tracker
+
+def test_box_following_the_predicted_motion_is_kept(tracker):
+    assert tracker._predicted_center().tolist() == [220.0, 200.0]
+    assert tracker._box_consistent((120, 100, 200, 200))
+    assert tracker._box_consistent((150, 120, 240, 230))
+
+def test_box_that_jumps_in_size_is_rejected(tracker):
+    # Fingers cut off by the crop, or the hand much closer than a frame ago
+    assert not tracker._box_consistent((170, 170, 60, 60))
+    assert not tracker._box_consistent((20, 0, 400, 400))
+
+def test_box_far_from_the_predicted_center_is_rejected(tracker):
+    # Same size, but on the other side of the crop
+    assert not tracker._box_consistent((350, 100, 200, 200))
+    assert not tracker._box_consistent((120, 310, 200, 200))
+
+def test_prediction_crop_covers_motion_and_stays_in_frame(tracker):
+    x0, y0, x1, y1 = tracker._predict_roi((480, 640, 3))
+    assert 0 <= x0 < 220 < x1 <= 640
+    assert 0 <= y0 < 200 < y1 <= 480
+    assert x1 - x0 >= 400
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cvzone")
+
+from src.services.landmark_extractor import LandmarkExtractor
+
+def hand_at(points):
+    points = np.array(points)
+    x, y = points.min(axis=0)
+    w, h = points.max(axis=0) - points.min(axis=0)
+    return {"bbox": (int(x), int(y), int(w), int(h)), "lmList": [[int(px), int(py), 0] for px, py in points]}
+
+@pytest.mark.parametrize("points", [
+    [(10, 12), (60, 90), (35, 50)],        # top-left corner, inside the offset
+    [(600, 400), (635, 470), (620, 430)],  # bottom-right corner
+    [(300, 200), (360, 300), (330, 250)]   # away from the edges
+])
+def test_crop_landmarks_index_the_returned_crop(points, monkeypatch):
+    extractor = LandmarkExtractor()
+    frame = np.zeros((480, 640), np.uint8)
+    for px, py in points:
+        frame[py, px] = 255
+    monkeypatch.setattr(extractor, "detect", lambda image: [hand_at(points)])
+    
+    extracted = extractor.extract(frame, offset=29)
+    x0, y0 = extracted["origin"]
+    assert x0 >= 0 and y0 >= 0
+    for lx, ly, _ in extracted["lmList"]:
+        assert extracted["crop"][ly, lx] == 255
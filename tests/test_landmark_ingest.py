@@ -0,0 +1,77 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.services.landmark_ingest import (
+    BATCH_HEADER, LandmarkStream, decode_landmark_batch, encode_landmark_batch, hand_from_landmarks
+)
+from tests.conftest import TEMPLATE_HAND
+
+POINTS = np.column_stack([TEMPLATE_HAND + [320, 300], np.arange(21) - 10])
+
+class RecordingRecognizer:
+    def __init__(self):
+        self.calls = []
+    
+    def recognize_hand(self, hand, seq, timestamp):
+        self.calls.append((hand, seq, timestamp))
+        return {"seq": seq, "hand_detected": hand is not None}
+
+@pytest.mark.parametrize("float16", [False, True])
+def test_batch_round_trip(float16):
+    data = encode_landmark_batch([(1000, POINTS), (1033, None)], float16=float16)
+    assert len(data) == BATCH_HEADER.itemsize + 2 * 132
+    
+    records = decode_landmark_batch(data)
+    assert records["timestamp_ms"].tolist() == [1000, 1033]
+    assert records["hand"].tolist() == [1, 0]
+    np.testing.assert_allclose(records["points"][0], POINTS, atol=0.5)
+    assert decode_landmark_batch(encode_landmark_batch([])).shape == (0,)
+
+def test_malformed_batches_are_rejected():
+    data = encode_landmark_batch([(0, POINTS)] * 3)
+    bad_version = bytes([2]) + data[1:]
+    
+    for malformed in (b"", data[:3], bad_version, data[:-1], data + b"\x00"):
+        with pytest.raises(ValueError):
+            decode_landmark_batch(malformed)
+
+def test_oversized_batch_is_rejected_before_reading_records():
+    # Claims 300 records, carries none: must fail on the count, not the size
+    header = np.zeros(1, BATCH_HEADER)
+    header["version"], header["count"] = 1, 300
+    with pytest.raises(ValueError, match="at most 256"):
+        decode_landmark_batch(header.tobytes(), max_records=256)
+    
+    with pytest.raises(ValueError, match="at most 2"):
+        decode_landmark_batch(encode_landmark_batch([(0, None)] * 3), max_records=2)
+
+def test_hand_dict_matches_cvzone_bbox():
+    hand = hand_from_landmarks(POINTS)
+    x, y, w, h = hand["bbox"]
+    assert (x, y) == tuple(POINTS[:, :2].min(axis=0).astype(int))
+    assert (x + w, y + h) == tuple(POINTS[:, :2].max(axis=0).astype(int))
+    assert len(hand["lmList"]) == 21 and hand["lmList"][0][2] == -10
+
+def test_stream_places_records_on_the_server_clock():
+    recognizer = RecordingRecognizer()
+    stream = LandmarkStream(recognizer, max_records=8)
+    
+    # Ages are relative to the last record, across a wrap of the client clock;
+    # the middle record is newer than the last one and gets age 0
+    records = [(0xFFFFFFF0, POINTS), (0x10, None), (0x08, POINTS)]
+    before = time.time()
+    events = stream.process(encode_landmark_batch(records))
+    
+    assert [event["seq"] for event in events] == [1, 2, 3]
+    assert [event["hand_detected"] for event in events] == [True, False, True]
+    timestamps = [timestamp for _, _, timestamp in recognizer.calls]
+    assert timestamps[1] - timestamps[0] == pytest.approx(0.024, abs=1e-4)
+    assert timestamps[2] == timestamps[1] >= before
+    
+    with pytest.raises(ValueError):
+        stream.process(b"\x01")
+    stats = stream.stats
+    assert stats["batch_errors"] == 1
+    assert stats["records_received"] == 3 and stats["hands_received"] == 2
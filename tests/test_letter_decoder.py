@@ -0,0 +1,84 @@
+import string
+import threading
+
+import numpy as np
+import pytest
+
+from src.services.letter_decoder import BeamLetterDecoder, LexiconLetterPrior
+
+LABELS = list(string.ascii_uppercase)
+WORDS = ["CAT", "CAR", "CART", "QUIZ", "QUICK", "HELLO"]
+
+def one_hot(letter, strength=0.9):
+    probs = np.full(len(LABELS), (1 - strength) / (len(LABELS) - 1))
+    probs[LABELS.index(letter)] = strength
+    return probs
+
+@pytest.fixture
+def prior():
+    return LexiconLetterPrior(LABELS, words=WORDS, pseudo_words=1.0)
+
+def test_prior_is_a_distribution_favouring_lexicon_continuations(prior):
+    log_probs = prior.log_probs([], "QU")
+    assert np.exp(log_probs).sum() == pytest.approx(1.0)
+    assert LABELS[int(np.argmax(log_probs))] == "I"
+    # Unknown prefixes fall back to uniform and stay spellable
+    assert np.allclose(prior.log_probs([], "XY"), np.log(1 / len(LABELS)))
+
+def test_shared_prior_cache_survives_concurrent_sessions():
+    prior = LexiconLetterPrior(LABELS, words=WORDS, cache_size=4)
+    prefixes = ["", "C", "CA", "CAR", "Q", "QU", "QUI", "H", "HE", "X"]
+    errors = []
+    
+    def session(seed):
+        rng = np.random.default_rng(seed)
+        try:
+            for _ in range(2000):
+                prior.log_probs([], prefixes[rng.integers(len(prefixes))])
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors
+    assert len(prior._cache) <= 4
+
+def test_decoder_commits_confident_letter_after_min_frames(prior):
+    decoder = BeamLetterDecoder(LABELS, prior=prior, min_frames=3, hand_stable_time=60)
+    for frame in range(3):
+        decoder.add_prediction("C", one_hot("C", 0.99))
+        assert decoder.get_current_letter() == "C"
+        assert decoder.should_add_letter("C") == (frame == 2)
+    
+    decoder.add_letter("C")
+    assert decoder.decoded_word() == "C"
+    assert decoder.letter_posterior() is None
+
+def test_lexicon_prior_breaks_ambiguous_evidence(prior):
+    decoder = BeamLetterDecoder(LABELS, prior=prior)
+    decoder.sync_text([], "CA")
+    
+    # The model can't tell T from Z; only CAT is a word
+    probs = np.full(len(LABELS), 0.02)
+    probs[LABELS.index("T")] = probs[LABELS.index("Z")] = 0.3
+    decoder.add_prediction("Z", probs)
+    assert decoder.get_current_letter() == "T"
+    
+    decoder.add_letter("T")
+    assert decoder.decoded_word() == "CAT"
+    assert "CAZ" in [prefix for prefix, _ in decoder.beams]
+
+def test_sync_text_restarts_beam_after_outside_edit(prior):
+    decoder = BeamLetterDecoder(LABELS, prior=prior)
+    decoder.add_prediction("C", one_hot("C"))
+    decoder.add_letter("C")
+    decoder.sync_text(["HELLO"], "Q")
+    
+    assert decoder.beams == [("Q", 0.0)]
+    assert decoder.context == ["HELLO"]
+    decoder.reset_state()
+    assert decoder.decoded_word() == ""
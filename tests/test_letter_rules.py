@@ -0,0 +1,36 @@
+import pytest
+
+from scripts.check_letter_rules import legacy_classify, synthesize_landmarks
+from src.models.letter_rules import CNN8_GROUPS, LetterRuleEngine
+
+GROUPS = range(len(CNN8_GROUPS))
+
+@pytest.fixture(scope="module")
+def hands():
+    """Fixed-seed hand-like and random landmark sets reaching every rule branch."""
+    return synthesize_landmarks(500, seed=0)
+
+@pytest.fixture(scope="module")
+def engine():
+    return LetterRuleEngine()
+
+def assert_same(expected, actual, case):
+    # 1 and "1" or " " and None must not pass as equal decisions
+    assert (actual, type(actual)) == (expected, type(expected)), case
+
+def test_classify_matches_legacy_rules(hands, engine):
+    for pts in hands.tolist():
+        for ch1 in GROUPS:
+            for ch2 in GROUPS:
+                assert_same(legacy_classify(pts, ch1, ch2), engine.classify(pts, ch1, ch2), (pts, ch1, ch2))
+
+def test_batched_decisions_match_legacy_rules(hands, engine):
+    for pts, bits in zip(hands.tolist(), engine.evaluate_atoms_batch(hands)):
+        for ch1 in GROUPS:
+            for ch2 in GROUPS:
+                assert_same(legacy_classify(pts, ch1, ch2), engine.decide(bits, ch1, ch2), (pts, ch1, ch2))
+
+def test_fixtures_reach_every_outcome(hands):
+    outcomes = {str(legacy_classify(pts, ch1, ch2)) for pts in hands.tolist() for ch1 in GROUPS for ch2 in GROUPS}
+    # Every letter, the space, next and backspace gestures, and group 1 without a matching rule
+    assert outcomes == {chr(65 + i) for i in range(26)} | {" ", "next", "Backspace", "1"}
@@ -0,0 +1,66 @@
+import string
+
+import numpy as np
+import pytest
+
+from src.services.letter_segmenter import ViterbiLetterSegmenter
+
+LABELS = list(string.ascii_uppercase)
+BLUR = np.full(len(LABELS), 1 / len(LABELS))
+
+def held(letter, strength=0.9):
+    probs = np.full(len(LABELS), (1 - strength) / (len(LABELS) - 1))
+    probs[LABELS.index(letter)] = strength
+    return probs
+
+def signing(word, hold=6, gap=3):
+    """Frames of a word: each letter held, with blurred transition frames in between."""
+    frames = []
+    for letter in word:
+        frames += [held(letter)] * hold + [BLUR] * gap
+    return frames
+
+def run(segmenter, frames):
+    """Drive the segmenter the way RecognitionSession does; returns the committed text."""
+    text = ""
+    for probs in frames:
+        segmenter.add_prediction(LABELS[int(np.argmax(probs))], probs)
+        letter = segmenter.get_current_letter()
+        if letter and segmenter.should_add_letter(letter):
+            segmenter.add_letter(letter)
+            text += letter
+    return text
+
+@pytest.fixture
+def segmenter():
+    return ViterbiLetterSegmenter(LABELS)
+
+def test_held_letters_are_committed_without_timers(segmenter):
+    assert run(segmenter, signing("CAB")) == "CAB"
+
+def test_double_letter_needs_a_transition_between_holds(segmenter):
+    assert run(segmenter, signing("HELLO")) == "HELLO"
+    segmenter.reset_state()
+    # One long hold of L is a single letter
+    assert run(segmenter, [held("L")] * 20 + [BLUR] * 3) == "L"
+
+def test_single_flicker_frame_does_not_commit(segmenter):
+    # The model briefly prefers X while A keeps some of the mass
+    flicker = held("X", 0.6)
+    flicker[LABELS.index("A")] = 0.3
+    frames = [held("A")] * 5 + [flicker] + [held("A")] * 5 + [BLUR] * 4
+    assert run(segmenter, frames) == "A"
+
+def test_hand_lost_settles_the_open_hold(segmenter):
+    # Too weak to pass commit_margin while the hand is up
+    frames = [held("K", 0.3)] * 3
+    assert run(segmenter, frames) == ""
+    assert segmenter.hand_lost() == ["K"]
+    segmenter.add_letter("K")
+    assert segmenter.get_current_letter() == ""
+    assert segmenter.stats["frames_decided"] == 3
+
+def test_probabilities_are_spread_when_only_the_top_letter_is_known(segmenter):
+    for _ in range(6):
+        segmenter.add_prediction("Q", confidence=0.9)
+    assert segmenter.get_current_letter() == "Q"
@@ -0,0 +1,54 @@
+from collections import Counter
+
+import pytest
+
+from src.models.ngram_model import NGramModel, build_model, tokenize
+
+CORPUS = """\
+I need help now
+I need water
+I need water please
+turn on the light
+turn on the light
+turn on the fan
+good morning teacher
+good night
+"""
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("ngram")
+    corpus = directory / "corpus.txt"
+    corpus.write_text(CORPUS)
+    build_model([corpus], directory / "model", order=3, include_builtin=False)
+    return NGramModel(directory / "model")
+
+def test_counts_match_the_corpus(model):
+    sentences = [tokenize(line) for line in CORPUS.splitlines()]
+    for n in (1, 2, 3):
+        expected = Counter(tuple(words[i:i + n]) for words in sentences for i in range(len(words) - n + 1))
+        for ngram, count in expected.items():
+            assert model.count([model.word_id(word) for word in ngram]) == count, ngram
+    
+    assert model.count([model.word_id("NEED"), model.word_id("I")]) == 0
+    assert model.word_id("ZEBRA") == -1
+
+def test_prediction_uses_the_longest_known_context(model):
+    assert model.predict(["I", "NEED"], k=2) == ["WATER", "HELP"]
+    assert model.predict(["TURN", "ON"], k=1) == ["THE"]
+    assert model.predict(["ON", "THE"], k=2) == ["LIGHT", "FAN"]
+    # Unknown earlier words are ignored; an unseen context backs off to unigrams
+    assert model.predict(["ZEBRA", "GOOD"], k=2) == ["MORNING", "NIGHT"]
+    assert model.predict(["ZEBRA"], k=1) == ["I"]
+
+def test_prediction_filters_by_the_spelled_prefix(model):
+    assert model.predict(["GOOD"], "N") == ["NIGHT", "NEED", "NOW"]
+    assert model.predict(["I", "NEED"], "H") == ["HELP"]
+    # The word already spelled is not suggested again
+    assert "WATER" not in model.predict(["I", "NEED"], "water")
+    assert model.predict(["I"], "XYZ") == []
+
+def test_phrase_continues_while_one_word_dominates(model):
+    assert model.continue_phrase(["TURN", "ON"]) == ["THE", "LIGHT"]
+    assert model.continue_phrase(["I"], min_probability=0.7) == ["NEED"]
+    assert model.continue_phrase(["ZEBRA"]) == []
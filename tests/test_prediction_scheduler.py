@@ -0,0 +1,50 @@
+from src.services.prediction_scheduler import REUSE, RUN, SKIP, PredictionScheduler
+from tests.conftest import TEMPLATE_HAND
+
+def hand(shift=(0.0, 0.0), scale=1.0):
+    points = TEMPLATE_HAND * scale + [320, 300] + shift
+    x, y = points.min(axis=0)
+    w, h = points.max(axis=0) - points.min(axis=0)
+    return {"bbox": (x, y, w, h), "lmList": [[px, py, 0] for px, py in points]}
+
+def decide(scheduler, frame):
+    decision = scheduler.decide(frame)
+    if decision == RUN:
+        scheduler.record("A", 0.001)
+    return decision
+
+def test_fixed_cadence_without_adaptation():
+    scheduler = PredictionScheduler(predict_every=4, adaptive=False, cpu_budget=1.0)
+    decisions = [decide(scheduler, hand((i * 30, 0))) for i in range(9)]
+    assert decisions == [RUN, SKIP, SKIP, SKIP, RUN, SKIP, SKIP, SKIP, RUN]
+
+def test_moving_hand_runs_every_frame():
+    scheduler = PredictionScheduler(predict_every=4)
+    decisions = [decide(scheduler, hand((i * 15, 0))) for i in range(6)]
+    assert decisions == [RUN] * 6
+    assert scheduler.stats["executed_motion"] == 5
+
+def test_still_hand_reuses_the_cached_prediction_up_to_max_reuse():
+    scheduler = PredictionScheduler(predict_every=2, max_reuse=3)
+    decisions = [decide(scheduler, hand()) for _ in range(11)]
+    assert decisions == [RUN, SKIP, REUSE, SKIP, REUSE, SKIP, REUSE, SKIP, RUN, SKIP, REUSE]
+
+def test_motion_is_relative_to_hand_size():
+    # The same 6px shift is motion for a small, far hand but not for a large, near one
+    near = PredictionScheduler(predict_every=4)
+    far = PredictionScheduler(predict_every=4)
+    decide(near, hand(scale=2.0))
+    decide(far, hand(scale=0.5))
+    assert decide(near, hand((6, 0), scale=2.0)) == SKIP
+    assert decide(far, hand((6, 0), scale=0.5)) == RUN
+
+def test_over_budget_reuses_instead_of_running():
+    scheduler = PredictionScheduler(predict_every=1, adaptive=False, cpu_budget=0.1, budget_window=10.0)
+    assert scheduler.decide(hand()) == RUN
+    scheduler.record("A", 2.0)
+    assert scheduler.decide(hand()) == REUSE
+    assert scheduler.stats["reused_budget"] == 1
+    
+    scheduler.reset()
+    assert scheduler.decide(hand()) == SKIP
+    assert scheduler.stats["skipped_budget"] == 1
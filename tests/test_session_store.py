@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from src.services.letter_stabilizer import LetterStabilizer
+from src.services.session_store import RecognitionSession, SessionStore
+
+def make_store(**options):
+    return SessionStore(lambda session_id: RecognitionSession(session_id, LetterStabilizer()), **options)
+
+def hand_event(letter):
+    return {"hand_detected": True, "predicted_letter": letter}
+
+def test_sessions_keep_separate_text():
+    store = make_store()
+    store.get_or_create("a").add_space()
+    store.get_or_create("a").append_suggestion("HELLO")
+    
+    assert store.get_or_create("a").snapshot()["sentence"] == "HELLO"
+    assert store.get_or_create("b").snapshot()["sentence"] == ""
+    assert store.get("missing") is None
+    assert store.stats["created"] == 2
+
+def test_least_recently_used_session_is_evicted():
+    store = make_store(max_sessions=2)
+    first = store.get_or_create("a")
+    store.get_or_create("b")
+    assert store.get("a") is first
+    store.get_or_create("c")
+    
+    assert store.get("b") is None
+    assert store.get("a") is first
+    assert store.stats["evicted"] == 1
+
+def test_idle_sessions_expire():
+    store = make_store(idle_ttl=0.05, sweep_interval=0)
+    store.get_or_create("idle")
+    time.sleep(0.1)
+    store.get_or_create("active")
+    
+    assert store.get("idle") is None
+    assert len(store) == 1
+    assert store.stats["expired"] == 1
+
+def test_sessions_with_open_streams_are_never_evicted_or_expired():
+    store = make_store(max_sessions=2, idle_ttl=0.05, sweep_interval=0)
+    listening = store.get_or_create("listening")
+    listening.attach_stream()
+    time.sleep(0.1)
+    
+    # Cookieless requests each create a session
+    for i in range(5):
+        store.get_or_create(f"anonymous-{i}")
+    assert store.get("listening") is listening
+    assert len(store) == 2
+    
+    # Once the stream closes the session ages out like any other
+    listening.detach_stream()
+    time.sleep(0.1)
+    store.get_or_create("newcomer")
+    assert store.get("listening") is None
+
+def test_version_moves_only_when_visible_state_changes():
+    session = RecognitionSession("a", LetterStabilizer())
+    version = session.snapshot()["version"]
+    session.delete_last()
+    assert session.snapshot()["version"] == version
+    
+    session.observe(hand_event("A"))
+    state = session.wait_for_change(version, timeout=0.1)
+    assert state["letter"] == "A" and state["version"] == version + 1
+    assert session.wait_for_change(state["version"], timeout=0.05) is None
+
+def test_stable_letter_is_committed():
+    session = RecognitionSession("a", LetterStabilizer(hand_stable_time=0))
+    session.observe(hand_event("B"))
+    session.observe(hand_event("B"))
+    
+    assert session.snapshot()["sentence"] == "B"
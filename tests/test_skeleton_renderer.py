@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.services.frame_recognizer import prepare_model_input
+from src.services.skeleton_renderer import SkeletonRenderer
+from tests.conftest import TEMPLATE_HAND
+
+HandDetectionService = pytest.importorskip("src.services.hand_detector").HandDetectionService
+
+CANVAS_SIZE = 400
+INPUT_SIZE = (64, 64)
+# Hand tilts the test model learns to tell apart, one class each
+POSES = (-0.6, -0.2, 0.2, 0.6)
+
+def make_hands(count, seed=0):
+    """Cvzone-style hands tilted to one of POSES, with their pose index as the label."""
+    rng = np.random.default_rng(seed)
+    hands, labels = [], []
+    for i in range(count):
+        label = i % len(POSES)
+        angle = POSES[label] + rng.uniform(-0.08, 0.08)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        jittered = TEMPLATE_HAND + rng.normal(0, 8, TEMPLATE_HAND.shape)
+        points = (jittered @ rotation.T * rng.uniform(0.7, 1.4) + [320, 300]).astype(int)
+        x, y = points.min(axis=0)
+        w, h = points.max(axis=0) - points.min(axis=0)
+        hands.append({
+            "bbox": (int(x), int(y), int(w), int(h)),
+            "lmList": [[int(px), int(py), 0] for px, py in points]
+        })
+        labels.append(label)
+    return hands, np.array(labels)
+
+@pytest.fixture(scope="module")
+def renders():
+    """The same hands through the original canvas path and through SkeletonRenderer."""
+    hands, labels = make_hands(200)
+    # The original drawing code does not need the mediapipe detector itself
+    detector = HandDetectionService.__new__(HandDetectionService)
+    renderer = SkeletonRenderer(CANVAS_SIZE, INPUT_SIZE)
+    reference = np.concatenate([
+        prepare_model_input(detector.extract_hand_roi(None, hand, CANVAS_SIZE), INPUT_SIZE) for hand in hands
+    ])
+    fast = np.concatenate([renderer.render(hand).copy() for hand in hands])
+    return reference, fast, labels
+
+def test_render_pixel_error(renders):
+    reference, fast, _ = renders
+    error = np.abs(reference - fast)
+    assert error.mean() < 0.025
+    assert error.mean(axis=(1, 2, 3)).max() < 0.035
+
+def test_render_predictions_match(renders):
+    tf = pytest.importorskip("tensorflow")
+    reference, fast, labels = renders
+    
+    # A small CNN trained on the original renders stands in for the sign model
+    tf.keras.utils.set_random_seed(0)
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(INPUT_SIZE[::-1] + (3,)),
+        tf.keras.layers.Rescaling(-1.0, offset=1.0),
+        tf.keras.layers.Conv2D(8, 3, strides=2, activation="relu"),
+        tf.keras.layers.MaxPooling2D(),
+        tf.keras.layers.Flatten(),
+        tf.keras.layers.Dense(26, activation="softmax")
+    ])
+    model.compile("adam", "sparse_categorical_crossentropy")
+    model.fit(reference[:120], labels[:120], epochs=20, batch_size=32, verbose=0)
+    
+    reference_top = model.predict(reference[120:], verbose=0).argmax(axis=1)
+    fast_top = model.predict(fast[120:], verbose=0).argmax(axis=1)
+    assert (reference_top == labels[120:]).mean() >= 0.9
+    assert (fast_top == reference_top).mean() >= 0.95
+    assert (fast_top == labels[120:]).mean() >= (reference_top == labels[120:]).mean() - 0.05
@@ -0,0 +1,47 @@
+import time
+
+from src.services.spell_suggester import SpellSuggester, edit_distance
+
+WORDS = {"hello": 10.0, "help": 5.0, "held": 1.0, "world": 3.0, "word": 8.0}
+
+def wait_for(suggester, word, limit, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        suggestions = suggester.suggest_async(word, limit)
+        if suggestions is not None:
+            return suggestions
+        time.sleep(0.01)
+    return None
+
+def test_edit_distance_counts_transpositions_and_stops_early():
+    assert edit_distance("hello", "hello", 2) == 0
+    assert edit_distance("hlelo", "hello", 2) == 1
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+def test_lookup_ranks_by_distance_then_frequency():
+    suggester = SpellSuggester(WORDS)
+    assert suggester.lookup("helo", 3) == ["hello", "help", "held"]
+    assert suggester.lookup("WROLD", 2) == ["WORLD", "WORD"]
+    assert suggester.lookup("zzzzzz") == []
+
+def test_lazy_index_is_built_on_first_lookup():
+    suggester = SpellSuggester(WORDS, lazy=True)
+    assert suggester.stats["deletion_keys"] == 0
+    
+    assert suggester.suggest("wrd", 1) == ["word"]
+    assert suggester.stats["deletion_keys"] > 0
+
+def test_async_suggestions_are_served_from_cache():
+    suggester = SpellSuggester(WORDS, lazy=True, cache_size=2)
+    try:
+        assert suggester.suggest_async("helo", 2) is None
+        assert wait_for(suggester, "helo", 2) == ["hello", "help"]
+        
+        for word in ("wrd", "helo", "wordl"):
+            suggester.suggest(word, 2)
+        stats = suggester.stats
+        assert stats["cache_entries"] == 2
+        assert stats["cache_hits"] >= 1
+        assert suggester.cached("wrd", 2) is None
+    finally:
+        suggester.stop()
@@ -0,0 +1,66 @@
+import json
+import threading
+
+from src.services.letter_stabilizer import LetterStabilizer
+from src.services.session_store import RecognitionSession
+from src.services.text_events import TextEventStream
+
+def parse(chunk):
+    """Split an SSE message into its id and JSON data."""
+    fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+    return int(fields["id"]), json.loads(fields["data"])
+
+def test_new_client_gets_a_snapshot_then_only_changed_fields():
+    events = TextEventStream(heartbeat_interval=1.0)
+    session = RecognitionSession("a", LetterStabilizer())
+    session.append_suggestion("HELLO")
+    stream = events.stream(session)
+    
+    assert next(stream) == "retry: 1000\n\n"
+    version, snapshot = parse(next(stream))
+    assert snapshot == {"version": version, "sentence": "HELLO", "letter": "", "recs": []}
+    assert session.open_streams == 1
+    
+    session.add_space()
+    version, delta = parse(next(stream))
+    assert delta == {"version": version, "sentence": "HELLO "}
+    
+    stream.close()
+    assert session.open_streams == 0
+    assert events.stats["active_connections"] == 0
+
+def test_up_to_date_client_skips_the_snapshot():
+    events = TextEventStream(heartbeat_interval=0.05)
+    session = RecognitionSession("a", LetterStabilizer())
+    session.add_space()
+    session.append_suggestion("HI")
+    stream = events.stream(session, last_version=session.snapshot()["version"])
+    
+    next(stream)
+    # Nothing changed: a keepalive comment rather than a resync
+    assert next(stream) == ": keepalive\n\n"
+    assert events.stats["resyncs"] == 0
+    stream.close()
+
+def test_stale_version_is_resynced():
+    events = TextEventStream()
+    session = RecognitionSession("a", LetterStabilizer())
+    session.append_suggestion("HI")
+    stream = events.stream(session, last_version=99)
+    
+    next(stream)
+    version, snapshot = parse(next(stream))
+    assert version == session.snapshot()["version"] and snapshot["sentence"] == "HI"
+    assert events.stats["resyncs"] == 1
+    stream.close()
+
+def test_waiting_stream_wakes_on_a_change_from_another_thread():
+    events = TextEventStream(heartbeat_interval=5.0)
+    session = RecognitionSession("a", LetterStabilizer())
+    stream = events.stream(session, last_version=session.snapshot()["version"])
+    next(stream)
+    
+    threading.Timer(0.05, session.append_suggestion, args=("YES",)).start()
+    _, delta = parse(next(stream))
+    assert delta["sentence"] == "YES"
+    stream.close()
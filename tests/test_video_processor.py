@@ -0,0 +1,38 @@
+import time
+
+import cv2
+
+from src.services.video_processor import VideoProcessor
+
+class UnpluggedCamera:
+    """A capture device that opened but returns no frames."""
+    
+    def __init__(self, index):
+        self.reads = 0
+    
+    def isOpened(self):
+        return True
+    
+    def set(self, prop, value):
+        return True
+    
+    def read(self, image=None):
+        self.reads += 1
+        return False, None
+    
+    def release(self):
+        pass
+
+def test_failed_reads_back_off(monkeypatch):
+    monkeypatch.setattr(cv2, "VideoCapture", UnpluggedCamera)
+    processor = VideoProcessor(threaded_capture=False)
+    processor.max_retry_delay = 0.05
+    
+    started = time.perf_counter()
+    for _ in range(6):
+        assert processor.get_frame() == (False, None)
+    elapsed = time.perf_counter() - started
+    
+    # 10 + 20 + 40 + 50 + 50 + 50 ms instead of returning immediately
+    assert elapsed >= 0.2
+    assert processor.capture_failures == 6
@@ -0,0 +1,56 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from src.services.vote_counter import SlidingVoteCounter
+
+def reference_weights(votes, decay):
+    """Decayed weight per label, recomputed from the whole window."""
+    weights = {}
+    for age, (label, weight) in enumerate(reversed(votes)):
+        weights[label] = weights.get(label, 0.0) + weight * decay ** age
+    return weights
+
+@pytest.mark.parametrize("window, decay", [(6, 1.0), (15, 1.0), (8, 0.8), (12, 0.5)])
+def test_tally_matches_recount_of_the_window(window, decay):
+    rng = np.random.default_rng(window)
+    counter = SlidingVoteCounter(window, decay=decay)
+    votes = deque(maxlen=window)
+    
+    # Long enough for the decayed scale to be rescaled several times
+    for step in range(3000):
+        label = "ABCD"[min(3, int(rng.exponential(1.0)))]
+        weight = float(rng.uniform(0.2, 1.0))
+        counter.append(label, weight)
+        votes.append((label, weight))
+        
+        expected = reference_weights(votes, decay)
+        best = sorted(expected.values(), reverse=True)
+        assert counter.count(counter.leader) == pytest.approx(best[0], rel=1e-6), step
+        runner_up = best[1] if len(best) > 1 else 0.0
+        assert counter.margin == pytest.approx(best[0] - runner_up, rel=1e-6, abs=1e-9), step
+        assert counter.total == pytest.approx(sum(best), rel=1e-6), step
+        assert len(counter) == len(votes)
+
+def test_tie_keeps_the_current_leader():
+    counter = SlidingVoteCounter(4)
+    for label in "AABB":
+        counter.append(label)
+    assert counter.leader == "A"
+    assert counter.margin == 0.0
+    assert counter.share == 0.5
+    
+    counter.append("B")
+    assert counter.leader == "B"
+
+def test_clear_and_invalid_settings():
+    counter = SlidingVoteCounter(3)
+    counter.append("A")
+    counter.clear()
+    assert counter.leader is None and counter.total == 0.0 and len(counter) == 0
+    
+    with pytest.raises(ValueError):
+        SlidingVoteCounter(0)
+    with pytest.raises(ValueError):
+        SlidingVoteCounter(3, decay=1.5)
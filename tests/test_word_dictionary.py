@@ -0,0 +1,51 @@
+import numpy as np
+
+from src.models.word_dictionary import WORD_DICT, PrefixIndex, WordRecommender
+
+def linear_top_k(entries, weights, prefix, k):
+    """The scan PrefixIndex replaces: matches by weight, then list order."""
+    best = {}
+    for position, (entry, weight) in enumerate(zip(entries, weights)):
+        if entry.startswith(prefix) and entry != prefix:
+            seen = best.get(entry)
+            best[entry] = (min(seen[0], -weight), seen[1]) if seen else (-weight, position)
+    return sorted(best, key=best.get)[:k]
+
+def test_unweighted_results_keep_list_order():
+    index = PrefixIndex(WORD_DICT)
+    for prefix in ["H", "HE", "T", "I NEED", "S", "Q"]:
+        expected = [word for word in WORD_DICT if word.startswith(prefix) and word != prefix][:5]
+        assert index.top_k(prefix, 5) == expected
+
+def test_weighted_top_k_matches_linear_scan():
+    rng = np.random.default_rng(0)
+    letters = np.array(list("ABCDE"))
+    entries = ["".join(rng.choice(letters, rng.integers(1, 5))) for _ in range(400)]
+    weights = rng.integers(1, 20, len(entries)).astype(float)
+    index = PrefixIndex(entries, weights)
+    
+    for prefix in ["", "A", "AB", "C", "EED", "DA"]:
+        for k in (1, 3, 10):
+            assert index.top_k(prefix, k) == linear_top_k(entries, weights, prefix, k), (prefix, k)
+
+def test_prefix_range_and_exact_match():
+    index = PrefixIndex(["CAR", "CART", "CAT", "DOG"])
+    lo, hi = index.prefix_range("CA")
+    assert index.entries[lo:hi] == ["CAR", "CART", "CAT"]
+    assert index.top_k("CAR", 5) == ["CART"]
+    assert index.top_k("CAR", 5, exclude_exact=False) == ["CAR", "CART"]
+    assert index.top_k("X", 5) == []
+
+def test_duplicate_merge_leaves_caller_weights_alone():
+    weights = np.array([1.0, 5.0, 2.0])
+    index = PrefixIndex(["cat", "CAT", "car"], weights)
+    
+    assert weights.tolist() == [1.0, 5.0, 2.0]
+    assert len(index) == 2
+    assert index.top_k("CA", 2) == ["CAT", "CAR"]
+
+def test_recommender_completes_words_and_phrases():
+    recommender = WordRecommender(limit=3)
+    assert recommender.get_recommendations("") == []
+    assert recommender.get_recommendations("hel")[:2] == ["HELLO", "HELP"]
+    assert "HELP" in recommender.get_recommendations("H", ["I", "NEED"])
@@ -0,0 +1,55 @@
+import queue
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cvzone")
+
+from src.services.worker_pool import RecognitionWorkerPool
+
+def wait_for_result(pool, results, stream_id, timeout):
+    """Submit blank frames until one comes back; returns the elapsed seconds or None."""
+    started = time.time()
+    seq = 0
+    while time.time() - started < timeout:
+        seq += 1
+        pool.submit(stream_id, np.zeros((120, 160, 3), np.uint8), seq)
+        try:
+            results.get(timeout=0.5)
+            return time.time() - started
+        except queue.Empty:
+            continue
+    return None
+
+def test_frames_complete_after_worker_is_killed(tiny_model_path, monkeypatch):
+    # Spawned workers read the model path from the environment
+    monkeypatch.setenv("MODEL_PATH", str(tiny_model_path))
+    monkeypatch.setenv("RECOGNIZER", "cnn")
+    monkeypatch.setenv("HAND_TRACKING", "False")
+    
+    pool = RecognitionWorkerPool(num_workers=1, max_frame_shape=(120, 160, 3), slots_per_worker=3)
+    results = queue.Queue()
+    pool.add_handler("camera", lambda stream_id, event, frame: results.put(event["seq"]))
+    pool.start()
+    try:
+        assert wait_for_result(pool, results, "camera", timeout=60) is not None
+        
+        # An idle worker is blocked reading its task queue when it dies
+        time.sleep(0.5)
+        pool._processes[0].kill()
+        pool._processes[0].join()
+        
+        deadline = time.time() + 30
+        while pool.stats["worker_restarts"] == 0 and time.time() < deadline:
+            time.sleep(0.1)
+        assert pool.stats["worker_restarts"] == 1
+        
+        assert wait_for_result(pool, results, "camera", timeout=60) is not None
+        deadline = time.time() + 10
+        while pool.stats["workers"][0]["in_flight"] and time.time() < deadline:
+            time.sleep(0.1)
+        assert pool.stats["workers"][0]["in_flight"] == 0
+    
+    finally:
+        pool.stop()